@@ -12,10 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import atexit
 import logging
 from typing import Any, Literal, Type, TYPE_CHECKING, TypeVar, Generic, cast
 
-from agently.utils import Settings, create_logger
+from agently.utils import Settings, FunctionShifter, HTTPClientPool, MCPSessionPool, RetryBudget, create_logger
 from agently.core import PluginManager, EventCenter, Tool, Prompt, ModelRequest, BaseAgent
 from agently._default_init import _load_default_settings, _load_default_plugins, _hook_default_event_handlers
 
@@ -38,6 +39,14 @@ _hook_default_event_handlers(event_center)
 async_emit_runtime = event_center.async_emit
 emit_runtime = event_center.emit
 logger = create_logger()
+# Registered first so it runs last, after the pools below scheduled their closing onto its loops
+atexit.register(FunctionShifter.loop_runner.shutdown)
+http_client_pool = HTTPClientPool()
+atexit.register(http_client_pool.close)
+mcp_session_pool = MCPSessionPool()
+atexit.register(mcp_session_pool.close)
+retry_budget = RetryBudget()
+atexit.register(event_center.disable_dispatcher)
 httpx_level_name = settings.get("runtime.httpx_log_level", "WARNING")
 httpx_level = getattr(logging, str(httpx_level_name).upper(), logging.WARNING)
 logging.getLogger("httpx").setLevel(httpx_level)
@@ -126,6 +135,10 @@ class AgentlyMain(Generic[A]):
         self.emit_runtime = emit_runtime
         self.async_emit_runtime = async_emit_runtime
         self.logger = logger
+        self.http_client_pool = http_client_pool
+        self.mcp_session_pool = mcp_session_pool
+        self.retry_budget = retry_budget
+        self.loop_runner = FunctionShifter.loop_runner
         self.print = print_
         self.async_print = async_print
         self.tool = tool
@@ -137,6 +150,20 @@ class AgentlyMain(Generic[A]):
             logging.getLogger("httpx").setLevel(level)
             logging.getLogger("httpcore").setLevel(level)
 
+        def refresh_event_dispatcher():
+            dispatcher_settings = self.settings.get("runtime.event_dispatcher", {})
+            if not isinstance(dispatcher_settings, dict) or not dispatcher_settings.get("enabled"):
+                if self.event_center.dispatcher is not None:
+                    self.event_center.disable_dispatcher()
+                return
+            self.event_center.enable_dispatcher(
+                capacity=int(dispatcher_settings.get("capacity", 10000)),
+                batch_size=int(dispatcher_settings.get("batch_size", 256)),
+                overflow_policy=dispatcher_settings.get("overflow_policy", "drop_oldest_debug"),
+                sample_rate=int(dispatcher_settings.get("sample_rate", 10)),
+                block_timeout=dispatcher_settings.get("block_timeout", None),
+            )
+
         def set_settings(
             key: str,
             value: "SerializableValue",
@@ -147,6 +174,8 @@ class AgentlyMain(Generic[A]):
             self.settings.set_settings(key, value, auto_load_env=auto_load_env, raise_empty=raise_empty)
             if key in ("runtime.httpx_log_level", "debug"):
                 refresh_httpx_log_level()
+            if key == "runtime" or key.startswith("runtime.event_dispatcher"):
+                refresh_event_dispatcher()
             return self
 
         def load_settings(
@@ -158,6 +187,7 @@ class AgentlyMain(Generic[A]):
         ):
             self.settings.load(data_type, value, auto_load_env=auto_load_env, raise_empty=raise_empty)
             refresh_httpx_log_level()
+            refresh_event_dispatcher()
             return self
 
         self.set_settings = set_settings
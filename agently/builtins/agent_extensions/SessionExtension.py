@@ -24,7 +24,7 @@ if TYPE_CHECKING:
     from agently.core.ModelRequest import ModelResponseResult
     from agently.types.data import ChatMessage, ChatMessageDict
     from agently.utils import Settings
-    from agently.types.plugins import SessionAnalysisHandler, SessionResizeHandler
+    from agently.types.plugins import SessionAnalysisHandler, SessionLengthHandler, SessionResizeHandler
 
 
 class SessionExtension(BaseAgent):
@@ -37,6 +37,7 @@ class SessionExtension(BaseAgent):
 
         self.__session_analysis_handler: "SessionAnalysisHandler | None" = None
         self.__session_resize_handlers: dict[str, "SessionResizeHandler"] = {}
+        self.__session_length_handler: "SessionLengthHandler | None" = None
 
         self.extension_handlers.append("request_prefixes", self._session_request_prefix)
         self.extension_handlers.append("finally", self._session_finally)
@@ -67,8 +68,23 @@ class SessionExtension(BaseAgent):
             session.register_resize_handler(strategy_name, handler)
         return self
 
+    def register_session_length_handler(self, handler: "SessionLengthHandler"):
+        """
+        Register how message lengths are measured against `session.max_length`, e.g. a
+        `TokenCounter` to count tokens instead of characters.
+
+        Signature:
+            `(message) -> int`.
+        """
+        self.__session_length_handler = handler
+        for session in self.sessions.values():
+            session.register_length_handler(handler)
+        return self
+
     def __bind_session_resize_pipeline(self, session: Session):
         session.register_analysis_handler(self.__session_analysis_handler)
+        if self.__session_length_handler is not None:
+            session.register_length_handler(self.__session_length_handler)
         for strategy_name, handler in self.__session_resize_handlers.items():
             session.register_resize_handler(strategy_name, handler)
 
@@ -12,36 +12,186 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import TYPE_CHECKING
+import threading
+from collections import deque
+from itertools import islice
+from typing import TYPE_CHECKING, Iterable
 
 from agently.types.plugins import EventHooker
 
 if TYPE_CHECKING:
-    from agently.types.data import RuntimeEvent
+    from agently.types.data import RuntimeEvent, RuntimeEventLevel
+
+
+def _compile_event_type_filter(event_types: str | Iterable[str] | None):
+    """Split event type patterns into exact names and `prefix*` wildcards."""
+    if event_types is None:
+        return None
+    if isinstance(event_types, str):
+        event_types = [event_types]
+    exact: set[str] = set()
+    prefixes: list[str] = []
+    for event_type in event_types:
+        if event_type.endswith("*"):
+            prefixes.append(event_type[:-1])
+        else:
+            exact.add(event_type)
+    return frozenset(exact), tuple(prefixes)
+
+
+def _match_event_type(event_type: str, compiled: tuple[frozenset[str], tuple[str, ...]] | None):
+    if compiled is None:
+        return True
+    exact, prefixes = compiled
+    return event_type in exact or event_type.startswith(prefixes)
+
 
 class RuntimeChannelSinkHooker(EventHooker):
+    """
+    Keeps recent runtime events in a bounded in-memory ring buffer.
+
+    Every stored event gets a monotonically increasing sequence number. Readers keep
+    their own cursor and call `read_since(cursor)`, so any number of readers can follow
+    the channel without draining each other's view. When the buffer is full the oldest
+    events are overwritten.
+
+    Events are stored by reference. `RuntimeEvent` is frozen, and hooks must treat
+    payloads as read-only.
+    """
+
     name = "RuntimeChannelSinkHooker"
     event_types = None
-    _buffer: list["RuntimeEvent"] = []
+
+    _capacity: int = 1000
+    _buffer: "deque[tuple[int, RuntimeEvent]]" = deque(maxlen=1000)
+    _next_sequence: int = 0
+    _dropped: int = 0
+    _event_type_filter: tuple[frozenset[str], tuple[str, ...]] | None = None
+    _lock = threading.Lock()
 
     @staticmethod
     def _on_register():
-        RuntimeChannelSinkHooker._buffer.clear()
+        RuntimeChannelSinkHooker.clear()
 
     @staticmethod
     def _on_unregister():
-        RuntimeChannelSinkHooker._buffer.clear()
+        RuntimeChannelSinkHooker.clear()
+
+    @staticmethod
+    def configure(
+        *,
+        capacity: int | None = None,
+        event_types: str | Iterable[str] | None = None,
+    ):
+        """
+        Configure the channel.
+
+        Args:
+            capacity (int | None): Max retained events, the most recent events are kept when shrinking.
+            event_types (str | Iterable[str] | None): Only store these event types, `"model.*"` style
+                prefixes are supported. Store everything if None.
+        """
+        cls = RuntimeChannelSinkHooker
+        with cls._lock:
+            if capacity is not None:
+                if capacity < 1:
+                    raise ValueError(f"Runtime channel capacity must be at least 1, got { capacity }.")
+                if capacity != cls._capacity:
+                    cls._dropped += max(0, len(cls._buffer) - capacity)
+                    cls._buffer = deque(cls._buffer, maxlen=capacity)
+                    cls._capacity = capacity
+            cls._event_type_filter = _compile_event_type_filter(event_types)
+
+    @staticmethod
+    def clear():
+        cls = RuntimeChannelSinkHooker
+        with cls._lock:
+            cls._buffer.clear()
+            cls._dropped = 0
+
+    @staticmethod
+    def get_cursor() -> int:
+        """Cursor pointing right after the latest stored event, for readers that only want new events."""
+        return RuntimeChannelSinkHooker._next_sequence
+
+    @staticmethod
+    def read_since(
+        cursor: int = 0,
+        *,
+        event_types: str | Iterable[str] | None = None,
+        limit: int | None = None,
+    ) -> "tuple[list[RuntimeEvent], int]":
+        """
+        Read events stored at or after `cursor` without removing them.
+
+        Args:
+            cursor (int): Cursor returned by the previous call, `0` to read everything still retained.
+            event_types (str | Iterable[str] | None): Only return these event types, prefixes like `"model.*"`
+                are supported.
+            limit (int | None): Max events to return.
+
+        Returns:
+            `(events, next_cursor)`. If `cursor` is older than `get_stats()["oldest_cursor"]`, the
+            events overwritten in between are skipped.
+        """
+        compiled = _compile_event_type_filter(event_types)
+        cls = RuntimeChannelSinkHooker
+        with cls._lock:
+            buffer = cls._buffer
+            next_cursor = cls._next_sequence
+            if not buffer or cursor >= next_cursor:
+                return [], next_cursor
+            first_sequence = buffer[0][0]
+            start = max(0, cursor - first_sequence)
+            # Iterate from whichever end of the ring is closer to the cursor.
+            if start > len(buffer) // 2:
+                entries = list(islice(reversed(buffer), len(buffer) - start))
+                entries.reverse()
+            else:
+                entries = list(islice(buffer, start, None))
+        events: list["RuntimeEvent"] = []
+        for sequence, event in entries:
+            if not _match_event_type(event.event_type, compiled):
+                continue
+            events.append(event)
+            if limit is not None and len(events) >= limit:
+                return events, sequence + 1
+        return events, next_cursor
 
     @staticmethod
     def read_buffer():
-        return list(RuntimeChannelSinkHooker._buffer)
+        with RuntimeChannelSinkHooker._lock:
+            return [event for _, event in RuntimeChannelSinkHooker._buffer]
 
     @staticmethod
     def drain_buffer():
-        buffered = list(RuntimeChannelSinkHooker._buffer)
-        RuntimeChannelSinkHooker._buffer.clear()
-        return buffered
+        """Return and remove every retained event. This empties the channel for every reader."""
+        with RuntimeChannelSinkHooker._lock:
+            buffered = [event for _, event in RuntimeChannelSinkHooker._buffer]
+            RuntimeChannelSinkHooker._buffer.clear()
+            return buffered
+
+    @staticmethod
+    def get_stats():
+        cls = RuntimeChannelSinkHooker
+        with cls._lock:
+            return {
+                "capacity": cls._capacity,
+                "size": len(cls._buffer),
+                "dropped": cls._dropped,
+                "next_cursor": cls._next_sequence,
+                "oldest_cursor": cls._buffer[0][0] if cls._buffer else cls._next_sequence,
+            }
+
+    @staticmethod
+    def should_handle(event_type: str, level: "RuntimeEventLevel") -> bool:
+        return _match_event_type(event_type, RuntimeChannelSinkHooker._event_type_filter)
 
     @staticmethod
     async def handler(event: "RuntimeEvent"):
-        RuntimeChannelSinkHooker._buffer.append(event.model_copy(deep=True))
+        cls = RuntimeChannelSinkHooker
+        with cls._lock:
+            if len(cls._buffer) == cls._capacity:
+                cls._dropped += 1
+            cls._buffer.append((cls._next_sequence, event))
+            cls._next_sequence += 1
@@ -19,7 +19,7 @@ from agently.types.plugins import EventHooker
 from agently.utils import DataFormatter
 
 if TYPE_CHECKING:
-    from agently.types.data import RuntimeEvent
+    from agently.types.data import RuntimeEvent, RuntimeEventLevel
     from agently.utils import Settings
 
 
@@ -101,18 +101,22 @@ def _resolve_execution_id(event: "RuntimeEvent") -> str | None:
     return None
 
 
-def _should_render(event: "RuntimeEvent", settings: "Settings") -> bool:
-    if event.level in ("WARNING", "ERROR", "CRITICAL"):
+def _should_render_event_type(event_type: str, level: str, settings: "Settings") -> bool:
+    if level in ("WARNING", "ERROR", "CRITICAL"):
         return True
-    if event.event_type.startswith("model."):
+    if event_type.startswith("model."):
         return bool(settings.get("runtime.show_model_logs", False))
-    if event.event_type.startswith("tool."):
+    if event_type.startswith("tool."):
         return bool(settings.get("runtime.show_tool_logs", False))
-    if event.event_type.startswith("workflow.") or event.event_type.startswith("trigger_flow."):
+    if event_type.startswith("workflow.") or event_type.startswith("trigger_flow."):
         return bool(settings.get("runtime.show_trigger_flow_logs", False))
     return False
 
 
+def _should_render(event: "RuntimeEvent", settings: "Settings") -> bool:
+    return _should_render_event_type(event.event_type, event.level, settings)
+
+
 def _render_block(header: str, stage: str, detail: str, *, detail_color: str = "gray", end: str = "\n"):
     header_text = color_text(header, color="blue", bold=True)
     stage_label = color_text("Stage:", color="cyan", bold=True)
@@ -142,6 +146,12 @@ class RuntimeConsoleSinkHooker(EventHooker):
     def _on_unregister():
         RuntimeConsoleSinkHooker._streaming_key = None
 
+    @staticmethod
+    def should_handle(event_type: str, level: "RuntimeEventLevel") -> bool:
+        from agently.base import settings
+
+        return _should_render_event_type(event_type, level, settings)
+
     @staticmethod
     def _close_stream_if_needed():
         if RuntimeConsoleSinkHooker._streaming_key is not None:
@@ -188,7 +198,10 @@ class RuntimeConsoleSinkHooker(EventHooker):
         elif event.event_type == "model.retrying":
             response_text = _payload_value(event, "response_text")
             retry_count = _payload_value(event, "retry_count")
-            detail = f"[Response]: { response_text }\n[Retried Times]: { retry_count }"
+            if _payload_value(event, "stage") == "request":
+                detail = f"{ event.message }\n[Retried Times]: { retry_count }"
+            else:
+                detail = f"[Response]: { response_text }\n[Retried Times]: { retry_count }"
         elif event.error is not None:
             detail = event.error.message
         if not detail:
@@ -13,13 +13,14 @@
 # limitations under the License.
 
 import json
+import logging
 from typing import TYPE_CHECKING, Any
 
 from agently.types.plugins import EventHooker
 from agently.utils import DataFormatter
 
 if TYPE_CHECKING:
-    from agently.types.data import RuntimeEvent
+    from agently.types.data import RuntimeEvent, RuntimeEventLevel
 
 
 def _stringify_payload(payload: Any) -> str:
@@ -35,6 +36,7 @@ def _stringify_payload(payload: Any) -> str:
 class RuntimeStorageSinkHooker(EventHooker):
     name = "RuntimeStorageSinkHooker"
     event_types = None
+    lazy_payload = True
 
     @staticmethod
     def _on_register():
@@ -44,6 +46,12 @@ class RuntimeStorageSinkHooker(EventHooker):
     def _on_unregister():
         pass
 
+    @staticmethod
+    def should_handle(event_type: str, level: "RuntimeEventLevel") -> bool:
+        from agently.base import logger
+
+        return logger.isEnabledFor(logging.getLevelName(level))
+
     @staticmethod
     async def handler(event: "RuntimeEvent"):
         from agently.base import logger
@@ -64,6 +72,6 @@ class RuntimeStorageSinkHooker(EventHooker):
         if content is None and event.error is not None:
             content = event.error.message
         if content is None:
-            content = _stringify_payload(event.payload)
+            content = _stringify_payload(event.get_payload())
         run_label = f" [run={ event.run.run_id }]" if event.run is not None else ""
         log(f"[{ event.source }] [{ event.event_type }]{ run_label } { content or '' }".rstrip())
@@ -15,8 +15,12 @@
 import time
 import yaml
 import json
+import asyncio
+from contextlib import asynccontextmanager
 from typing import (
     Any,
+    Callable,
+    Mapping,
     Literal,
     AsyncGenerator,
     TYPE_CHECKING,
@@ -24,9 +28,13 @@ from typing import (
 )
 from typing_extensions import TypedDict
 
-from httpx import AsyncClient, ReadError, HTTPStatusError, RequestError, Timeout
-from httpx_sse import aconnect_sse, SSEError
-from stamina import retry
+from httpx import AsyncClient, HTTPStatusError, RequestError, Response, Timeout, Limits, TransportError
+from httpx_sse import aconnect_sse, SSEError, ServerSentEvent
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from agently.types.plugins import ModelRequester
 from agently.types.data import AgentlyRequestData, SerializableValue
@@ -34,6 +42,7 @@ from agently.utils import (
     SettingsNamespace,
     DataFormatter,
     DataLocator,
+    RequestRetryPolicy,
 )
 
 if TYPE_CHECKING:
@@ -55,16 +64,115 @@ class ContentMapping(TypedDict):
     extra_done: dict[str, str] | None
 
 
+def _loads_message(message: str):
+    if orjson is not None:
+        try:
+            return orjson.loads(message)
+        except orjson.JSONDecodeError:
+            # orjson rejects some input `json` accepts, such as NaN and lone surrogates.
+            pass
+    return json.loads(message)
+
+
+_STANDARD_DELTA_PATH = "choices[0].delta"
+_locate_standard_delta = DataLocator.compile_path(_STANDARD_DELTA_PATH)
+
+# (locator, reads from `choices[0].delta` instead of the whole chunk)
+_FieldLocator = tuple[Callable[[Any], Any], bool]
+
+
+class _CompiledContentMapping:
+    """
+    `content_mapping` parsed into path locators once per requester instead of
+    once per streaming chunk.
+
+    Per-chunk fields mapped to a direct child of `choices[0].delta` (the OpenAI
+    chunk shape) read from the delta object located once per chunk.
+    """
+
+    def __init__(self, content_mapping: ContentMapping, style: Literal["dot", "slash"], model_type: str):
+        self.style: Literal["dot", "slash"] = style
+        self.reads_standard_delta = False
+        self.id = self._compile_delta_field(content_mapping["id"])
+        self.role = self._compile_delta_field(content_mapping["role"], default="assistant")
+        self.reasoning = self._compile_delta_field(content_mapping["reasoning"])
+        self.delta = self._compile_delta_field(content_mapping["delta"])
+        self.tool_calls = self._compile_delta_field(content_mapping["tool_calls"])
+        self.extra_delta = [
+            (extra_key, locator)
+            for extra_key, extra_path in (content_mapping["extra_delta"] or {}).items()
+            if (locator := self._compile_delta_field(extra_path)) is not None
+        ]
+
+        done_mapping = content_mapping["done"]
+        if model_type == "embeddings" and done_mapping is None:
+            self.done = DataLocator.compile_path("data", "dot")
+        else:
+            self.done = self._compile(done_mapping)
+        self.reasoning_done = self._compile(content_mapping["reasoning"])
+        self.usage = self._compile(content_mapping["usage"])
+        self.finish_reason = self._compile(content_mapping["finish_reason"])
+        self.extra_done = [
+            (extra_key, locator)
+            for extra_key, extra_path in (content_mapping["extra_done"] or {}).items()
+            if (locator := self._compile(extra_path)) is not None
+        ]
+
+    def _compile(self, path: str | None, *, default: Any = None):
+        if not path:
+            return None
+        return DataLocator.compile_path(path, self.style, default=default)
+
+    def _compile_delta_field(self, path: str | None, *, default: Any = None) -> _FieldLocator | None:
+        if not path:
+            return None
+        if self.style == "dot" and path.startswith(_STANDARD_DELTA_PATH + "."):
+            key = path[len(_STANDARD_DELTA_PATH) + 1 :]
+            if key and "." not in key and "[" not in key:
+                self.reads_standard_delta = True
+
+                def locate_in_delta(delta: Any):
+                    return delta.get(key, default) if isinstance(delta, Mapping) else default
+
+                return locate_in_delta, True
+        return DataLocator.compile_path(path, self.style, default=default), False
+
+
 class ModelSettingsMapping(TypedDict):
     chat: str
     completions: str
     embeddings: str
 
 
+class ClientPoolSettings(TypedDict, total=False):
+    enabled: bool
+    max_connections: int | None
+    max_keepalive_connections: int | None
+    keepalive_expiry: float | None
+
+
+class RetryBudgetSettings(TypedDict, total=False):
+    max_retries: int | None
+    window: float
+
+
+class RetrySettings(TypedDict, total=False):
+    enabled: bool
+    max_attempts: int
+    initial_delay: float
+    max_delay: float
+    backoff_multiplier: float
+    jitter: float
+    retry_on_status: list[int]
+    budget: RetryBudgetSettings
+
+
 class ModelRequesterSettings(TypedDict, total=False):
     model: str
     model_type: Literal["chat", "completions", "embeddings"]
     client_options: dict[str, "SerializableValue"]
+    client_pool: ClientPoolSettings
+    retry: RetrySettings
     headers: dict[str, "SerializableValue"]
     proxy: str
     request_options: dict[str, "SerializableValue"]
@@ -98,6 +206,25 @@ class OpenAICompatible(ModelRequester):
             "embeddings": "text-embedding-ada-002",
         },
         "client_options": {},
+        "client_pool": {
+            "enabled": True,
+            "max_connections": 100,
+            "max_keepalive_connections": 20,
+            "keepalive_expiry": 30.0,
+        },
+        "retry": {
+            "enabled": True,
+            "max_attempts": 3,
+            "initial_delay": 0.5,
+            "max_delay": 30.0,
+            "backoff_multiplier": 2.0,
+            "jitter": 0.2,
+            "retry_on_status": [408, 429, 500, 502, 503, 504],
+            "budget": {
+                "max_retries": 30,
+                "window": 60.0,
+            },
+        },
         "headers": {},
         "proxy": None,
         "request_options": {},
@@ -148,6 +275,7 @@ class OpenAICompatible(ModelRequester):
         self.plugin_settings = SettingsNamespace(self.settings, f"plugins.ModelRequester.{ self.name }")
         self.model_type = cast(str, self.plugin_settings.get("model_type"))
         self._emitter = event_center.create_emitter(self.name)
+        self._compiled_content_mapping: _CompiledContentMapping | None = None
 
         # check if has attachment prompt
         if self.prompt["attachment"]:
@@ -225,7 +353,7 @@ class OpenAICompatible(ModelRequester):
             value_format="str",
             default_value={},
         )
-        headers.update({"Connection": "close"})
+        headers.update({"Connection": "keep-alive" if self._use_client_pool() else "close"})
         ## set
         agently_request_dict["headers"] = headers
 
@@ -250,6 +378,21 @@ class OpenAICompatible(ModelRequester):
         )
         timeout = Timeout(**timeout_configs)
         client_options.update({"timeout": timeout})
+        ## connection limits
+        if self._use_client_pool() and "limits" not in client_options:
+            client_pool_settings = DataFormatter.to_str_key_dict(
+                self.plugin_settings.get("client_pool"),
+                default_value={},
+            )
+            client_options.update(
+                {
+                    "limits": Limits(
+                        max_connections=client_pool_settings.get("max_connections", 100),
+                        max_keepalive_connections=client_pool_settings.get("max_keepalive_connections", 20),
+                        keepalive_expiry=client_pool_settings.get("keepalive_expiry", 30.0),
+                    )
+                }
+            )
         ## set
         agently_request_dict["client_options"] = client_options
 
@@ -321,6 +464,103 @@ class OpenAICompatible(ModelRequester):
 
         return AgentlyRequestData(**agently_request_dict)
 
+    def _use_client_pool(self) -> bool:
+        return bool(self.plugin_settings.get("client_pool.enabled", True))
+
+    @asynccontextmanager
+    async def _client_context(self, request_data: "AgentlyRequestData"):
+        if self._use_client_pool():
+            from agently.base import http_client_pool
+
+            # Shared client: never close it here and never mutate its default headers.
+            yield http_client_pool.get_client(
+                request_data.client_options,
+                url=request_data.request_url,
+                client_factory=AsyncClient,
+            )
+        else:
+            async with AsyncClient(**request_data.client_options) as client:
+                yield client
+
+    def _get_retry_policy(self):
+        from agently.base import retry_budget
+
+        retry_settings = DataFormatter.to_str_key_dict(
+            self.plugin_settings.get("retry", {}),
+            value_format="serializable",
+            default_value={},
+        )
+        return RequestRetryPolicy.from_settings(retry_settings, budget=retry_budget)
+
+    async def _wait_before_retry(
+        self,
+        policy: RequestRetryPolicy,
+        url: str,
+        *,
+        attempt: int,
+        reason: str,
+        started_at: float,
+        response: Response | None = None,
+        error: Exception | None = None,
+        base_delay: float | None = None,
+        last_event_id: str = "",
+    ) -> bool:
+        """Sleep before the next attempt without blocking the event loop. Returns False if no retry is allowed."""
+        retry_after = None
+        if response is not None:
+            retry_after = policy.parse_retry_after(response.headers.get("Retry-After"))
+        delay = policy.get_delay(attempt, retry_after=retry_after, base_delay=base_delay)
+        if delay is None or not policy.allow_retry(attempt, url):
+            return False
+        status_code = response.status_code if response is not None else None
+        await self._emitter.async_warning(
+            f"Model request failed ({ status_code or error }), retrying in { delay:.2f}s.",
+            event_type="model.retrying",
+            payload={
+                "stage": "request",
+                "reason": reason,
+                "status_code": status_code,
+                "error": str(error) if error is not None else None,
+                "retry_count": attempt,
+                "max_attempts": policy.max_attempts,
+                "delay": delay,
+                "retry_after": retry_after,
+                "elapsed": time.monotonic() - started_at,
+                "request_url": url,
+                "last_event_id": last_event_id or None,
+            },
+        )
+        await asyncio.sleep(delay)
+        return True
+
+    async def _post_with_retry(
+        self,
+        client: AsyncClient,
+        url: str,
+        *,
+        headers: dict[str, Any],
+        json: "SerializableValue",
+    ) -> Response:
+        policy = self._get_retry_policy()
+        started_at = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = await client.post(url, json=json, headers=headers)
+            except TransportError as e:
+                if await self._wait_before_retry(
+                    policy, url, attempt=attempt, reason="connection", started_at=started_at, error=e
+                ):
+                    continue
+                raise
+            reason = policy.classify_status(response.status_code)
+            if reason is not None and await self._wait_before_retry(
+                policy, url, attempt=attempt, reason=reason, started_at=started_at, response=response
+            ):
+                continue
+            return response
+
     async def _aiter_sse_with_retry(
         self,
         client: AsyncClient,
@@ -329,29 +569,58 @@ class OpenAICompatible(ModelRequester):
         *,
         headers: dict[str, Any],
         json: "SerializableValue",
-    ):
+    ) -> AsyncGenerator[ServerSentEvent, None]:
+        policy = self._get_retry_policy()
+        started_at = time.monotonic()
         last_event_id = ""
-        reconnection_delay = 0.0
-
-        @retry(on=ReadError)
-        async def _aiter_sse():
-            nonlocal last_event_id, reconnection_delay
-            time.sleep(reconnection_delay)
-            headers.update({"Accept": "text/event-stream"})
+        reconnection_delay: float | None = None
+        has_received = False
+        attempt = 0
+        while True:
+            attempt += 1
+            request_headers = {**headers, "Accept": "text/event-stream"}
             if last_event_id:
-                headers.update({"Last-Event-ID": last_event_id})
-
-            async with aconnect_sse(client, method, url, headers=headers, json=json) as event_source:
-                try:
+                request_headers["Last-Event-ID"] = last_event_id
+            try:
+                async with aconnect_sse(client, method, url, headers=request_headers, json=json) as event_source:
+                    response = event_source.response
+                    reason = policy.classify_status(response.status_code)
+                    if reason is not None:
+                        if await self._wait_before_retry(
+                            policy, url, attempt=attempt, reason=reason, started_at=started_at, response=response
+                        ):
+                            continue
+                        await response.aread()
+                        raise HTTPStatusError(
+                            f"Status Code: { response.status_code }",
+                            request=response.request,
+                            response=response,
+                        )
                     async for sse in event_source.aiter_sse():
-                        last_event_id = sse.id
+                        has_received = True
+                        if sse.id:
+                            last_event_id = sse.id
                         if sse.retry is not None:
                             reconnection_delay = sse.retry / 1000
                         yield sse
-                except GeneratorExit:
-                    pass
-
-        return _aiter_sse()
+                    return
+            except TransportError as e:
+                # Without an event id to resume from, reconnecting after the first event would
+                # make the model generate the whole answer again.
+                if has_received and not last_event_id:
+                    raise
+                if await self._wait_before_retry(
+                    policy,
+                    url,
+                    attempt=attempt,
+                    reason="connection",
+                    started_at=started_at,
+                    error=e,
+                    base_delay=reconnection_delay,
+                    last_event_id=last_event_id,
+                ):
+                    continue
+                raise
 
     async def request_model(self, request_data: "AgentlyRequestData") -> AsyncGenerator[tuple[str, Any], None]:
         # auth
@@ -382,8 +651,7 @@ class OpenAICompatible(ModelRequester):
         # request
         # stream request
         if self.model_type in ("chat", "completions") and request_data.stream:
-            async with AsyncClient(**request_data.client_options) as client:
-                client.headers.update(headers_with_auth)
+            async with self._client_context(request_data) as client:
                 full_request_data = DataFormatter.to_str_key_dict(
                     request_data.data,
                     value_format="serializable",
@@ -392,7 +660,7 @@ class OpenAICompatible(ModelRequester):
                 full_request_data.update(request_data.request_options)
                 try:
                     has_done = False
-                    async for sse in await self._aiter_sse_with_retry(
+                    async for sse in self._aiter_sse_with_retry(
                         client, "POST", request_data.request_url, json=full_request_data, headers=headers_with_auth
                     ):
                         yield sse.event, sse.data
@@ -468,12 +736,9 @@ class OpenAICompatible(ModelRequester):
                         payload={"request_data": full_request_data},
                     )
                     yield "error", e
-                finally:
-                    await client.aclose()
         # normal request
         else:
-            async with AsyncClient(**request_data.client_options) as client:
-                client.headers.update(headers_with_auth)
+            async with self._client_context(request_data) as client:
                 full_request_data = DataFormatter.to_str_key_dict(
                     request_data.data,
                     value_format="serializable",
@@ -481,9 +746,11 @@ class OpenAICompatible(ModelRequester):
                 )
                 full_request_data.update(request_data.request_options)
                 try:
-                    response = await client.post(
+                    response = await self._post_with_retry(
+                        client,
                         request_data.request_url,
                         json=full_request_data,
+                        headers=headers_with_auth,
                     )
                     if response.status_code >= 400:
                         e = RequestError(
@@ -523,8 +790,25 @@ class OpenAICompatible(ModelRequester):
                         payload={"request_data": full_request_data},
                     )
                     yield "error", e
-                finally:
-                    await client.aclose()
+
+    def _get_compiled_content_mapping(self):
+        if self._compiled_content_mapping is None:
+            content_mapping = cast(
+                ContentMapping,
+                DataFormatter.to_str_key_dict(
+                    self.plugin_settings.get("content_mapping"),
+                    value_format="serializable",
+                ),
+            )
+            content_mapping_style = str(self.plugin_settings.get("content_mapping_style"))
+            if content_mapping_style not in ("dot", "slash"):
+                content_mapping_style = "dot"
+            self._compiled_content_mapping = _CompiledContentMapping(
+                content_mapping,
+                cast(Literal["dot", "slash"], content_mapping_style),
+                self.model_type,
+            )
+        return self._compiled_content_mapping
 
     async def broadcast_response(self, response_generator: AsyncGenerator) -> "AgentlyResponseGenerator":
         meta = {}
@@ -532,112 +816,63 @@ class OpenAICompatible(ModelRequester):
         reasoning_buffer = ""
         content_buffer = ""
 
-        content_mapping = cast(
-            ContentMapping,
-            DataFormatter.to_str_key_dict(
-                self.plugin_settings.get("content_mapping"),
-                value_format="serializable",
-            ),
-        )
-        id_mapping = content_mapping["id"]
-        role_mapping = content_mapping["role"]
-        reasoning_mapping = content_mapping["reasoning"]
-        delta_mapping = content_mapping["delta"]
-        tool_calls_mapping = content_mapping["tool_calls"]
-        done_mapping = content_mapping["done"]
-        usage_mapping = content_mapping["usage"]
-        finish_reason_mapping = content_mapping["finish_reason"]
-        extra_delta_mapping = content_mapping["extra_delta"]
-        extra_done_mapping = content_mapping["extra_done"]
+        mapping = self._get_compiled_content_mapping()
         yield_extra_content_separately = self.plugin_settings.get("yield_extra_content_separately", True)
 
-        content_mapping_style = str(self.plugin_settings.get("content_mapping_style"))
-        if content_mapping_style not in ("dot", "slash"):
-            content_mapping_style = "dot"
-
         async for event, message in response_generator:
             if event == "error":
                 yield "error", message
             elif message != "[DONE]":
                 yield "original_delta", message
-                loaded_message = json.loads(message)
-                message_record = loaded_message.copy()
-                if "id" not in meta and id_mapping:
-                    _id = DataLocator.locate_path_in_dict(
-                        loaded_message,
-                        id_mapping,
-                        style=content_mapping_style,
-                    )
+                # Only the last chunk is read again on "[DONE]" and nothing mutates it before that,
+                # so it is kept as is instead of being copied for every chunk.
+                loaded_message = _loads_message(message)
+                message_record = loaded_message
+                delta_object = _locate_standard_delta(loaded_message) if mapping.reads_standard_delta else None
+                if "id" not in meta and mapping.id:
+                    locate, from_delta = mapping.id
+                    _id = locate(delta_object if from_delta else loaded_message)
                     if _id:
                         meta.update({"id": _id})
-                if "role" not in meta and role_mapping:
-                    role = DataLocator.locate_path_in_dict(
-                        loaded_message,
-                        role_mapping,
-                        style=content_mapping_style,
-                        default="assistant",
-                    )
+                if "role" not in meta and mapping.role:
+                    locate, from_delta = mapping.role
+                    role = locate(delta_object if from_delta else loaded_message)
                     if role:
                         meta.update({"role": role})
-                if reasoning_mapping:
-                    reasoning = DataLocator.locate_path_in_dict(
-                        loaded_message,
-                        reasoning_mapping,
-                        style=content_mapping_style,
-                    )
+                if mapping.reasoning:
+                    locate, from_delta = mapping.reasoning
+                    reasoning = locate(delta_object if from_delta else loaded_message)
                     if reasoning:
                         reasoning_buffer += str(reasoning)
                         yield "reasoning_delta", reasoning
-                if delta_mapping:
-                    delta = DataLocator.locate_path_in_dict(
-                        loaded_message,
-                        delta_mapping,
-                        style=content_mapping_style,
-                    )
+                if mapping.delta:
+                    locate, from_delta = mapping.delta
+                    delta = locate(delta_object if from_delta else loaded_message)
                     if delta:
                         content_buffer += str(delta)
                         yield "delta", delta
-                if tool_calls_mapping:
-                    tool_calls = DataLocator.locate_path_in_dict(
-                        loaded_message,
-                        tool_calls_mapping,
-                        style=content_mapping_style,
-                    )
+                if mapping.tool_calls:
+                    locate, from_delta = mapping.tool_calls
+                    tool_calls = locate(delta_object if from_delta else loaded_message)
                     if tool_calls:
                         yield "tool_calls", tool_calls
-                if extra_delta_mapping:
-                    for extra_key, extra_path in extra_delta_mapping.items():
-                        extra_value = DataLocator.locate_path_in_dict(
-                            loaded_message,
-                            extra_path,
-                            style=content_mapping_style,
-                        )
-                        if extra_value:
-                            yield "extra", {extra_key: extra_value}
-                            if yield_extra_content_separately:
-                                yield extra_key, extra_value  # type: ignore
+                for extra_key, (locate, from_delta) in mapping.extra_delta:
+                    extra_value = locate(delta_object if from_delta else loaded_message)
+                    if extra_value:
+                        yield "extra", {extra_key: extra_value}
+                        if yield_extra_content_separately:
+                            yield extra_key, extra_value  # type: ignore
             else:
                 done_content = None
-                if self.model_type == "embeddings" and done_mapping is None:
-                    done_mapping = "data"
-                    content_mapping_style = "dot"
-                if done_mapping:
-                    done_content = DataLocator.locate_path_in_dict(
-                        message_record,
-                        done_mapping,
-                        style=content_mapping_style,
-                    )
+                if mapping.done:
+                    done_content = mapping.done(message_record)
                 if done_content:
                     yield "done", done_content
                 else:
                     yield "done", content_buffer
                 reasoning_content = None
-                if reasoning_mapping:
-                    reasoning_content = DataLocator.locate_path_in_dict(
-                        message_record,
-                        reasoning_mapping,
-                        style=content_mapping_style,
-                    )
+                if mapping.reasoning_done:
+                    reasoning_content = mapping.reasoning_done(message_record)
                 if reasoning_content:
                     yield "reasoning_done", reasoning_content
                 else:
@@ -656,33 +891,12 @@ class OpenAICompatible(ModelRequester):
                             }
                         )
                         yield "original_done", done_message
-                if finish_reason_mapping:
-                    meta.update(
-                        {
-                            "finish_reason": DataLocator.locate_path_in_dict(
-                                message_record,
-                                finish_reason_mapping,
-                                style=content_mapping_style,
-                            )
-                        }
-                    )
-                if usage_mapping:
-                    meta.update(
-                        {
-                            "usage": DataLocator.locate_path_in_dict(
-                                message_record,
-                                usage_mapping,
-                                style=content_mapping_style,
-                            )
-                        }
-                    )
+                if mapping.finish_reason:
+                    meta.update({"finish_reason": mapping.finish_reason(message_record)})
+                if mapping.usage:
+                    meta.update({"usage": mapping.usage(message_record)})
                 yield "meta", meta
-                if extra_done_mapping:
-                    for extra_key, extra_path in extra_done_mapping.items():
-                        extra_value = DataLocator.locate_path_in_dict(
-                            message_record,
-                            extra_path,
-                            style=content_mapping_style,
-                        )
-                        if extra_value:
-                            yield "extra", {extra_key: extra_value}
+                for extra_key, locate in mapping.extra_done:
+                    extra_value = locate(message_record)
+                    if extra_value:
+                        yield "extra", {extra_key: extra_value}
@@ -51,6 +51,15 @@ if TYPE_CHECKING:
     from agently.utils import Settings
 
 
+def _copy_rendered(value: Any) -> Any:
+    # Rendered prompts only contain dicts, lists and scalars, a structural copy is enough.
+    if isinstance(value, dict):
+        return {key: _copy_rendered(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_rendered(item) for item in value]
+    return value
+
+
 class AgentlyPromptGenerator(PromptGenerator):
     name = "AgentlyPromptGenerator"
 
@@ -100,6 +109,9 @@ class AgentlyPromptGenerator(PromptGenerator):
         self.settings = settings
         self.plugin_settings = SettingsNamespace(self.settings, f"plugins.PromptGenerator.{ self.name }")
         self._emitter = event_center.create_emitter(self.name)
+        # Rendering results for the current (prompt version, settings version)
+        self._render_cache: dict[Any, Any] = {}
+        self._render_cache_version: Any = None
 
     @staticmethod
     def _on_register():
@@ -333,16 +345,43 @@ class AgentlyPromptGenerator(PromptGenerator):
             ),
         }
 
-    def to_prompt_object(self) -> PromptModel:
-        prompt_object = PromptModel(**self.prompt)
+    def _get_render_cache(self) -> dict[Any, Any]:
+        version = (self.prompt.get_version(), self.settings.get_version())
+        if version != self._render_cache_version:
+            self._render_cache = {}
+            self._render_cache_version = version
+        return self._render_cache
+
+    def _get_prompt_object(self) -> PromptModel:
+        render_cache = self._get_render_cache()
+        prompt_object = render_cache.get("prompt_object")
+        if prompt_object is None:
+            prompt_object = render_cache["prompt_object"] = PromptModel(**self.prompt)
         return prompt_object
 
+    def to_prompt_object(self) -> PromptModel:
+        return self._get_prompt_object().model_copy()
+
     def to_text(
         self,
         *,
         role_mapping: dict[str, str] | None = None,
     ) -> str:
-        prompt_object = self.to_prompt_object()
+        # Rendering with the current time must never be served from cache.
+        if self.settings.get("prompt.add_current_time") is True:
+            return self._render_text(role_mapping=role_mapping)
+        render_cache = self._get_render_cache()
+        cache_key = ("text", tuple(sorted(role_mapping.items())) if isinstance(role_mapping, dict) else None)
+        if cache_key not in render_cache:
+            render_cache[cache_key] = self._render_text(role_mapping=role_mapping)
+        return render_cache[cache_key]
+
+    def _render_text(
+        self,
+        *,
+        role_mapping: dict[str, str] | None = None,
+    ) -> str:
+        prompt_object = self._get_prompt_object()
         self._check_prompt_all_empty(prompt_object)
 
         prompt_text_list = []
@@ -430,7 +469,36 @@ class AgentlyPromptGenerator(PromptGenerator):
         rich_content: bool | None = False,
         strict_role_orders: bool | None = True,
     ) -> list[dict[str, Any]]:
-        prompt_object = self.to_prompt_object()
+        if self.settings.get("prompt.add_current_time") is True:
+            return self._render_messages(
+                role_mapping=role_mapping,
+                rich_content=rich_content,
+                strict_role_orders=strict_role_orders,
+            )
+        render_cache = self._get_render_cache()
+        cache_key = (
+            "messages",
+            tuple(sorted(role_mapping.items())) if isinstance(role_mapping, dict) else None,
+            rich_content,
+            strict_role_orders,
+        )
+        if cache_key not in render_cache:
+            render_cache[cache_key] = self._render_messages(
+                role_mapping=role_mapping,
+                rich_content=rich_content,
+                strict_role_orders=strict_role_orders,
+            )
+        # Callers are free to edit the returned messages.
+        return _copy_rendered(render_cache[cache_key])
+
+    def _render_messages(
+        self,
+        *,
+        role_mapping: dict[str, str] | None = None,
+        rich_content: bool | None = False,
+        strict_role_orders: bool | None = True,
+    ) -> list[dict[str, Any]]:
+        prompt_object = self._get_prompt_object()
         self._check_prompt_all_empty(prompt_object)
 
         prompt_messages = []
@@ -803,7 +871,14 @@ class AgentlyPromptGenerator(PromptGenerator):
             ]
 
     def to_output_model(self) -> type["BaseModel"]:
-        prompt_object = self.to_prompt_object()
+        render_cache = self._get_render_cache()
+        output_model = render_cache.get("output_model")
+        if output_model is None:
+            output_model = render_cache["output_model"] = self._build_output_model()
+        return output_model
+
+    def _build_output_model(self) -> type["BaseModel"]:
+        prompt_object = self._get_prompt_object()
         output_prompt = prompt_object.output
 
         if not isinstance(output_prompt, (Mapping, Sequence)) or isinstance(output_prompt, str):
@@ -32,6 +32,7 @@ from agently.utils import (
     FunctionShifter,
     StreamingJSONCompleter,
     StreamingJSONParser,
+    IncrementalStreamingJSONParser,
 )
 
 if TYPE_CHECKING:
@@ -52,6 +53,8 @@ class AgentlyResponseParser(ResponseParser):
             "response": {
                 "streaming_parse": False,
                 "streaming_parse_path_style": "dot",
+                "streaming_parse_engine": "incremental",
+                "replay_policy": "all",
             },
         },
     }
@@ -87,9 +90,12 @@ class AgentlyResponseParser(ResponseParser):
         self._OutputModel = prompt.to_output_model() if self._prompt_object.output_format == "json" else None
         self._response_consumer: GeneratorConsumer | None = None
         self._consumer_lock = asyncio.Lock()
-        self._streaming_json_parser = (
-            StreamingJSONParser(self._prompt_object.output) if self._prompt_object.output_format == "json" else None
-        )
+        self._streaming_json_parser: StreamingJSONParser | IncrementalStreamingJSONParser | None = None
+        if self._prompt_object.output_format == "json":
+            if self.settings.get("response.streaming_parse_engine", "incremental") == "legacy":
+                self._streaming_json_parser = StreamingJSONParser(self._prompt_object.output)
+            else:
+                self._streaming_json_parser = IncrementalStreamingJSONParser(self._prompt_object.output)
 
         self._streaming_canceled = False
 
@@ -106,14 +112,27 @@ class AgentlyResponseParser(ResponseParser):
     def _on_unregister():
         pass
 
+    def _get_replay_options(self) -> dict[str, Any]:
+        replay_policy = self.settings.get("response.replay_policy", "all")
+        match replay_policy:
+            case "lean":
+                # Raw provider chunks are already kept in `full_result_data["original_delta"]`
+                return {"history_filter": lambda item: item[0] != "original_delta"}
+            case "none":
+                return {"history": False}
+            case int() if not isinstance(replay_policy, bool):
+                return {"history": replay_policy}
+            case _:
+                return {"history": True}
+
     async def _ensure_consumer(self):
         if self._response_consumer is None:
             async with self._consumer_lock:
                 if self._response_consumer is None:
-                    self._response_consumer = GeneratorConsumer(self._extract())
+                    self._response_consumer = GeneratorConsumer(self._extract(), **self._get_replay_options())
 
     async def _extract(self):
-        from agently.base import async_emit_runtime
+        from agently.base import async_emit_runtime, event_center
 
         buffer = ""
         stream_chunk_index = 0
@@ -132,21 +151,22 @@ class AgentlyResponseParser(ResponseParser):
                         buffer += str(data)
                         stream_chunk_index += 1
                         if self.settings.get("$log.cancel_logs") is not True:
-                            await async_emit_runtime(
-                                {
-                                    "event_type": "model.streaming",
-                                    "source": "AgentlyResponseParser",
-                                    "level": "DEBUG",
-                                    "message": str(data),
-                                    "payload": {
-                                        "agent_name": self.agent_name,
-                                        "response_id": self.response_id,
-                                        "delta": str(data),
-                                        "chunk_index": stream_chunk_index,
-                                    },
-                                    "run": self.run_context,
-                                }
-                            )
+                            if event_center.is_observed("model.streaming", "DEBUG"):
+                                await async_emit_runtime(
+                                    {
+                                        "event_type": "model.streaming",
+                                        "source": "AgentlyResponseParser",
+                                        "level": "DEBUG",
+                                        "message": str(data),
+                                        "payload": {
+                                            "agent_name": self.agent_name,
+                                            "response_id": self.response_id,
+                                            "delta": str(data),
+                                            "chunk_index": stream_chunk_index,
+                                        },
+                                        "run": self.run_context,
+                                    }
+                                )
                         elif self._streaming_canceled is False:
                             await async_emit_runtime(
                                 {
@@ -286,6 +306,11 @@ class AgentlyResponseParser(ResponseParser):
                 with contextlib.suppress(RuntimeError):
                     await self.response_generator.aclose()
 
+    async def async_cancel(self):
+        """Stop reading the model response and close the upstream request. Results keep what was received."""
+        await self._ensure_consumer()
+        await cast(GeneratorConsumer, self._response_consumer).close()
+
     async def async_get_meta(self) -> "SerializableMapping":
         await self._ensure_consumer()
         await cast(GeneratorConsumer, self._response_consumer).get_result()
@@ -383,7 +408,7 @@ class AgentlyResponseParser(ResponseParser):
         *,
         specific: "SpecificEvents" = DEFAULT_SPECIFIC_EVENTS,
     ) -> Generator:
-        asyncio.run(self._ensure_consumer())
+        FunctionShifter.syncify(self._ensure_consumer)()
         parsed_generator = cast(GeneratorConsumer, self._response_consumer).get_generator()
         _streaming_parse_path_style = self.settings.get("response.streaming_parse_path_style", "dot")
         if type is None and content is not None:
@@ -408,14 +433,24 @@ class AgentlyResponseParser(ResponseParser):
                 case "instant" | "streaming_parse":
                     if self._streaming_json_parser is not None:
                         streaming_parsed = None
-                        if event == "delta":
-                            streaming_parsed = self._streaming_json_parser.parse_chunk(data)
-                        elif event == "tool_calls":
-                            yield StreamingData(path="$tool_calls", value=data)
+                        if isinstance(self._streaming_json_parser, IncrementalStreamingJSONParser):
+                            # incremental parser works synchronously, no need to bridge through a thread
+                            if event == "delta":
+                                streaming_parsed = self._streaming_json_parser.feed(data)
+                            elif event == "done":
+                                streaming_parsed = self._streaming_json_parser.end()
+                        elif event == "delta":
+                            streaming_parsed = FunctionShifter.syncify_async_generator(
+                                self._streaming_json_parser.parse_chunk(data)
+                            )
                         elif event == "done":
-                            streaming_parsed = self._streaming_json_parser.finalize()
+                            streaming_parsed = FunctionShifter.syncify_async_generator(
+                                self._streaming_json_parser.finalize()
+                            )
+                        if event == "tool_calls":
+                            yield StreamingData(path="$tool_calls", value=data)
                         if streaming_parsed:
-                            for streaming_data in FunctionShifter.syncify_async_generator(streaming_parsed):
+                            for streaming_data in streaming_parsed:
                                 if _streaming_parse_path_style == "slash":
                                     streaming_data.path = DataPathBuilder.convert_dot_to_slash(streaming_data.path)
                                 yield streaming_data
@@ -14,6 +14,7 @@
 
 import json
 import inspect
+from contextlib import asynccontextmanager
 
 from typing import (
     Any,
@@ -48,7 +49,11 @@ R = TypeVar("R")
 class AgentlyToolManager(ToolManager):
     name = "AgentlyToolManager"
 
-    DEFAULT_SETTINGS = {}
+    DEFAULT_SETTINGS = {
+        "mcp_session_pool": {
+            "enabled": True,
+        },
+    }
 
     def __init__(self, settings: "Settings"):
         from agently.base import event_center
@@ -208,37 +213,60 @@ class AgentlyToolManager(ToolManager):
         except Exception as e:
             return f"Error: { e }"
 
+    @asynccontextmanager
+    async def _mcp_client(self, transport: "MCPConfigs | str | Any"):
+        """Borrow a pooled MCP session, or open a one-off client if the pool is disabled."""
+        if self.plugin_settings.get("mcp_session_pool.enabled", True):
+            from agently.base import mcp_session_pool
+
+            async with mcp_session_pool.session(transport) as client:
+                yield client
+        else:
+            from fastmcp import Client
+
+            async with Client(transport) as client:  # type: ignore
+                yield client
+
     def _mcp_tool_func(
         self,
         mcp_tool_name: str,
         transport: "MCPConfigs | str | Any",
     ):
         async def _call_mcp_tool(**kwargs):
-            from fastmcp import Client
             from mcp.types import TextContent, ImageContent, AudioContent, ResourceLink, EmbeddedResource
 
-            async with Client(transport) as client:  # type: ignore
-                mcp_result = await client.call_tool(
-                    name=mcp_tool_name,
-                    arguments=kwargs,
+            if self.plugin_settings.get("mcp_session_pool.enabled", True):
+                from agently.base import mcp_session_pool
+
+                mcp_result = await mcp_session_pool.call_tool(
+                    transport,
+                    mcp_tool_name,
+                    kwargs,
                     raise_on_error=False,
                 )
-                if mcp_result.is_error:
-                    return {"error": mcp_result.content[0].text}  # type: ignore
-                else:
-                    if mcp_result.structured_content:
-                        return mcp_result.structured_content
-                    try:
-                        result = mcp_result.content[0]
-                        if isinstance(result, TextContent):
-                            try:
-                                return json.loads(result.text)
-                            except json.decoder.JSONDecodeError:
-                                return result.text
-                        elif isinstance(result, (ImageContent, AudioContent, ResourceLink, EmbeddedResource)):
-                            return result.model_dump()
-                    except:
-                        return None
+            else:
+                async with self._mcp_client(transport) as client:
+                    mcp_result = await client.call_tool(
+                        name=mcp_tool_name,
+                        arguments=kwargs,
+                        raise_on_error=False,
+                    )
+            if mcp_result.is_error:
+                return {"error": mcp_result.content[0].text}  # type: ignore
+            else:
+                if mcp_result.structured_content:
+                    return mcp_result.structured_content
+                try:
+                    result = mcp_result.content[0]
+                    if isinstance(result, TextContent):
+                        try:
+                            return json.loads(result.text)
+                        except json.decoder.JSONDecodeError:
+                            return result.text
+                    elif isinstance(result, (ImageContent, AudioContent, ResourceLink, EmbeddedResource)):
+                        return result.model_dump()
+                except:
+                    return None
 
         return _call_mcp_tool
 
@@ -249,14 +277,13 @@ class AgentlyToolManager(ToolManager):
         tags: str | list[str] | None = None,
     ):
         LazyImport.import_package("fastmcp", version_constraint=">=3")
-        from fastmcp import Client
 
         if tags is None:
             tags = []
         if isinstance(tags, str):
             tags = [tags]
 
-        async with Client(transport) as client:  # type: ignore
+        async with self._mcp_client(transport) as client:
             tool_list = await client.list_tools()
             for tool in tool_list:
                 tool_tags = []
@@ -16,10 +16,11 @@ import asyncio
 import inspect
 from pathlib import Path
 
-from typing import TYPE_CHECKING, Any, Mapping
+from typing import TYPE_CHECKING, Any, Callable, Mapping
 
-from agently.types.data import ErrorInfo, RuntimeEvent
+from agently.types.data import ErrorInfo, LazyPayload, RuntimeEvent
 from agently.utils import FunctionShifter
+from .EventDispatcher import RuntimeEventDispatcher, OverflowPolicy
 
 if TYPE_CHECKING:
     from agently.types.data import EventHook, RunContext, RuntimeEventLevel
@@ -69,10 +70,55 @@ def _infer_runtime_source() -> str:
     return "Agently"
 
 
+_LEVEL_NUMBERS: dict[str, int] = {
+    "DEBUG": 10,
+    "INFO": 20,
+    "WARNING": 30,
+    "ERROR": 40,
+    "CRITICAL": 50,
+}
+
+
+class _HookSubscription:
+    __slots__ = (
+        "name",
+        "callback",
+        "async_callback",
+        "event_types",
+        "min_level",
+        "event_filter",
+        "batch_callback",
+        "lazy_payload",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        callback: "EventHook",
+        event_types: set[str] | None,
+        min_level: int,
+        event_filter: "Callable[[str, RuntimeEventLevel], bool] | None",
+        batch_callback: "Callable[[list[RuntimeEvent]], Any] | None" = None,
+        lazy_payload: bool = False,
+    ):
+        self.name = name
+        self.callback = callback
+        # Sync hooks run in a worker thread so a slow one never blocks the emitting loop
+        self.async_callback = FunctionShifter.asyncify(callback)
+        self.event_types = event_types
+        self.min_level = min_level
+        self.event_filter = event_filter
+        self.batch_callback = batch_callback
+        self.lazy_payload = lazy_payload
+
+
 class EventCenter:
     def __init__(self):
-        self._hooks: dict[str, tuple[set[str] | None, "EventHook"]] = {}
+        self._hooks: dict[str, _HookSubscription] = {}
         self._hookers: dict[str, type["EventHooker"]] = {}
+        # (event_type, level) -> subscriptions whose static filters match, rebuilt on (un)register
+        self._subscription_index: dict[tuple[str, str], tuple[_HookSubscription, ...]] = {}
+        self._dispatcher: RuntimeEventDispatcher | None = None
         self.emit = FunctionShifter.syncify(self.async_emit)
 
     def register_hook(
@@ -81,22 +127,62 @@ class EventCenter:
         *,
         event_types: str | list[str] | None = None,
         hook_name: str | None = None,
+        min_level: "RuntimeEventLevel | None" = None,
+        event_filter: "Callable[[str, RuntimeEventLevel], bool] | None" = None,
+        batch_callback: "Callable[[list[RuntimeEvent]], Any] | None" = None,
+        lazy_payload: bool = False,
     ):
+        """
+        Register a runtime event hook.
+
+        Async hooks are awaited on the emitting loop, sync hooks run in a worker thread. When
+        several hooks receive the same event they run concurrently.
+
+        Args:
+            callback (EventHook): Sync or async callable receiving the `RuntimeEvent`.
+            event_types (str | list[str] | None): Only receive these event types, all types if None.
+            hook_name (str | None): Unique hook name, `callback.__name__` by default.
+            min_level (RuntimeEventLevel | None): Only receive events at or above this level.
+            event_filter (Callable | None): Dynamic `(event_type, level) -> bool` check, evaluated before the
+                event object is built so unwanted events cost nothing.
+            batch_callback (Callable | None): Sync or async callable receiving a list of events, used instead of
+                `callback` when the dispatcher delivers more than one event to this hook at once.
+            lazy_payload (bool): The hook reads payloads with `event.get_payload()` and can receive an
+                unresolved `LazyPayload`. Lazy payloads are only built if some receiver is not lazy.
+        """
         if hook_name is None:
             hook_name = callback.__name__
         normalized_event_types: set[str] | None = None
         if event_types is not None:
             normalized_event_types = {event_types} if isinstance(event_types, str) else set(event_types)
-        self._hooks[hook_name] = (normalized_event_types, callback)
+        self._hooks[hook_name] = _HookSubscription(
+            hook_name,
+            callback,
+            normalized_event_types,
+            _LEVEL_NUMBERS.get(str(min_level), 0) if min_level is not None else 0,
+            event_filter,
+            batch_callback,
+            lazy_payload,
+        )
+        self._subscription_index.clear()
 
     def unregister_hook(self, hook_name: str):
         if hook_name in self._hooks:
             del self._hooks[hook_name]
+            self._subscription_index.clear()
 
     def register_hooker_plugin(self, hooker: type["EventHooker"]):
         if hasattr(hooker, "_on_register"):
             hooker._on_register()
-        self.register_hook(hooker.handler, event_types=hooker.event_types, hook_name=hooker.name)
+        self.register_hook(
+            hooker.handler,
+            event_types=hooker.event_types,
+            hook_name=hooker.name,
+            min_level=getattr(hooker, "min_level", None),
+            event_filter=getattr(hooker, "should_handle", None),
+            batch_callback=getattr(hooker, "batch_handler", None),
+            lazy_payload=bool(getattr(hooker, "lazy_payload", False)),
+        )
         self._hookers[hooker.name] = hooker
 
     def unregister_hooker_plugin(self, hooker: str | type["EventHooker"]):
@@ -109,22 +195,142 @@ class EventCenter:
             hooker._on_unregister()
         del self._hookers[hooker.name]
 
+    def _get_subscriptions(self, event_type: str, level: str) -> tuple[_HookSubscription, ...]:
+        key = (event_type, level)
+        subscriptions = self._subscription_index.get(key)
+        if subscriptions is None:
+            level_number = _LEVEL_NUMBERS.get(level, _LEVEL_NUMBERS["INFO"])
+            subscriptions = tuple(
+                subscription
+                for subscription in self._hooks.values()
+                if (subscription.event_types is None or event_type in subscription.event_types)
+                and level_number >= subscription.min_level
+            )
+            self._subscription_index[key] = subscriptions
+        return subscriptions
+
+    def _get_receivers(self, event_type: str, level: str) -> list[_HookSubscription]:
+        receivers = []
+        for subscription in self._get_subscriptions(event_type, level):
+            if subscription.event_filter is not None:
+                try:
+                    if not subscription.event_filter(event_type, level):  # type: ignore
+                        continue
+                except Exception:
+                    pass
+            receivers.append(subscription)
+        return receivers
+
+    def is_observed(self, event_type: str, level: "RuntimeEventLevel" = "INFO") -> bool:
+        """
+        Check whether any hook would receive an event, so callers can skip building payloads.
+        """
+        for subscription in self._get_subscriptions(event_type, level):
+            if subscription.event_filter is None:
+                return True
+            try:
+                if subscription.event_filter(event_type, level):  # type: ignore
+                    return True
+            except Exception:
+                return True
+        return False
+
     async def async_emit(self, event: "Mapping[str, Any] | RuntimeEvent"):
         if isinstance(event, RuntimeEvent):
+            receivers = self._get_receivers(event.event_type, event.level)
+            if not receivers:
+                return
             event_object = event
         else:
+            receivers = self._get_receivers(str(event.get("event_type")), str(event.get("level") or "INFO"))
+            if not receivers:
+                return
             event_data: dict[str, Any] = dict(event)
             if not event_data.get("source"):
                 event_data["source"] = _infer_runtime_source()
             event_object = RuntimeEvent.model_validate(event_data)
-        tasks = []
-        for event_types, callback in self._hooks.values():
-            if event_types is not None and event_object.event_type not in event_types:
-                continue
-            coro = FunctionShifter.asyncify(callback)
-            tasks.append(asyncio.create_task(coro(event_object)))
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+        if isinstance(event_object.payload, LazyPayload) and not all(receiver.lazy_payload for receiver in receivers):
+            event_object = event_object.model_copy(update={"payload": event_object.payload.resolve()})
+        if self._dispatcher is not None:
+            await self._dispatcher.async_put(event_object, receivers)
+            return
+        # A single hook is awaited directly, several run concurrently like before
+        if len(receivers) == 1:
+            await self._async_call_hook(receivers[0], event_object)
+            return
+        await asyncio.gather(*[self._async_call_hook(receiver, event_object) for receiver in receivers])
+
+    @staticmethod
+    async def _async_call_hook(receiver: _HookSubscription, event: RuntimeEvent):
+        # A failing hook never breaks the emitter or the other hooks
+        try:
+            result = await receiver.async_callback(event)
+            if inspect.isawaitable(result):
+                await result
+        except Exception:
+            pass
+
+    def enable_dispatcher(
+        self,
+        *,
+        capacity: int = 10000,
+        batch_size: int = 256,
+        overflow_policy: OverflowPolicy = "drop_oldest_debug",
+        sample_rate: int = 10,
+        block_timeout: float | None = None,
+    ):
+        """
+        Deliver events through a bounded background queue instead of calling hooks inline.
+
+        Args:
+            capacity (int): Max queued events.
+            batch_size (int): Max events handed to hooks per worker iteration.
+            overflow_policy ("drop_oldest_debug" | "block" | "sample"): What to do when the queue is full.
+            sample_rate (int): Under the `sample` policy, keep one in every `sample_rate` overflowing events.
+            block_timeout (float | None): Under the `block` policy, max seconds an emitter waits before
+                falling back to dropping, wait forever if None.
+        """
+        previous = self._dispatcher
+        self._dispatcher = RuntimeEventDispatcher(
+            capacity=capacity,
+            batch_size=batch_size,
+            overflow_policy=overflow_policy,
+            sample_rate=sample_rate,
+            block_timeout=block_timeout,
+        )
+        if previous is not None:
+            previous.stop(drain=True)
+        return self
+
+    def disable_dispatcher(self, *, drain: bool = True, timeout: float | None = 5.0):
+        """Go back to inline delivery, delivering queued events first unless `drain` is False."""
+        dispatcher = self._dispatcher
+        self._dispatcher = None
+        if dispatcher is not None:
+            dispatcher.stop(drain=drain, timeout=timeout)
+        return self
+
+    @property
+    def dispatcher(self):
+        return self._dispatcher
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every queued event has been delivered, always True in inline mode."""
+        if self._dispatcher is None:
+            return True
+        return self._dispatcher.flush(timeout)
+
+    async def async_flush(self, timeout: float | None = None) -> bool:
+        if self._dispatcher is None:
+            return True
+        return await self._dispatcher.async_flush(timeout)
+
+    def get_metrics(self) -> dict[str, Any]:
+        return {
+            "mode": "dispatcher" if self._dispatcher is not None else "inline",
+            "hooks": len(self._hooks),
+            "dispatcher": self._dispatcher.get_metrics() if self._dispatcher is not None else None,
+        }
 
     def create_emitter(
         self,
@@ -0,0 +1,341 @@
+# Copyright 2023-2026 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import asyncio
+import inspect
+import threading
+from collections import deque
+from typing import TYPE_CHECKING, Any, Literal, Sequence
+
+if TYPE_CHECKING:
+    from agently.types.data import RuntimeEvent
+    from agently.core.EventCenter import _HookSubscription
+
+OverflowPolicy = Literal["drop_oldest_debug", "block", "sample"]
+
+_QueueItem = tuple[int, "RuntimeEvent", Sequence["_HookSubscription"]]
+
+
+class _HookMetrics:
+    __slots__ = ("calls", "events", "errors", "total_seconds", "max_seconds")
+
+    def __init__(self):
+        self.calls = 0
+        self.events = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "events": self.events,
+            "errors": self.errors,
+            "total_ms": self.total_seconds * 1000,
+            "avg_ms": (self.total_seconds / self.calls * 1000) if self.calls else 0.0,
+            "max_ms": self.max_seconds * 1000,
+        }
+
+
+class RuntimeEventDispatcher:
+    """
+    Bounded background delivery queue for `EventCenter`.
+
+    Emitters only validate and enqueue events. A daemon worker thread owns its own
+    event loop, drains the queue in batches and calls hooks there, so slow sinks
+    never add latency to model streaming or TriggerFlow execution.
+
+    The queue is a pair of ring buffers (DEBUG and everything else) merged by
+    sequence number on delivery, so dropping the oldest DEBUG event is O(1).
+
+    Overflow policies when `capacity` is reached:
+    - `drop_oldest_debug`: evict the oldest queued DEBUG event. If none is queued,
+      an incoming DEBUG event is dropped, any other event evicts the oldest event.
+    - `block`: the emitter waits until the worker frees a slot.
+    - `sample`: keep one in every `sample_rate` overflowing events (evicting the
+      oldest queued one) and drop the rest.
+    """
+
+    def __init__(
+        self,
+        *,
+        capacity: int = 10000,
+        batch_size: int = 256,
+        overflow_policy: OverflowPolicy = "drop_oldest_debug",
+        sample_rate: int = 10,
+        block_timeout: float | None = None,
+        name: str = "agently-event-dispatcher",
+    ):
+        if capacity < 1:
+            raise ValueError(f"Event dispatcher capacity must be at least 1, got { capacity }.")
+        if overflow_policy not in ("drop_oldest_debug", "block", "sample"):
+            raise ValueError(f"Unknown event dispatcher overflow policy: { overflow_policy }")
+        self.capacity = capacity
+        self.batch_size = max(1, batch_size)
+        self.overflow_policy: OverflowPolicy = overflow_policy
+        self.sample_rate = max(1, sample_rate)
+        self.block_timeout = block_timeout
+        self.name = name
+
+        self._condition = threading.Condition()
+        self._debug_queue: deque[_QueueItem] = deque()
+        self._queue: deque[_QueueItem] = deque()
+        self._sequence = 0
+        self._in_flight = 0
+        self._closing = False
+        self._overflow_count = 0
+
+        self._enqueued = 0
+        self._delivered = 0
+        self._dropped = 0
+        self._dropped_by_level: dict[str, int] = {}
+        self._batches = 0
+        self._max_queue_depth = 0
+        self._hook_metrics: dict[str, _HookMetrics] = {}
+
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    @property
+    def is_running(self):
+        return self._thread.is_alive() and not self._closing
+
+    def _depth(self):
+        return len(self._debug_queue) + len(self._queue)
+
+    def _record_drop(self, event: "RuntimeEvent"):
+        self._dropped += 1
+        self._dropped_by_level[event.level] = self._dropped_by_level.get(event.level, 0) + 1
+
+    def _evict_oldest(self, prefer_debug: bool = True):
+        if prefer_debug and self._debug_queue:
+            queue = self._debug_queue
+        elif self._debug_queue and (not self._queue or self._debug_queue[0][0] < self._queue[0][0]):
+            queue = self._debug_queue
+        else:
+            queue = self._queue
+        _, event, _ = queue.popleft()
+        self._record_drop(event)
+
+    def _append(self, event: "RuntimeEvent", receivers: Sequence["_HookSubscription"]):
+        self._sequence += 1
+        item = (self._sequence, event, receivers)
+        if event.level == "DEBUG":
+            self._debug_queue.append(item)
+        else:
+            self._queue.append(item)
+        self._enqueued += 1
+        depth = self._depth()
+        if depth > self._max_queue_depth:
+            self._max_queue_depth = depth
+        self._condition.notify_all()
+
+    def _try_put(self, event: "RuntimeEvent", receivers: Sequence["_HookSubscription"], *, allow_block: bool):
+        """Returns True when the event was accepted or dropped, False when the caller should wait."""
+        if self._depth() < self.capacity:
+            self._append(event, receivers)
+            return True
+        policy = self.overflow_policy
+        if policy == "block" and allow_block:
+            return False
+        if policy == "sample":
+            self._overflow_count += 1
+            if self._overflow_count % self.sample_rate != 0:
+                self._record_drop(event)
+                return True
+            self._evict_oldest(prefer_debug=False)
+        elif self._debug_queue:
+            self._evict_oldest(prefer_debug=True)
+        elif event.level == "DEBUG":
+            self._record_drop(event)
+            return True
+        else:
+            self._evict_oldest(prefer_debug=False)
+        self._append(event, receivers)
+        return True
+
+    def put(self, event: "RuntimeEvent", receivers: Sequence["_HookSubscription"]):
+        """Enqueue an event from synchronous code, blocking under the `block` policy."""
+        # Hooks emitting from the worker thread must never wait for the worker itself.
+        allow_block = threading.current_thread() is not self._thread
+        deadline = None if self.block_timeout is None else time.monotonic() + self.block_timeout
+        with self._condition:
+            while not self._closing:
+                if self._try_put(event, receivers, allow_block=allow_block):
+                    return
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    allow_block = False
+                    continue
+                self._condition.wait(remaining)
+            self._record_drop(event)
+
+    async def async_put(self, event: "RuntimeEvent", receivers: Sequence["_HookSubscription"]):
+        """Enqueue an event from a coroutine without blocking the running loop."""
+        with self._condition:
+            if self._closing:
+                self._record_drop(event)
+                return
+            if self._try_put(event, receivers, allow_block=threading.current_thread() is not self._thread):
+                return
+        deadline = None if self.block_timeout is None else time.monotonic() + self.block_timeout
+        delay = 0.0005
+        while True:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.05)
+            timed_out = deadline is not None and time.monotonic() >= deadline
+            with self._condition:
+                if self._closing:
+                    self._record_drop(event)
+                    return
+                if self._try_put(event, receivers, allow_block=not timed_out):
+                    return
+
+    def _take_batch(self) -> list[_QueueItem] | None:
+        with self._condition:
+            while not self._debug_queue and not self._queue:
+                if self._closing:
+                    return None
+                self._condition.wait()
+            batch: list[_QueueItem] = []
+            debug_queue, queue = self._debug_queue, self._queue
+            while len(batch) < self.batch_size and (debug_queue or queue):
+                if debug_queue and (not queue or debug_queue[0][0] < queue[0][0]):
+                    batch.append(debug_queue.popleft())
+                else:
+                    batch.append(queue.popleft())
+            self._in_flight = len(batch)
+            self._batches += 1
+            # Wake up emitters waiting for free slots.
+            self._condition.notify_all()
+            return batch
+
+    def _get_hook_metrics(self, name: str):
+        metrics = self._hook_metrics.get(name)
+        if metrics is None:
+            with self._condition:
+                metrics = self._hook_metrics[name] = _HookMetrics()
+        return metrics
+
+    async def _call_hook(self, receiver: "_HookSubscription", events: list["RuntimeEvent"], *, as_batch: bool):
+        metrics = self._get_hook_metrics(receiver.name)
+        started_at = time.perf_counter()
+        try:
+            if as_batch:
+                result = receiver.batch_callback(events)  # type: ignore
+            else:
+                result = receiver.callback(events[0])
+            if inspect.isawaitable(result):
+                await result
+        except Exception:
+            metrics.errors += 1
+        finally:
+            elapsed = time.perf_counter() - started_at
+            metrics.calls += 1
+            metrics.events += len(events)
+            metrics.total_seconds += elapsed
+            if elapsed > metrics.max_seconds:
+                metrics.max_seconds = elapsed
+
+    async def _deliver(self, batch: list[_QueueItem]):
+        # Group events per hook so hooks with a batch handler are called once per batch,
+        # each hook still sees its events in emission order.
+        grouped: dict[str, tuple["_HookSubscription", list["RuntimeEvent"]]] = {}
+        for _, event, receivers in batch:
+            for receiver in receivers:
+                entry = grouped.get(receiver.name)
+                if entry is None:
+                    grouped[receiver.name] = (receiver, [event])
+                else:
+                    entry[1].append(event)
+        for receiver, events in grouped.values():
+            if receiver.batch_callback is not None and len(events) > 1:
+                await self._call_hook(receiver, events, as_batch=True)
+            else:
+                for event in events:
+                    await self._call_hook(receiver, [event], as_batch=False)
+
+    def _run(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            while True:
+                batch = self._take_batch()
+                if batch is None:
+                    break
+                try:
+                    loop.run_until_complete(self._deliver(batch))
+                finally:
+                    with self._condition:
+                        self._delivered += len(batch)
+                        self._in_flight = 0
+                        self._condition.notify_all()
+        finally:
+            try:
+                loop.run_until_complete(loop.shutdown_asyncgens())
+            finally:
+                loop.close()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every queued event has been delivered. Returns False on timeout."""
+        if threading.current_thread() is self._thread:
+            return False
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while (self._debug_queue or self._queue or self._in_flight) and self._thread.is_alive():
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            return True
+
+    async def async_flush(self, timeout: float | None = None) -> bool:
+        return await asyncio.to_thread(self.flush, timeout)
+
+    def stop(self, *, drain: bool = True, timeout: float | None = 5.0):
+        """
+        Stop the worker thread.
+
+        Args:
+            drain (bool): Deliver queued events before stopping, otherwise drop them.
+            timeout (float | None): Seconds to wait for the worker to finish.
+        """
+        if drain:
+            self.flush(timeout)
+        with self._condition:
+            self._closing = True
+            for queue in (self._debug_queue, self._queue):
+                while queue:
+                    self._record_drop(queue.popleft()[1])
+            self._condition.notify_all()
+        if threading.current_thread() is not self._thread:
+            self._thread.join(timeout)
+
+    def get_metrics(self) -> dict[str, Any]:
+        with self._condition:
+            return {
+                "capacity": self.capacity,
+                "batch_size": self.batch_size,
+                "overflow_policy": self.overflow_policy,
+                "queue_depth": self._depth(),
+                "max_queue_depth": self._max_queue_depth,
+                "in_flight": self._in_flight,
+                "enqueued": self._enqueued,
+                "delivered": self._delivered,
+                "dropped": self._dropped,
+                "dropped_by_level": dict(self._dropped_by_level),
+                "batches": self._batches,
+                "hooks": {name: metrics.to_dict() for name, metrics in self._hook_metrics.items()},
+            }
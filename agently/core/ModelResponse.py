@@ -21,6 +21,7 @@ from typing import Any, AsyncGenerator, TYPE_CHECKING, cast
 from agently.core.Prompt import Prompt
 from agently.core.ExtensionHandlers import ExtensionHandlers
 from agently.core.runtime_context import bind_runtime_context
+from agently.types.data import LazyPayload
 from agently.utils import Settings, DataFormatter
 
 from agently.core.ModelResponseResult import ModelResponseResult
@@ -73,19 +74,11 @@ class ModelResponse:
             },
         )
         self.plugin_manager = plugin_manager
-        settings_snapshot = settings.get()
-        self.settings = Settings(settings_snapshot if isinstance(settings_snapshot, dict) else {})
+        # Copy-on-write forks: values stay shared with the agent's state until this response writes them.
+        self.settings = Settings().fork_from(settings)
         self.settings.set("$log.cancel_logs", False)
-        prompt_snapshot = prompt.get()
-        self.prompt = Prompt(
-            self.plugin_manager,
-            self.settings,
-            prompt_dict=prompt_snapshot if isinstance(prompt_snapshot, dict) else {},
-        )
-        extension_handlers_snapshot = extension_handlers.get()
-        self.extension_handlers = ExtensionHandlers(
-            extension_handlers_snapshot if isinstance(extension_handlers_snapshot, dict) else {}
-        )
+        self.prompt = Prompt(self.plugin_manager, self.settings).fork_from(prompt)
+        self.extension_handlers = ExtensionHandlers().fork_from(extension_handlers)
         self.result = ModelResponseResult(
             self.agent_name,
             self.id,
@@ -192,18 +185,20 @@ class ModelResponse:
                         "run": self.model_run_context,
                     }
                 )
-                prompt_payload = self._build_prompt_payload()
+                # Rendering the full prompt for observers is only paid for if someone reads the payload.
                 await async_emit_runtime(
                     {
                         "event_type": "prompt.built",
                         "source": "ModelResponse",
                         "message": f"Prompt built for model request attempt #{ self.attempt_index }.",
-                        "payload": {
-                            "agent_name": self.agent_name,
-                            "response_id": self.id,
-                            "attempt_index": self.attempt_index,
-                            **prompt_payload,
-                        },
+                        "payload": LazyPayload(
+                            lambda: {
+                                "agent_name": self.agent_name,
+                                "response_id": self.id,
+                                "attempt_index": self.attempt_index,
+                                **self._build_prompt_payload(),
+                            }
+                        ),
                         "run": self.model_run_context,
                     }
                 )
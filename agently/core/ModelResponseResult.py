@@ -14,14 +14,16 @@
 
 from __future__ import annotations
 
+import time
 import asyncio
 import inspect
 import warnings
+from contextlib import aclosing
 
 from typing import Any, AsyncGenerator, Literal, TYPE_CHECKING, cast, overload, Generator
 
 from agently.core.runtime_context import bind_runtime_context
-from agently.utils import FunctionShifter, DataLocator
+from agently.utils import FunctionShifter, DataLocator, StreamingEnsureKeysValidator
 
 if TYPE_CHECKING:
     from pydantic import BaseModel
@@ -137,6 +139,77 @@ class ModelResponseResult:
                             self.settings,
                         )
 
+    async def _watch_ensure_keys(
+        self,
+        ensure_keys: list[str],
+        key_style: Literal["dot", "slash"],
+        started_at: float,
+    ) -> dict[str, Any] | None:
+        """
+        Validate the streamed answer against `ensure_keys` and cancel the response as soon as
+        it can no longer satisfy them. Returns the abort details, or None if it was read to the end.
+        """
+        cancel = getattr(self._response_parser, "async_cancel", None)
+        if cancel is None or self.settings.get("response.ensure_keys_early_abort", True) is not True:
+            return None
+        prompt_object = self.prompt.to_prompt_object()
+        if prompt_object.output_format != "json":
+            return None
+        validator = StreamingEnsureKeysValidator(
+            ensure_keys,
+            key_style=key_style,
+            output_schema=prompt_object.output,
+            strict_schema=self.settings.get("response.ensure_keys_strict_schema", False) is True,
+        )
+        streamed_text: list[str] = []
+        async with aclosing(self._response_parser.get_async_generator(type="delta")) as deltas:
+            async for delta in deltas:
+                streamed_text.append(str(delta))
+                if validator.feed(str(delta)) is not None:
+                    break
+        if validator.violation is None:
+            return None
+        await cancel()
+        return {
+            "reason": validator.violation,
+            "streamed_chars": validator.streamed_chars,
+            "streamed_chunks": validator.streamed_chunks,
+            "elapsed": time.perf_counter() - started_at,
+            "streamed_text": "".join(streamed_text),
+        }
+
+    async def _emit_early_abort_savings(self, early_aborts: list[dict[str, Any]], started_at: float):
+        """Estimate what early aborts saved, using this complete attempt as the size of a full answer."""
+        from agently.base import async_emit_runtime
+
+        full_chars = len(await self._response_parser.async_get_text())
+        full_elapsed = time.perf_counter() - started_at
+        usage = (await self._response_parser.async_get_meta()).get("usage")
+        completion_tokens = usage.get("completion_tokens") if isinstance(usage, dict) else None
+        saved_chars = sum(max(0, full_chars - abort["streamed_chars"]) for abort in early_aborts)
+        await async_emit_runtime(
+            {
+                "event_type": "model.early_abort_savings",
+                "source": "ModelResponseResult",
+                "message": f"Early aborts skipped about { saved_chars } characters of generation.",
+                "payload": {
+                    "agent_name": self.agent_name,
+                    "response_id": self._response_id,
+                    "aborted_attempts": len(early_aborts),
+                    "estimated_saved_chars": saved_chars,
+                    "estimated_saved_tokens": (
+                        round(saved_chars * completion_tokens / full_chars)
+                        if isinstance(completion_tokens, int) and full_chars
+                        else None
+                    ),
+                    "estimated_saved_seconds": sum(
+                        max(0.0, full_elapsed - abort["elapsed"]) for abort in early_aborts
+                    ),
+                },
+                "run": self.request_run_context,
+            }
+        )
+
     @overload
     async def async_get_data(
         self,
@@ -147,6 +220,7 @@ class ModelResponseResult:
         max_retries: int = 3,
         raise_ensure_failure: bool = True,
         _retry_count: int = 0,
+        _early_aborts: list[dict[str, Any]] | None = None,
     ) -> dict[str, Any]: ...
 
     @overload
@@ -159,6 +233,7 @@ class ModelResponseResult:
         max_retries: int = 3,
         raise_ensure_failure: bool = True,
         _retry_count: int = 0,
+        _early_aborts: list[dict[str, Any]] | None = None,
     ) -> Any: ...
 
     async def async_get_data(
@@ -170,26 +245,45 @@ class ModelResponseResult:
         max_retries: int = 3,
         raise_ensure_failure: bool = True,
         _retry_count: int = 0,
+        _early_aborts: list[dict[str, Any]] | None = None,
     ) -> Any:
         if type == "parsed" and ensure_keys:
+            started_at = time.perf_counter()
+            early_abort: dict[str, Any] | None = None
             try:
+                # The last attempt is read to the end, so partial data is still there without a retry.
+                if _retry_count < max_retries:
+                    early_abort = await self._watch_ensure_keys(ensure_keys, key_style, started_at)
+                if early_abort is not None:
+                    raise ValueError(early_abort["reason"])
                 data = await self._response_parser.async_get_data(type=type)
                 for ensure_key in ensure_keys:
                     EMPTY = object()
                     if DataLocator.locate_path_in_dict(data, ensure_key, key_style, default=EMPTY) is EMPTY:
                         raise
+                if _early_aborts:
+                    await self._emit_early_abort_savings(_early_aborts, started_at)
                 await self._run_finally_handlers_once()
                 return data
             except:
                 from agently.base import async_emit_runtime
                 from agently.core.ModelResponse import ModelResponse
 
+                if early_abort is not None:
+                    response_text = early_abort.pop("streamed_text")
+                    _early_aborts = [*(_early_aborts or []), early_abort]
+                else:
+                    response_text = await self._response_parser.async_get_text()
                 await async_emit_runtime(
                     {
                         "event_type": "model.retrying",
                         "source": "ModelResponseResult",
                         "level": "WARNING",
-                        "message": "No target data in response. Preparing retry.",
+                        "message": (
+                            f"Response can not contain ensure keys ({ early_abort['reason'] }). Aborted and preparing retry."
+                            if early_abort is not None
+                            else "No target data in response. Preparing retry."
+                        ),
                         "payload": {
                             "agent_name": self.agent_name,
                             "response_id": self._response_id,
@@ -197,9 +291,10 @@ class ModelResponseResult:
                             "attempt_index": self.attempt_index,
                             "next_attempt_index": self.attempt_index + 1,
                             "model_run_id": self.model_run_context.run_id if self.model_run_context is not None else None,
-                            "response_text": await self._response_parser.async_get_text(),
+                            "response_text": response_text,
                             "ensure_keys": ensure_keys,
                             "key_style": key_style,
+                            "early_abort": early_abort,
                         },
                         "run": self.request_run_context,
                     }
@@ -221,6 +316,7 @@ class ModelResponseResult:
                         max_retries=max_retries,
                         raise_ensure_failure=raise_ensure_failure,
                         _retry_count=_retry_count + 1,
+                        _early_aborts=_early_aborts,
                     )
                     await self._run_finally_handlers_once()
                     return data
@@ -25,7 +25,7 @@ import json5
 import yaml
 
 from agently.types.data import ChatMessage, ChatMessageDict
-from agently.utils import FunctionShifter, Settings, SettingsNamespace, DataLocator
+from agently.utils import FunctionShifter, Settings, SettingsNamespace, DataLocator, TokenCounter
 
 if TYPE_CHECKING:
     from agently.core import Prompt
@@ -34,6 +34,7 @@ if TYPE_CHECKING:
     from agently.types.plugins import (
         AnalysisHandler,
         ExecutionHandler,
+        LengthHandler,
         ResizeHandler,
         StandardAnalysisHandler,
         StandardExecutionHandler,
@@ -65,9 +66,16 @@ class Session:
             "simple_cut": self._simple_cut_resize_handler,
         }
         self._execution_handlers: "dict[str, StandardExecutionHandler]" = self._resize_handlers
+        self._length_handler: "LengthHandler" = self._default_length_handler
+        # `session.tokenizer` value the length handler currently follows
+        self._tokenizer: str | None = None
         self._full_context: list[ChatMessage] = []
         self._context_window: list[ChatMessage] = []
+        # Lengths of the context window messages, measured once when they enter the window
+        self._context_window_lengths: list[int] = []
+        self._context_window_length = 0
         self._memo = None
+        self._apply_tokenizer_setting()
 
         self.reset_chat_history = FunctionShifter.syncify(self.async_reset_chat_history)
         self.set_chat_history = FunctionShifter.syncify(self.async_set_chat_history)
@@ -105,15 +113,25 @@ class Session:
     ):
         max_length = session_settings.get("max_length", None)
         if isinstance(max_length, int):
-            new_context_window: list[ChatMessage] = []
-            total_length = 0
-            for message in reversed(context_window):
-                message_length = len(str(message.model_dump()))
-                if total_length + message_length > max_length:
-                    break
-                new_context_window.append(message)
-                total_length += message_length
-            new_context_window.reverse()
+            # Keep the longest suffix that fits: drop the oldest messages until it fits
+            message_lengths = self._get_message_lengths(context_window)
+            total_length = self._calculate_context_length(context_window)
+            cut_index = 0
+            while cut_index < len(message_lengths) and total_length > max_length:
+                total_length -= message_lengths[cut_index]
+                cut_index += 1
+            new_context_window = list(context_window[cut_index:])
+
+            token_counter = self._length_handler if isinstance(self._length_handler, TokenCounter) else None
+            if token_counter is not None and cut_index > 0:
+                # Fill the rest of the budget with the tail of the newest dropped message
+                boundary_message = context_window[cut_index - 1]
+                token_budget = max_length - total_length - token_counter.message_overhead
+                if isinstance(boundary_message.content, str) and token_budget > 0:
+                    tail = token_counter.keep_tail(boundary_message.content, token_budget)
+                    if tail:
+                        new_context_window.insert(0, ChatMessage(role=boundary_message.role, content=tail))
+                return None, new_context_window, None
 
             if len(new_context_window) == 0 and context_window:
                 new_content = str(context_window[-1].content)
@@ -129,19 +147,88 @@ class Session:
                     None,
                 )
 
-            if self._calculate_context_length(new_context_window) <= max_length:
-                return (
-                    None,
-                    self._to_standard_chat_messages(new_context_window),
-                    None,
-                )
+            return (
+                None,
+                new_context_window,
+                None,
+            )
         return None, None, None
 
+    @staticmethod
+    def _default_length_handler(message: ChatMessage):
+        return len(str(message.model_dump()))
+
+    def _get_message_lengths(self, context_window: Sequence[ChatMessage]) -> Sequence[int]:
+        if context_window is self._context_window:
+            return self._context_window_lengths
+        return [self._length_handler(message) for message in context_window]
+
     def _calculate_context_length(self, context_window: Sequence[ChatMessage]):
-        length = 0
-        for message in context_window:
-            length += len(str(message.model_dump()))
-        return length
+        if context_window is self._context_window:
+            return self._context_window_length
+        return sum(self._get_message_lengths(context_window))
+
+    def _set_context_window(self, context_window: list[ChatMessage]):
+        self._apply_tokenizer_setting()
+        old_context_window = self._context_window
+        old_lengths = self._context_window_lengths
+        kept_count = len(context_window)
+        dropped_count = len(old_context_window) - kept_count
+        if (
+            kept_count > 0
+            and dropped_count >= 0
+            and all(message is kept for message, kept in zip(context_window, old_context_window[dropped_count:]))
+        ):
+            # Oldest messages were cut and the rest is the same, only the dropped lengths are subtracted
+            self._context_window_length -= sum(old_lengths[:dropped_count])
+            self._context_window_lengths = old_lengths[dropped_count:]
+        else:
+            known_lengths = {id(message): length for message, length in zip(old_context_window, old_lengths)}
+            self._context_window_lengths = [
+                known_lengths[id(message)] if id(message) in known_lengths else self._length_handler(message)
+                for message in context_window
+            ]
+            self._context_window_length = sum(self._context_window_lengths)
+        self._context_window = context_window
+
+    def _extend_context_window(self, messages: Sequence[ChatMessage]):
+        self._apply_tokenizer_setting()
+        lengths = [self._length_handler(message) for message in messages]
+        self._context_window.extend(messages)
+        self._context_window_lengths.extend(lengths)
+        self._context_window_length += sum(lengths)
+
+    def _apply_tokenizer_setting(self):
+        # Read on every use, `session.tokenizer` can be changed through the parent settings at any time
+        tokenizer = self.session_settings.get("tokenizer", None)
+        tokenizer = tokenizer if isinstance(tokenizer, str) and tokenizer else None
+        if tokenizer == self._tokenizer:
+            return
+        previous_tokenizer, self._tokenizer = self._tokenizer, tokenizer
+        if tokenizer is not None:
+            self.register_length_handler(TokenCounter.from_name(tokenizer))
+        elif previous_tokenizer is not None and self._length_handler is TokenCounter.from_name(previous_tokenizer):
+            self.register_length_handler(None)
+
+    def register_length_handler(self, length_handler: "LengthHandler | None"):
+        """
+        Set how the length of one message is measured against `session.max_length`, e.g. a
+        `TokenCounter`. Lengths are cached per message when it enters the context window.
+
+        With a `TokenCounter`, `simple_cut` also keeps the tail of the newest dropped message
+        that still fits, so the window fills `max_length` tokens exactly.
+        """
+        length_handler = self._default_length_handler if length_handler is None else length_handler
+        if length_handler is self._length_handler:
+            return self
+        self._length_handler = length_handler
+        self._context_window_lengths = [self._length_handler(message) for message in self._context_window]
+        self._context_window_length = sum(self._context_window_lengths)
+        return self
+
+    def get_context_window_length(self):
+        self._apply_tokenizer_setting()
+        return self._context_window_length
 
     def register_analysis_handler(self, analysis_handler: "AnalysisHandler | None"):
         if analysis_handler is None:
@@ -180,13 +267,13 @@ class Session:
         self,
     ):
         self._full_context = []
-        self._context_window = []
+        self._set_context_window([])
         if self._auto_resize:
             await self.async_resize()
         return self
 
     async def async_clean_context_window(self):
-        self._context_window = []
+        self._set_context_window([])
         if self._auto_resize:
             await self.async_resize()
         return self
@@ -201,7 +288,7 @@ class Session:
         if isinstance(chat_history, Sequence):
             messages = self._to_standard_chat_messages(chat_history)
             self._full_context = messages.copy()
-            self._context_window = messages.copy()
+            self._set_context_window(messages.copy())
         else:
             if isinstance(chat_history, dict):
                 chat_history = ChatMessage(
@@ -209,7 +296,7 @@ class Session:
                     content=chat_history["content"],
                 )
             self._full_context = [chat_history]
-            self._context_window = [chat_history]
+            self._set_context_window([chat_history])
         if self._auto_resize:
             await self.async_resize()
         return self
@@ -221,7 +308,7 @@ class Session:
         if isinstance(chat_history, Sequence):
             messages = self._to_standard_chat_messages(chat_history)
             self._full_context.extend(messages)
-            self._context_window.extend(messages)
+            self._extend_context_window(messages)
         else:
             if isinstance(chat_history, dict):
                 chat_history = ChatMessage(
@@ -229,12 +316,13 @@ class Session:
                     content=chat_history["content"],
                 )
             self._full_context.append(chat_history)
-            self._context_window.append(chat_history)
+            self._extend_context_window([chat_history])
         if self._auto_resize:
             await self.async_resize()
         return self
 
     async def async_analyze_context(self):
+        self._apply_tokenizer_setting()
         return await self._analysis_handler(
             self._full_context,
             self._context_window,
@@ -253,7 +341,7 @@ class Session:
             if new_full_context is not None:
                 self._full_context = self._to_standard_chat_messages(new_full_context)
             if new_context_window is not None:
-                self._context_window = self._to_standard_chat_messages(new_context_window)
+                self._set_context_window(self._to_standard_chat_messages(new_context_window))
             if new_memo is not None:
                 self._memo = new_memo
         else:
@@ -469,7 +557,7 @@ class Session:
             raise TypeError("Cannot load Session data, expect key 'context_window' as a sequence of chat messages.")
 
         self._full_context = self._to_standard_chat_messages(full_context_data)
-        self._context_window = self._to_standard_chat_messages(context_window_data)
+        self._set_context_window(self._to_standard_chat_messages(context_window_data))
 
         if "memo" in session_data:
             self._memo = session_data["memo"]
@@ -479,6 +567,7 @@ class Session:
             if not isinstance(session_settings_data, dict):
                 raise TypeError("Cannot load Session data, expect key 'session_settings' as a dictionary.")
             self.session_settings.update(session_settings_data)
+            self._apply_tokenizer_setting()
 
         return self
 
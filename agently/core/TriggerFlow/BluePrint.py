@@ -25,7 +25,7 @@ from pathlib import Path
 from json import JSONDecodeError
 from asyncio import Event, Semaphore
 from collections.abc import Mapping
-from typing import Any, Literal, TYPE_CHECKING, Sequence, cast
+from typing import Any, Callable, Literal, TYPE_CHECKING, Sequence, cast
 
 if TYPE_CHECKING:
     from agently.types.trigger_flow import (
@@ -40,10 +40,18 @@ if TYPE_CHECKING:
 
 from agently.types.data import EMPTY, SerializableMapping
 from agently.types.trigger_flow import RUNTIME_STREAM_STOP
-from agently.utils import StateData, StateDataNamespace
+from agently.utils import StateData
 from agently.core.runtime_context import resolve_parent_run_context
 from .Chunk import TriggerFlowChunk
 from .Execution import TriggerFlowExecution
+from .Join import add_join_slot, get_join_counter, group_signal_values
+from .MicroBatch import build_micro_batch_handler
+from .Routing import TriggerFlowRoutingTable, build_routing_table
+from .process.ForEachProcess import (
+    build_for_each_collect_handler,
+    build_for_each_split_handler,
+    get_for_each_end_trigger,
+)
 from .Definition import (
     TriggerFlowDefinition,
     build_callable_ref,
@@ -191,6 +199,50 @@ class _SubFlowWriteBackTarget:
             data.execution._trigger_flow._flow_data.set(key, _clone_sub_flow_value(value))
 
 
+class _SubFlowTemplate:
+    """
+    Execution template of a sub flow: a private blueprint copy and frozen settings, flow_data
+    and runtime resources of the child flow, compiled once and forked by every call.
+
+    The child flow is only recompiled when its handlers, settings, flow_data or resources
+    changed since the last compile.
+    """
+
+    __slots__ = ("_source", "_stamp", "_flow")
+
+    def __init__(self, source: "TriggerFlow"):
+        self._source = source
+        self._stamp: tuple[Any, ...] | None = None
+        self._flow: "TriggerFlow | None" = None
+
+    def _get_stamp(self):
+        source = self._source
+        return (
+            source._blue_print,
+            source._blue_print._get_handlers_snapshot(),
+            source._skip_exceptions,
+            source.settings.get_version(),
+            source._flow_data.get_version(),
+            source._runtime_resources.get_version(),
+        )
+
+    def _is_current(self, stamp: tuple[Any, ...]):
+        cached_stamp = self._stamp
+        return (
+            cached_stamp is not None
+            and cached_stamp[0] is stamp[0]
+            and cached_stamp[1] is stamp[1]
+            and cached_stamp[2:] == stamp[2:]
+        )
+
+    def fork(self, compile_template: "Callable[[TriggerFlow], TriggerFlow]") -> "TriggerFlow":
+        stamp = self._get_stamp()
+        if self._flow is None or not self._is_current(stamp):
+            self._flow = compile_template(self._source)
+            self._stamp = stamp
+        return self._flow._fork_isolated()
+
+
 class TriggerFlowBluePrint:
     def __init__(self, *, name: str | None = None):
         self.name = name if name is not None else f"BluePrint-{ uuid.uuid4().hex }"
@@ -199,6 +251,8 @@ class TriggerFlowBluePrint:
             "flow_data": {},
             "runtime_data": {},
         }
+        self._handlers_snapshot: "TriggerFlowAllHandlers | None" = None
+        self._routing_table: tuple[Any, ...] | None = None
         self.chunks: dict[str, TriggerFlowChunk] = {}
         self.definition = TriggerFlowDefinition(name=self.name)
         self._chunk_registry: dict[str, Any] = {}
@@ -717,10 +771,12 @@ class TriggerFlowBluePrint:
             mode="write_back",
         )
         concurrency = operator["options"].get("concurrency")
-        sub_flow_template = trigger_flow if trigger_flow is not None else self._build_sub_flow_from_operator(operator)
+        sub_flow_template = _SubFlowTemplate(
+            trigger_flow if trigger_flow is not None else self._build_sub_flow_from_operator(operator)
+        )
 
         async def call_sub_flow(data):
-            isolated_sub_flow = self._instantiate_isolated_sub_flow(sub_flow_template)
+            isolated_sub_flow = sub_flow_template.fork(self._instantiate_isolated_sub_flow)
 
             capture_source = _ParentSubFlowCaptureSource(data)
             capture_target = _SubFlowCaptureTarget()
@@ -853,6 +909,7 @@ class TriggerFlowBluePrint:
             if handler == stored_handler:
                 return stored_id
         handlers[target][handler_id] = handler
+        self._handlers_snapshot = None
         return handler_id
 
     def remove_handler(
@@ -862,6 +919,7 @@ class TriggerFlowBluePrint:
         handler: "TriggerFlowHandler | str",
     ):
         handlers = self._handlers[type]
+        self._handlers_snapshot = None
         if target in handlers:
             if isinstance(handler, str):
                 handlers[target].pop(handler)
@@ -877,6 +935,7 @@ class TriggerFlowBluePrint:
         target: str,
     ):
         handlers = self._handlers[type]
+        self._handlers_snapshot = None
         if target in handlers:
             handlers[target] = {}
 
@@ -934,6 +993,7 @@ class TriggerFlowBluePrint:
             "flow_data": {},
             "runtime_data": {},
         }
+        self._handlers_snapshot = None
         self.chunks = {}
 
     @staticmethod
@@ -972,13 +1032,25 @@ class TriggerFlowBluePrint:
                 id=operator["id"],
             )
 
+    def _compile_micro_batch_operator(self, operator: dict[str, Any]):
+        handler = self._resolve_callable("chunk", operator.get("handler_ref"))
+        options = operator["options"]
+        send_to_batch = build_micro_batch_handler(
+            handler,
+            operator_id=operator["id"],
+            result_trigger=operator["emit_signals"][0]["trigger_event"],
+            max_size=options.get("max_size", 16),
+            max_wait_ms=options.get("max_wait_ms", 10),
+        )
+        for signal in operator["listen_signals"]:
+            self.add_handler(signal["trigger_type"], signal["trigger_event"], send_to_batch, id=operator["id"])
+
     def _compile_signal_gate_operator(self, operator: dict[str, Any]):
         emit_signal = operator["emit_signals"][0]
         mode = operator["options"].get("mode", "and")
-        values_template: dict[str, dict[str, Any]] = {}
+        join_slots: dict[Any, int] = {}
         for signal in operator["listen_signals"]:
-            values_template.setdefault(signal["trigger_type"], {})
-            values_template[signal["trigger_type"]][signal["trigger_event"]] = EMPTY
+            add_join_slot(join_slots, (signal["trigger_type"], signal["trigger_event"]))
 
         async def wait_trigger(data):
             match mode:
@@ -993,23 +1065,19 @@ class TriggerFlowBluePrint:
                         _layer_marks=data._layer_marks.copy(),
                     )
                 case "and":
-                    state_key = f"when_states.{ operator['id'] }.{ self._layer_key(data) }"
-                    state = data._system_runtime_data.get(state_key)
-                    if not isinstance(state, dict):
-                        state = copy.deepcopy(values_template)
-                    if data.trigger_type in state and data.trigger_event in state[data.trigger_type]:
-                        state[data.trigger_type][data.trigger_event] = data.value
-                    data._system_runtime_data.set(state_key, state)
-                    for trigger_event_dict in state.values():
-                        for event_value in trigger_event_dict.values():
-                            if event_value is EMPTY:
-                                return
+                    join_counter = get_join_counter(data, f"when_joins.{ operator['id'] }", join_slots)
+                    joined_values = join_counter.arrive(
+                        self._layer_key(data),
+                        (data.trigger_type, data.trigger_event),
+                        data.value,
+                    )
+                    if joined_values is None:
+                        return
                     await data.async_emit(
                         emit_signal["trigger_event"],
-                        state,
+                        group_signal_values(join_slots, joined_values),
                         _layer_marks=data._layer_marks.copy(),
                     )
-                    del data._system_runtime_data[state_key]
 
         for signal in operator["listen_signals"]:
             self.add_handler(
@@ -1052,111 +1120,48 @@ class TriggerFlowBluePrint:
         emit_signal = operator["emit_signals"][0]
         result_keys = dict(operator["options"].get("result_keys", {}))
         trigger_to_result_key = {signal_id: result_key for signal_id, result_key in result_keys.items()}
-        triggers_template = {signal["id"]: False for signal in operator["listen_signals"]}
         results_template = {result_key: None for result_key in trigger_to_result_key.values()}
+        join_slots: dict[Any, int] = {}
+        for signal in operator["listen_signals"]:
+            add_join_slot(join_slots, signal["id"])
 
         async def wait_all_chunks(data):
             signal_id = f"{ data.trigger_type }:{ data.trigger_event }"
             if signal_id not in trigger_to_result_key:
                 return
-            layer_key = self._layer_key(data)
-            state_key = f"batch_states.{ operator['id'] }.{ layer_key }"
-            state = data._system_runtime_data.get(state_key)
-            if not isinstance(state, dict):
-                state = {
-                    "results": copy.deepcopy(results_template),
-                    "triggers": triggers_template.copy(),
-                }
-            state["results"][trigger_to_result_key[signal_id]] = data.value
-            state["triggers"][signal_id] = True
-            data._system_runtime_data.set(state_key, state)
-            for done in state["triggers"].values():
-                if done is False:
-                    return
+            join_counter = get_join_counter(data, f"batch_joins.{ operator['id'] }", join_slots)
+            joined_values = join_counter.arrive(self._layer_key(data), signal_id, data.value)
+            if joined_values is None:
+                return
+            results = results_template.copy()
+            for slot_signal_id, value in zip(join_slots, joined_values):
+                if slot_signal_id in trigger_to_result_key:
+                    results[trigger_to_result_key[slot_signal_id]] = value
             await data.async_emit(
                 emit_signal["trigger_event"],
-                state["results"],
+                results,
                 _layer_marks=data._layer_marks.copy(),
             )
-            del data._system_runtime_data[state_key]
 
         for signal in operator["listen_signals"]:
             self.add_handler(signal["trigger_type"], signal["trigger_event"], wait_all_chunks, id=operator["id"])
 
     def _compile_for_each_split_operator(self, operator: dict[str, Any]):
         emit_signal = operator["emit_signals"][0]
-        concurrency = operator["options"].get("concurrency")
-
-        async def send_items(data):
-            data.layer_in()
-            for_each_instance_id = data.layer_mark
-            assert for_each_instance_id is not None
-            send_tasks = []
-
-            def prepare_item(item):
-                data.layer_in()
-                item_id = data.layer_mark
-                assert item_id is not None
-                layer_marks = data._layer_marks.copy()
-                data._system_runtime_data.set(f"for_each_results.{ for_each_instance_id }.{ item_id }", EMPTY)
-                data.layer_out()
-                return layer_marks, item
-
-            async def emit_item(item, layer_marks):
-                if concurrency is None or concurrency <= 0:
-                    await data.async_emit(
-                        emit_signal["trigger_event"],
-                        item,
-                        layer_marks,
-                    )
-                else:
-                    semaphore_key = f"for_each_semaphores.{ operator['id'] }"
-                    semaphore = data._system_runtime_data.get(semaphore_key, inherit=False)
-                    if not isinstance(semaphore, asyncio.Semaphore):
-                        semaphore = asyncio.Semaphore(concurrency)
-                        data._system_runtime_data.set(semaphore_key, semaphore)
-                    async with semaphore:
-                        await data.async_emit(
-                            emit_signal["trigger_event"],
-                            item,
-                            layer_marks,
-                        )
-
-            if not isinstance(data.value, str) and isinstance(data.value, Sequence):
-                items = list(data.value)
-                for item in items:
-                    layer_marks, item_value = prepare_item(item)
-                    send_tasks.append(emit_item(item_value, layer_marks))
-                await asyncio.gather(*send_tasks)
-            else:
-                layer_marks, item_value = prepare_item(data.value)
-                await emit_item(item_value, layer_marks)
-
+        options = operator["options"]
+        send_items = build_for_each_split_handler(
+            send_item_trigger=emit_signal["trigger_event"],
+            end_trigger=get_for_each_end_trigger(operator["group_id"] or operator["id"]),
+            semaphore_key=f"for_each_semaphores.{ operator['id'] }",
+            concurrency=options.get("concurrency"),
+            order=options.get("order", "input"),
+            collect=options.get("collect", "list"),
+        )
         for signal in operator["listen_signals"]:
             self.add_handler(signal["trigger_type"], signal["trigger_event"], send_items, id=operator["id"])
 
     def _compile_for_each_collect_operator(self, operator: dict[str, Any]):
-        emit_signal = operator["emit_signals"][0]
-
-        async def collect_results(data):
-            for_each_instance_id = data.upper_layer_mark
-            item_id = data.layer_mark
-            assert for_each_instance_id is not None and item_id is not None
-            for_each_results = StateDataNamespace(data._system_runtime_data, "for_each_results")
-            if for_each_instance_id in for_each_results and item_id in for_each_results[for_each_instance_id]:
-                for_each_results.set(f"{ for_each_instance_id }.{ item_id }", data.value)
-                for value in for_each_results.get(for_each_instance_id, {}).values():
-                    if value is EMPTY:
-                        return
-                data.layer_out()
-                data.layer_out()
-                await data.async_emit(
-                    emit_signal["trigger_event"],
-                    list(for_each_results[for_each_instance_id].values()),
-                    data._layer_marks.copy(),
-                )
-                for_each_results.delete(for_each_instance_id)
-
+        collect_results = build_for_each_collect_handler()
         for signal in operator["listen_signals"]:
             self.add_handler(signal["trigger_type"], signal["trigger_event"], collect_results, id=operator["id"])
 
@@ -1324,6 +1329,8 @@ class TriggerFlowBluePrint:
         kind = operator["kind"]
         if kind == "chunk":
             self._compile_chunk_operator(operator)
+        elif kind == "micro_batch":
+            self._compile_micro_batch_operator(operator)
         elif kind == "signal_gate":
             self._compile_signal_gate_operator(operator)
         elif kind == "batch_fanout":
@@ -1485,6 +1492,37 @@ class TriggerFlowBluePrint:
             raise TypeError(f"Cannot load TriggerFlow YAML config, expect dictionary but got: { type(config) }")
         return self.load_flow_config(config, replace=replace)
 
+    def _get_handlers_snapshot(self) -> "TriggerFlowAllHandlers":
+        """
+        Handler tables for new executions. Executions only read them, so one snapshot is
+        shared until a handler is added or removed.
+        """
+        if self._handlers_snapshot is None:
+            self._handlers_snapshot = {
+                "event": {k: v.copy() for k, v in self._handlers["event"].items()},
+                "flow_data": {k: v.copy() for k, v in self._handlers["flow_data"].items()},
+                "runtime_data": {k: v.copy() for k, v in self._handlers["runtime_data"].items()},
+            }
+        return self._handlers_snapshot
+
+    def _get_routing_table(self) -> TriggerFlowRoutingTable:
+        """
+        Routing table compiled from the handler snapshot and the definition, rebuilt when
+        either of them changed.
+        """
+        handlers = self._get_handlers_snapshot()
+        definition = self.definition
+        cached = self._routing_table
+        if (
+            cached is None
+            or cached[0] is not handlers
+            or cached[1] is not definition
+            or cached[2] != definition.revision
+        ):
+            cached = (handlers, definition, definition.revision, build_routing_table(handlers, definition))
+            self._routing_table = cached
+        return cached[3]
+
     def create_execution(
         self,
         trigger_flow: "TriggerFlow",
@@ -1494,13 +1532,9 @@ class TriggerFlowBluePrint:
         concurrency: int | None = None,
         run_context=None,
     ):
-        handlers_snapshot: TriggerFlowAllHandlers = {
-            "event": {k: v.copy() for k, v in self._handlers["event"].items()},
-            "flow_data": {k: v.copy() for k, v in self._handlers["flow_data"].items()},
-            "runtime_data": {k: v.copy() for k, v in self._handlers["runtime_data"].items()},
-        }
         return TriggerFlowExecution(
-            handlers=handlers_snapshot,
+            handlers=self._get_handlers_snapshot(),
+            routes=self._get_routing_table(),
             trigger_flow=trigger_flow,
             id=execution_id,
             skip_exceptions=skip_exceptions,
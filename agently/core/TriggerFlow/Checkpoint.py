@@ -0,0 +1,264 @@
+# Copyright 2023-2026 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import asyncio
+import sqlite3
+import threading
+from functools import partial
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, ClassVar, Literal, Sequence
+
+from agently.utils import StateData
+
+TriggerFlowCheckpointChange = tuple[Literal["set", "append", "del"], str, Any]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    execution_id TEXT PRIMARY KEY,
+    seq INTEGER NOT NULL,
+    runtime_data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS changes (
+    execution_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    operation TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT,
+    PRIMARY KEY (execution_id, seq)
+);
+CREATE TABLE IF NOT EXISTS heads (
+    execution_id TEXT PRIMARY KEY,
+    seq INTEGER NOT NULL,
+    pending INTEGER NOT NULL,
+    state TEXT NOT NULL
+);
+"""
+
+
+class TriggerFlowCheckpointStore:
+    """
+    SQLite checkpoints of TriggerFlow executions.
+
+    A checkpoint appends the runtime_data changes made since the previous one (an append
+    stores only the appended item) and replaces the execution head (status, interrupts,
+    result, last signal and run context) when it changed. Once
+    `compact_every` changes are pending they are folded into the execution's runtime_data
+    snapshot, so loading applies at most `compact_every` changes to one snapshot.
+
+    flow_data belongs to the flow and is shared by its executions, it is not checkpointed.
+    `async_append()` writes on the store's single writer thread, so writes keep their order
+    and never block the event loop.
+    """
+
+    _shared: ClassVar[dict[tuple[str, int], "TriggerFlowCheckpointStore"]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, path: str | Path, *, compact_every: int = 100):
+        self.path = Path(path)
+        self.compact_every = max(1, int(compact_every))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="agently-trigger-flow-checkpoint")
+
+    @classmethod
+    def from_path(cls, path: str | Path, *, compact_every: int = 100) -> "TriggerFlowCheckpointStore":
+        """Shared store by resolved path, so every execution writing to one file uses one connection."""
+        key = (str(Path(path).resolve()), int(compact_every))
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(path, compact_every=compact_every)
+            return cls._shared[key]
+
+    def append(
+        self,
+        execution_id: str,
+        changes: Sequence[TriggerFlowCheckpointChange],
+        head: dict[str, Any] | None,
+    ):
+        """Append `changes` and replace the head, an unchanged head is passed as None."""
+        with self._lock:
+            connection = self._connection
+            connection.execute("BEGIN")
+            try:
+                row = connection.execute(
+                    "SELECT seq, pending FROM heads WHERE execution_id = ?",
+                    (execution_id,),
+                ).fetchone()
+                seq, pending = row if row is not None else (0, 0)
+                if row is None:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO snapshots (execution_id, seq, runtime_data) VALUES (?, 0, '{}')",
+                        (execution_id,),
+                    )
+                for operation, key, value in changes:
+                    seq += 1
+                    connection.execute(
+                        "INSERT INTO changes (execution_id, seq, operation, key, value) VALUES (?, ?, ?, ?, ?)",
+                        (
+                            execution_id,
+                            seq,
+                            operation,
+                            key,
+                            json.dumps(value, ensure_ascii=False) if operation != "del" else None,
+                        ),
+                    )
+                pending += len(changes)
+                if pending >= self.compact_every:
+                    self._compact(execution_id, seq)
+                    pending = 0
+                if head is not None or row is None:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO heads (execution_id, seq, pending, state) VALUES (?, ?, ?, ?)",
+                        (execution_id, seq, pending, json.dumps(head or {}, ensure_ascii=False)),
+                    )
+                else:
+                    connection.execute(
+                        "UPDATE heads SET seq = ?, pending = ? WHERE execution_id = ?",
+                        (seq, pending, execution_id),
+                    )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+    async def async_append(
+        self,
+        execution_id: str,
+        changes: Sequence[TriggerFlowCheckpointChange],
+        head: dict[str, Any] | None,
+    ):
+        await asyncio.get_running_loop().run_in_executor(
+            self._writer,
+            partial(self.append, execution_id, changes, head),
+        )
+
+    def write_snapshot(self, execution_id: str, runtime_data: dict[str, Any], head: dict[str, Any]):
+        """Replace everything stored for the execution with a full snapshot."""
+        with self._lock:
+            connection = self._connection
+            connection.execute("BEGIN")
+            try:
+                row = connection.execute(
+                    "SELECT seq FROM heads WHERE execution_id = ?",
+                    (execution_id,),
+                ).fetchone()
+                seq = row[0] if row is not None else 0
+                connection.execute("DELETE FROM changes WHERE execution_id = ?", (execution_id,))
+                connection.execute(
+                    "INSERT OR REPLACE INTO snapshots (execution_id, seq, runtime_data) VALUES (?, ?, ?)",
+                    (execution_id, seq, json.dumps(runtime_data, ensure_ascii=False)),
+                )
+                connection.execute(
+                    "INSERT OR REPLACE INTO heads (execution_id, seq, pending, state) VALUES (?, ?, 0, ?)",
+                    (execution_id, seq, json.dumps(head, ensure_ascii=False)),
+                )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+    def _load_runtime_data(self, execution_id: str, until_seq: int):
+        snapshot = self._connection.execute(
+            "SELECT seq, runtime_data FROM snapshots WHERE execution_id = ?",
+            (execution_id,),
+        ).fetchone()
+        snapshot_seq, snapshot_data = snapshot if snapshot is not None else (0, "{}")
+        runtime_data = StateData(json.loads(snapshot_data))
+        for operation, key, value in self._connection.execute(
+            "SELECT operation, key, value FROM changes WHERE execution_id = ? AND seq > ? AND seq <= ? ORDER BY seq",
+            (execution_id, snapshot_seq, until_seq),
+        ):
+            if operation == "set":
+                runtime_data.set(key, json.loads(value))
+            elif operation == "append":
+                runtime_data.append(key, json.loads(value))
+            else:
+                runtime_data.pop(key, None)
+        return runtime_data.get(None, {}, inherit=False)
+
+    def _compact(self, execution_id: str, seq: int):
+        runtime_data = self._load_runtime_data(execution_id, seq)
+        self._connection.execute(
+            "INSERT OR REPLACE INTO snapshots (execution_id, seq, runtime_data) VALUES (?, ?, ?)",
+            (execution_id, seq, json.dumps(runtime_data, ensure_ascii=False)),
+        )
+        self._connection.execute(
+            "DELETE FROM changes WHERE execution_id = ? AND seq <= ?",
+            (execution_id, seq),
+        )
+
+    def compact(self, execution_id: str):
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT seq FROM heads WHERE execution_id = ?",
+                (execution_id,),
+            ).fetchone()
+            if row is None:
+                return
+            self._connection.execute("BEGIN")
+            try:
+                self._compact(execution_id, row[0])
+                self._connection.execute("UPDATE heads SET pending = 0 WHERE execution_id = ?", (execution_id,))
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+
+    def load_state(self, execution_id: str) -> dict[str, Any] | None:
+        """Latest checkpoint as a `TriggerFlowExecution.load()` state without flow_data, or None."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT seq, state FROM heads WHERE execution_id = ?",
+                (execution_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            seq, head = row
+            state = json.loads(head)
+            state["runtime_data"] = self._load_runtime_data(execution_id, seq)
+            return state
+
+    def delete(self, execution_id: str):
+        with self._lock:
+            for table in ("snapshots", "changes", "heads"):
+                self._connection.execute(f"DELETE FROM { table } WHERE execution_id = ?", (execution_id,))
+
+    def list_executions(self) -> list[str]:
+        with self._lock:
+            return [row[0] for row in self._connection.execute("SELECT execution_id FROM heads ORDER BY execution_id")]
+
+    def get_stats(self, execution_id: str) -> dict[str, int]:
+        """`seq` of the latest change and the count of `pending` changes not compacted yet."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT seq, pending FROM heads WHERE execution_id = ?",
+                (execution_id,),
+            ).fetchone()
+        seq, pending = row if row is not None else (0, 0)
+        return {"seq": seq, "pending": pending}
+
+    def close(self):
+        with self._shared_lock:
+            for key, store in list(self._shared.items()):
+                if store is self:
+                    del self._shared[key]
+        self._writer.shutdown(wait=True)
+        with self._lock:
+            self._connection.close()
@@ -177,6 +177,8 @@ class TriggerFlowDefinition:
         self.contract: TriggerFlowContractMetadata = copy.deepcopy(contract) if contract is not None else {}
         self.operators = copy.deepcopy(operators) if operators is not None else []
         self._operator_index: dict[str, dict[str, Any]] = {}
+        # Bumped on every operator change, compiled routing tables check it
+        self.revision = 0
         for operator in self.operators:
             self._operator_index[str(operator["id"])] = operator
 
@@ -223,6 +225,7 @@ class TriggerFlowDefinition:
         }
         self.operators.append(operator)
         self._operator_index[operator_id] = operator
+        self.revision += 1
         return operator
 
     def get_operator(self, operator_id: str):
@@ -241,16 +244,19 @@ class TriggerFlowDefinition:
                 operator[key] = copy.deepcopy(value) if value is not None else {}
             else:
                 operator[key] = value
+        self.revision += 1
         return operator
 
     def append_listen_signals(self, operator_id: str, signals: list[dict[str, Any]]):
         operator = self.get_operator(operator_id)
         operator["listen_signals"] = _dedupe_signals([*operator["listen_signals"], *signals])
+        self.revision += 1
         return operator
 
     def set_emit_signals(self, operator_id: str, signals: list[dict[str, Any]]):
         operator = self.get_operator(operator_id)
         operator["emit_signals"] = _dedupe_signals(signals)
+        self.revision += 1
         return operator
 
     def to_dict(self, *, validate_serializable: bool = False, name: str | None = None):
@@ -357,6 +363,8 @@ class TriggerFlowDefinition:
                     return f"chunk\\n{ name }\\n{ callable_label }"
                 return f"chunk\\n{ name or callable_label }"
             return str(name or callable_label)
+        if kind == "micro_batch":
+            return f"batch chunk\\n{ name or callable_label }"
         if kind == "signal_gate":
             return f"when\\n{ operator['options'].get('mode', 'simple') }"
         if kind == "batch_fanout":
@@ -22,7 +22,7 @@ from pathlib import Path
 from json import JSONDecodeError
 from contextvars import ContextVar
 
-from typing import Any, Literal, TYPE_CHECKING, overload, AsyncGenerator, Generator, Generic, TypeVar, cast
+from typing import Any, Callable, Literal, TYPE_CHECKING, overload, AsyncGenerator, Generator, Generic, TypeVar, cast
 
 if TYPE_CHECKING:
     from .TriggerFlow import TriggerFlow
@@ -38,7 +38,7 @@ from agently.types.trigger_flow import (
     TriggerFlowRuntimeData,
     RUNTIME_STREAM_STOP,
 )
-from agently.types.data import EMPTY, RunContext
+from agently.types.data import EMPTY, LazyPayload, RunContext
 from .Control import (
     TriggerFlowPauseSignal,
     TRIGGER_FLOW_STATUS_CANCELLED,
@@ -49,11 +49,16 @@ from .Control import (
     TRIGGER_FLOW_STATUS_WAITING,
 )
 from .Signal import TriggerFlowSignal, TriggerFlowSignalType
+from .Checkpoint import TriggerFlowCheckpointChange, TriggerFlowCheckpointStore
+from .Routing import TriggerFlowRoute, TriggerFlowRoutingTable, build_routing_table
 
 InputT = TypeVar("InputT")
 StreamT = TypeVar("StreamT")
 ResultT = TypeVar("ResultT")
 
+TriggerFlowObservationLevel = Literal["off", "lifecycle", "full"]
+_OBSERVATION_LEVELS = ("off", "lifecycle", "full")
+
 
 class TriggerFlowExecution(Generic[InputT, StreamT, ResultT]):
     def __init__(
@@ -61,6 +66,7 @@ class TriggerFlowExecution(Generic[InputT, StreamT, ResultT]):
         *,
         handlers: "TriggerFlowAllHandlers",
         trigger_flow: "TriggerFlow[InputT, StreamT, ResultT]",
+        routes: "TriggerFlowRoutingTable | None" = None,
         id: str | None = None,
         skip_exceptions: bool = False,
         concurrency: int | None = None,
@@ -69,6 +75,9 @@ class TriggerFlowExecution(Generic[InputT, StreamT, ResultT]):
         # Basic Attributions
         self.id = id if id is not None else uuid.uuid4().hex
         self._handlers = handlers
+        self._routes = (
+            routes if routes is not None else build_routing_table(handlers, trigger_flow._blue_print.definition)
+        )
         self._trigger_flow = trigger_flow
         self._runtime_data = StateData()
         self._runtime_resources = StateData(
@@ -140,18 +149,37 @@ class TriggerFlowExecution(Generic[InputT, StreamT, ResultT]):
         self._status = TRIGGER_FLOW_STATUS_CREATED
         self._system_runtime_data.set("status", self._status)
         self._system_runtime_data.set("interrupts", {})
-        self._system_runtime_data.set("last_signal", None)
+        self._last_signal: TriggerFlowSignal | None = None
+        # Signals being dispatched, a finished execution is only evicted once this drops to 0
+        self._in_flight = 0
         self._system_runtime_data.set("result", EMPTY)
         self._system_runtime_data.set("result_ready", asyncio.Event())
         self._runtime_stream_queue = asyncio.Queue()
         self._runtime_stream_consumer: GeneratorConsumer | None = None
 
+        # Checkpoint
+        self._checkpoint_store: TriggerFlowCheckpointStore | None = None
+        self._checkpoint_store_resolved = False
+        self._checkpoint_changes: list[TriggerFlowCheckpointChange] = []
+        self._checkpoint_head_stamp: tuple[Any, ...] | None = None
+
     def _to_serializable_value(self, value: Any):
         return json.loads(StateData({"value": value}).dump("json"))["value"]
 
     def _set_status(self, status: str):
         self._status = status
         self._system_runtime_data.set("status", status)
+        self._trigger_flow._executions.mark_status(self)
+
+    def _get_observation_level(self) -> TriggerFlowObservationLevel:
+        """
+        `runtime.trigger_flow_observation_level`:
+        - "full": lifecycle events plus per-signal and per-chunk events.
+        - "lifecycle": workflow lifecycle events and chunk failures only.
+        - "off": no runtime events from this execution.
+        """
+        level = self.settings.get("runtime.trigger_flow_observation_level", "full")
+        return cast(TriggerFlowObservationLevel, level if level in _OBSERVATION_LEVELS else "full")
 
     async def _emit_runtime_event(
         self,
@@ -164,6 +192,8 @@ class TriggerFlowExecution(Generic[InputT, StreamT, ResultT]):
     ):
         from agently.base import async_emit_runtime
 
+        if self._get_observation_level() == "off":
+            return
         await async_emit_runtime(
             {
                 "event_type": event_type,
@@ -184,44 +214,16 @@ class TriggerFlowExecution(Generic[InputT, StreamT, ResultT]):
         await self._emit_runtime_event(
             "workflow.definition_declared",
             message=f"Workflow definition declared for execution '{ self.id }'.",
-            payload={
-                "flow_name": self._trigger_flow.name,
-                "definition": self._to_serializable_value(
-                    self._trigger_flow.get_flow_config(validate_serializable=False)
-                ),
-            },
+            payload=LazyPayload(
+                lambda: {
+                    "flow_name": self._trigger_flow.name,
+                    "definition": self._to_serializable_value(
+                        self._trigger_flow.get_flow_config(validate_serializable=False)
+                    ),
+                }
+            ),
         )
 
-    def _get_handler_operator(self, handler_id: str):
-        try:
-            return self._trigger_flow._blue_print.definition.get_operator(handler_id)
-        except KeyError:
-            return None
-
-    def _serialize_operator_signals(self, signals: Any):
-        if not isinstance(signals, list):
-            return []
-        serialized: list[dict[str, Any]] = []
-        for signal in signals:
-            if not isinstance(signal, dict):
-                continue
-            trigger_event = signal.get("trigger_event")
-            trigger_type = signal.get("trigger_type")
-            if not isinstance(trigger_event, str) or not isinstance(trigger_type, str):
-                continue
-            serialized_signal: dict[str, Any] = {
-                "trigger_event": trigger_event,
-                "trigger_type": trigger_type,
-            }
-            role = signal.get("role")
-            if isinstance(role, str):
-                serialized_signal["role"] = role
-            signal_id = signal.get("id")
-            if isinstance(signal_id, str):
-                serialized_signal["id"] = signal_id
-            serialized.append(serialized_signal)
-        return serialized
-
     def _get_origin_chunk_payload(self):
         chunk_run_context = get_current_chunk_run_context()
         if chunk_run_context is None:
@@ -242,26 +244,16 @@ class TriggerFlowExecution(Generic[InputT, StreamT, ResultT]):
                 "__type__": type(value).__name__,
             }
 
-    def _create_chunk_run_context(self, operator: dict[str, Any], signal: TriggerFlowSignal):
-        operator_kind = str(operator.get("kind", "chunk"))
-        operator_name = str(operator.get("name") or operator_kind)
+    def _create_chunk_run_context(self, route: TriggerFlowRoute, signal: TriggerFlowSignal):
         return self.run_context.create_child(
             run_kind="chunk_execution",
             execution_id=self.id,
             meta={
                 "flow_name": self._trigger_flow.name,
-                "chunk_id": str(operator.get("id", "")),
-                "chunk_name": operator_name,
-                "operator_kind": operator_kind,
+                **cast(dict[str, Any], route.chunk_meta),
                 "trigger_event": signal.trigger_event,
                 "trigger_type": signal.trigger_type,
                 "signal_id": signal.id,
-                "group_id": operator.get("group_id"),
-                "group_kind": operator.get("group_kind"),
-                "parent_group_id": operator.get("parent_group_id"),
-                "parent_group_kind": operator.get("parent_group_kind"),
-                "listen_signals": self._serialize_operator_signals(operator.get("listen_signals")),
-                "emit_signals": self._serialize_operator_signals(operator.get("emit_signals")),
             },
         )
 
@@ -274,32 +266,41 @@ class TriggerFlowExecution(Generic[InputT, StreamT, ResultT]):
         signal: TriggerFlowSignal,
         level: str = "INFO",
         message: str | None = None,
-        payload: Any = None,
+        payload: "dict[str, Any] | Callable[[], dict[str, Any]] | None" = None,
         error: Exception | None = None,
     ):
+        """
+        `payload` may be a function building the payload, it then only runs if a receiving
+        hook reads the payload. Chunk inputs and outputs can be large, so they are passed that way.
+        """
         from agently.base import async_emit_runtime
 
         operator_kind = str(operator.get("kind", "chunk"))
         operator_name = str(operator.get("name") or operator_kind)
-        base_payload = {
-            "chunk_id": str(operator.get("id", "")),
-            "chunk_name": operator_name,
-            "operator_kind": operator_kind,
-            "trigger_event": signal.trigger_event,
-            "trigger_type": signal.trigger_type,
-            "signal_id": signal.id,
-        }
-        if isinstance(payload, dict):
-            base_payload.update(payload)
-        elif payload is not None:
-            base_payload["value"] = payload
+
+        def build_payload():
+            base_payload = {
+                "chunk_id": str(operator.get("id", "")),
+                "chunk_name": operator_name,
+                "operator_kind": operator_kind,
+                "trigger_event": signal.trigger_event,
+                "trigger_type": signal.trigger_type,
+                "signal_id": signal.id,
+            }
+            extra_payload = payload() if callable(payload) else payload
+            if isinstance(extra_payload, dict):
+                base_payload.update(extra_payload)
+            elif extra_payload is not None:
+                base_payload["value"] = extra_payload
+            return base_payload
+
         await async_emit_runtime(
             {
                 "event_type": event_type,
                 "source": "TriggerFlowExecution",
                 "level": level,
                 "message": message,
-                "payload": base_payload,
+                "payload": LazyPayload(build_payload),
                 "error": error,
                 "run": chunk_run_context,
                 "meta": {"execution_id": self.id},
@@ -410,10 +411,11 @@ class TriggerFlowExecution(Generic[InputT, StreamT, ResultT]):
         )
 
     def _remember_signal(self, signal: TriggerFlowSignal):
-        self._system_runtime_data.set("last_signal", signal.to_state_dict())
+        # Kept as is and only serialized on save, copying the value per signal costs O(payload)
+        self._last_signal = signal
 
     def get_last_signal(self):
-        return self._restore_signal(self._system_runtime_data.get("last_signal", None, inherit=False))
+        return self._last_signal
 
     def get_contract_metadata(self) -> TriggerFlowContractMetadata:
         return self._trigger_flow.get_contract_metadata()
@@ -421,28 +423,37 @@ class TriggerFlowExecution(Generic[InputT, StreamT, ResultT]):
     def get_contract(self) -> TriggerFlowContractSpec[InputT, StreamT, ResultT]:
         return self._trigger_flow.get_contract()
 
-    def save(
-        self,
-        path: str | Path | None = None,
-        *,
-        encoding: str | None = "utf-8",
-    ):
+    def _dump_state(self, *, with_data: bool = True):
         result = self._system_runtime_data.get("result")
         result_ready = result is not EMPTY
-        state = {
+        state: dict[str, Any] = {
             "execution_id": self.id,
             "status": self._status,
             "run_context": self.run_context.model_dump(mode="json"),
-            "runtime_data": json.loads(self._runtime_data.dump("json")),
-            "flow_data": json.loads(self._trigger_flow._flow_data.dump("json")),
-            "interrupts": self._to_serializable_value(self._get_interrupts()),
-            "last_signal": self._serialize_signal(self.get_last_signal()),
-            "resource_keys": sorted(str(key) for key in self.get_runtime_resources().keys()),
-            "result": {
-                "ready": result_ready,
-                "value": self._to_serializable_value(result) if result_ready else None,
-            },
         }
+        if with_data:
+            state["runtime_data"] = json.loads(self._runtime_data.dump("json"))
+            state["flow_data"] = json.loads(self._trigger_flow._flow_data.dump("json"))
+        state.update(
+            {
+                "interrupts": self._to_serializable_value(self._get_interrupts()),
+                "last_signal": self._serialize_signal(self.get_last_signal()),
+                "resource_keys": sorted(str(key) for key in self.get_runtime_resources().keys()),
+                "result": {
+                    "ready": result_ready,
+                    "value": self._to_serializable_value(result) if result_ready else None,
+                },
+            }
+        )
+        return state
+
+    def save(
+        self,
+        path: str | Path | None = None,
+        *,
+        encoding: str | None = "utf-8",
+    ):
+        state = self._dump_state()
         if path is None:
             return state
 
@@ -569,7 +580,7 @@ class TriggerFlowExecution(Generic[InputT, StreamT, ResultT]):
             self._system_runtime_data.set("result", EMPTY)
         self._system_runtime_data.set("result_ready", result_ready)
         self._system_runtime_data.set("interrupts", interrupts)
-        self._system_runtime_data.set("last_signal", last_signal_state)
+        self._last_signal = self._restore_signal(last_signal_state)
         self._set_status(status)
         self._started = status != TRIGGER_FLOW_STATUS_CREATED or bool(runtime_data) or ready or bool(interrupts)
         self._runtime_started_emitted = self._started
@@ -578,8 +589,89 @@ class TriggerFlowExecution(Generic[InputT, StreamT, ResultT]):
         if runtime_resources:
             self.update_runtime_resources(runtime_resources)
 
+        self._checkpoint_changes.clear()
+        self._checkpoint_head_stamp = None
+        checkpoint_store = self._get_checkpoint_store()
+        if checkpoint_store is not None:
+            checkpoint_store.write_snapshot(
+                self.id,
+                json.loads(self._runtime_data.dump("json")),
+                self._dump_state(with_data=False),
+            )
+            self._checkpoint_head_stamp = self._get_checkpoint_head_stamp()
+
         return self
 
+    def load_checkpoint(
+        self,
+        execution_id: str | None = None,
+        *,
+        runtime_resources: dict[str, Any] | None = None,
+    ):
+        """
+        Resume from the latest checkpoint of `execution_id` (this execution's id by default)
+        in the store of `runtime.trigger_flow_checkpoint.path`. The flow's flow_data is kept.
+        """
+        checkpoint_store = self._get_checkpoint_store()
+        if checkpoint_store is None:
+            raise RuntimeError(
+                "TriggerFlow checkpoint store is not configured, set 'runtime.trigger_flow_checkpoint.path' first."
+            )
+        execution_id = execution_id if execution_id is not None else self.id
+        state = checkpoint_store.load_state(execution_id)
+        if state is None:
+            raise KeyError(f"Can not find TriggerFlow checkpoint of execution '{ execution_id }'.")
+        state["flow_data"] = self._trigger_flow._flow_data.get(None, {}, inherit=False)
+        return self.load(state, runtime_resources=runtime_resources)
+
+    # Checkpoint
+    def _get_checkpoint_store(self):
+        if not self._checkpoint_store_resolved:
+            self._checkpoint_store_resolved = True
+            checkpoint_path = self.settings.get("runtime.trigger_flow_checkpoint.path")
+            if checkpoint_path:
+                self._checkpoint_store = TriggerFlowCheckpointStore.from_path(
+                    str(checkpoint_path),
+                    compact_every=int(str(self.settings.get("runtime.trigger_flow_checkpoint.compact_every", 100))),
+                )
+        return self._checkpoint_store
+
+    def _get_checkpoint_head_stamp(self):
+        # Cheap change check of everything `_dump_state(with_data=False)` serializes
+        return (
+            self._status,
+            id(self._last_signal),
+            self._system_runtime_data.get_version(),
+            self._runtime_resources.get_version(),
+        )
+
+    async def _async_write_checkpoint(self):
+        checkpoint_store = self._get_checkpoint_store()
+        if checkpoint_store is None:
+            return
+        head = None
+        if self._get_checkpoint_head_stamp() != self._checkpoint_head_stamp:
+            head = self._dump_state(with_data=False)
+            # Taken after dumping, reading interrupts by reference counts as a change
+            self._checkpoint_head_stamp = self._get_checkpoint_head_stamp()
+        if not self._checkpoint_changes and head is None:
+            return
+        changes, self._checkpoint_changes = self._checkpoint_changes, []
+        try:
+            await checkpoint_store.async_append(
+                self.id,
+                [
+                    (operation, key, self._to_serializable_value(value) if operation != "del" else None)
+                    for operation, key, value in changes
+                ],
+                head,
+            )
+        except Exception as e:
+            # Keep the changes for the next checkpoint and write the head again
+            self._checkpoint_changes[:0] = changes
+            self._checkpoint_head_stamp = None
+            warnings.warn(f"Can not write checkpoint of TriggerFlow execution '{ self.id }'.\nError: { e }")
+
     # Set Concurrency
     def set_concurrency(self, concurrency):
         self._concurrency_semaphore = asyncio.Semaphore(concurrency) if concurrency and concurrency > 0 else None
@@ -607,58 +699,74 @@ class TriggerFlowExecution(Generic[InputT, StreamT, ResultT]):
         return await self._async_dispatch_signal(signal)
 
     async def _async_dispatch_signal(self, signal: TriggerFlowSignal):
-        from agently.base import async_emit_runtime
+        self._in_flight += 1
+        try:
+            return await self._async_run_signal_handlers(signal)
+        finally:
+            self._in_flight -= 1
+            if self._in_flight == 0:
+                self._trigger_flow._executions.mark_idle(self)
+
+    async def _async_run_signal_handlers(self, signal: TriggerFlowSignal):
+        from agently.base import async_emit_runtime, event_center
 
         self._remember_signal(signal)
-        await async_emit_runtime(
-            {
-                "event_type": "trigger_flow.signal",
-                "source": "TriggerFlowExecution",
-                "level": "DEBUG",
-                "message": f"Dispatch signal '{ signal.trigger_event }'.",
-                "payload": signal.to_debug_dict(),
-                "run": self.run_context,
-                "meta": {
-                    "execution_id": self.id,
-                },
-            }
-        )
-        tasks = []
-        handlers = self._handlers[signal.trigger_type]
-
-        if signal.trigger_event in handlers:
-            for handler_id, handler in handlers[signal.trigger_event].items():
-                operator = self._get_handler_operator(handler_id)
-                chunk_run_context = self._create_chunk_run_context(operator, signal) if operator is not None else None
-                await async_emit_runtime(
-                    {
-                        "event_type": "trigger_flow.handler_dispatch",
-                        "source": "TriggerFlowExecution",
-                        "level": "DEBUG",
-                        "message": f"Dispatch handler '{ handler_id }' for signal '{ signal.trigger_event }'.",
-                        "payload": {
-                            "event": signal.trigger_event,
-                            "type": signal.trigger_type,
-                        "handler": handler_id,
-                        "signal_id": signal.id,
-                    },
+        observation_level = self._get_observation_level()
+        observe_chunks = observation_level == "full"
+        observe_failures = observation_level != "off"
+        if observe_chunks and event_center.is_observed("trigger_flow.signal", "DEBUG"):
+            await async_emit_runtime(
+                {
+                    "event_type": "trigger_flow.signal",
+                    "source": "TriggerFlowExecution",
+                    "level": "DEBUG",
+                    "message": f"Dispatch signal '{ signal.trigger_event }'.",
+                    "payload": LazyPayload(signal.to_debug_dict),
                     "run": self.run_context,
                     "meta": {
                         "execution_id": self.id,
                     },
                 }
             )
+        tasks = []
+        routes = self._routes.get((signal.trigger_type, signal.trigger_event))
+
+        if routes:
+            for route in routes:
+                handler_id = route.handler_id
+                handler = route.handler
+                operator = route.operator
+                chunk_run_context = self._create_chunk_run_context(route, signal) if operator is not None else None
+                if observe_chunks and event_center.is_observed("trigger_flow.handler_dispatch", "DEBUG"):
+                    await async_emit_runtime(
+                        {
+                            "event_type": "trigger_flow.handler_dispatch",
+                            "source": "TriggerFlowExecution",
+                            "level": "DEBUG",
+                            "message": f"Dispatch handler '{ handler_id }' for signal '{ signal.trigger_event }'.",
+                            "payload": {
+                                "event": signal.trigger_event,
+                                "type": signal.trigger_type,
+                                "handler": handler_id,
+                                "signal_id": signal.id,
+                            },
+                            "run": self.run_context,
+                            "meta": {
+                                "execution_id": self.id,
+                            },
+                        }
+                    )
 
                 async def run_handler(handler_func, *, handler_id: str):
                     async def execute_handler():
-                        if operator is not None and chunk_run_context is not None:
+                        if observe_chunks and operator is not None and chunk_run_context is not None:
                             await self._emit_chunk_runtime_event(
                                 "chunk.started",
                                 chunk_run_context,
                                 operator=operator,
                                 signal=signal,
                                 message=f"Chunk '{ chunk_run_context.meta.get('chunk_name', chunk_run_context.run_id) }' started.",
-                                payload={
+                                payload=lambda: {
                                     "status": "running",
                                     "input": self._serialize_runtime_value(signal.value),
                                     "signal_source": signal.source,
@@ -672,7 +780,7 @@ class TriggerFlowExecution(Generic[InputT, StreamT, ResultT]):
                             ):
                                 return await handler_func
                         except Exception as error:
-                            if operator is not None and chunk_run_context is not None:
+                            if observe_failures and operator is not None and chunk_run_context is not None:
                                 await self._emit_chunk_runtime_event(
                                     "chunk.failed",
                                     chunk_run_context,
@@ -682,7 +790,7 @@ class TriggerFlowExecution(Generic[InputT, StreamT, ResultT]):
                                     message=(
                                         f"Chunk '{ chunk_run_context.meta.get('chunk_name', chunk_run_context.run_id) }' failed."
                                     ),
-                                    payload={
+                                    payload=lambda: {
                                         "status": "failed",
                                         "input": self._serialize_runtime_value(signal.value),
                                         "signal_source": signal.source,
@@ -706,15 +814,17 @@ class TriggerFlowExecution(Generic[InputT, StreamT, ResultT]):
                         finally:
                             self._concurrency_depth.reset(token)
 
-                    if operator is not None and chunk_run_context is not None:
+                    await self._async_write_checkpoint()
+                    if observe_chunks and operator is not None and chunk_run_context is not None:
+                        status = "waiting" if self.is_waiting() else "completed"
                         await self._emit_chunk_runtime_event(
                             "chunk.completed",
                             chunk_run_context,
                             operator=operator,
                             signal=signal,
                             message=f"Chunk '{ chunk_run_context.meta.get('chunk_name', chunk_run_context.run_id) }' completed.",
-                            payload={
-                                "status": "waiting" if self.is_waiting() else "completed",
+                            payload=lambda: {
+                                "status": status,
                                 "returned_pause_signal": isinstance(result, TriggerFlowPauseSignal),
                                 "input": self._serialize_runtime_value(signal.value),
                                 "signal_source": signal.source,
@@ -748,7 +858,7 @@ class TriggerFlowExecution(Generic[InputT, StreamT, ResultT]):
                         "workflow.execution_failed",
                         level="ERROR",
                         message=f"Workflow execution '{ self.id }' failed.",
-                        payload={"last_signal": signal.to_debug_dict()},
+                        payload=LazyPayload(lambda: {"last_signal": signal.to_debug_dict()}),
                         error=error,
                     )
                 raise
@@ -771,6 +881,8 @@ class TriggerFlowExecution(Generic[InputT, StreamT, ResultT]):
                 value = self._runtime_data[key]
             case "append":
                 self._runtime_data.append(key, value)
+                if self._get_checkpoint_store() is not None:
+                    self._checkpoint_changes.append(("append", key, value))
                 value = self._runtime_data[key]
             case "del":
                 if self._runtime_data.get(key, None):
@@ -778,6 +890,8 @@ class TriggerFlowExecution(Generic[InputT, StreamT, ResultT]):
                     value = None
                 else:
                     return
+        if operation != "append" and self._get_checkpoint_store() is not None:
+            self._checkpoint_changes.append(("del", key, None) if operation == "del" else ("set", key, value))
         if emit:
             if key in handlers:
                 futures.append(
@@ -0,0 +1,223 @@
+# Copyright 2023-2026 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import asyncio
+import warnings
+from pathlib import Path
+from collections import OrderedDict
+from collections.abc import Iterator, MutableMapping
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from agently.utils import Settings
+    from .Execution import TriggerFlowExecution
+
+from .Control import (
+    TRIGGER_FLOW_STATUS_CANCELLED,
+    TRIGGER_FLOW_STATUS_COMPLETED,
+    TRIGGER_FLOW_STATUS_FAILED,
+)
+
+TRIGGER_FLOW_FINISHED_STATUSES = frozenset(
+    {
+        TRIGGER_FLOW_STATUS_COMPLETED,
+        TRIGGER_FLOW_STATUS_FAILED,
+        TRIGGER_FLOW_STATUS_CANCELLED,
+    }
+)
+
+
+class TriggerFlowExecutionRegistry(MutableMapping[str, "TriggerFlowExecution"]):
+    """
+    Executions of one TriggerFlow by id, with retention of finished executions driven by
+    `runtime.trigger_flow_execution_retention` in the flow settings:
+
+    - `evict_on_finish`: drop an execution as soon as it completes, fails or is cancelled.
+    - `ttl`: drop finished executions not accessed for `ttl` seconds.
+    - `max_count`: keep at most `max_count` finished executions, least recently accessed
+      are dropped first.
+    - `spill_dir`: `save()` evicted executions to `<spill_dir>/<execution_id>.json` so
+      `TriggerFlow.get_execution()` can still restore them.
+
+    Running and waiting executions are never evicted, they still receive flow_data signals
+    and may be resumed. A finished execution with signals still being dispatched (side
+    branches running after the result was set) is evicted once it becomes idle, and spills
+    are written off the event loop.
+    """
+
+    def __init__(self, settings: "Settings"):
+        self._settings = settings
+        self._executions: dict[str, "TriggerFlowExecution"] = {}
+        # Finished execution id -> last access time, least recently accessed first
+        self._finished: OrderedDict[str, float] = OrderedDict()
+        # Finished execution id -> eviction reason, waiting for in-flight signals to settle
+        self._evict_when_idle: dict[str, str] = {}
+        # Evicted executions whose spill file is still being written
+        self._spilling: dict[str, "TriggerFlowExecution"] = {}
+        self._spill_tasks: set[asyncio.Task] = set()
+        # Executions restored from a spill file, already finished so `evict_on_finish` skips them
+        self._restored_ids: set[str] = set()
+        self._evicted = {"finish": 0, "ttl": 0, "max_count": 0}
+        self._spilled = 0
+        self._spill_failed = 0
+        self._restored = 0
+
+    def __getitem__(self, execution_id: str) -> "TriggerFlowExecution":
+        execution = self._executions[execution_id]
+        if execution_id in self._finished:
+            self._finished[execution_id] = time.monotonic()
+            self._finished.move_to_end(execution_id)
+        return execution
+
+    def __setitem__(self, execution_id: str, execution: "TriggerFlowExecution"):
+        self._executions[execution_id] = execution
+        self._finished.pop(execution_id, None)
+        if execution.get_status() in TRIGGER_FLOW_FINISHED_STATUSES:
+            self.mark_status(execution)
+        else:
+            self._enforce()
+
+    def __delitem__(self, execution_id: str):
+        del self._executions[execution_id]
+        self._finished.pop(execution_id, None)
+        self._evict_when_idle.pop(execution_id, None)
+        self._restored_ids.discard(execution_id)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._executions)
+
+    def __len__(self) -> int:
+        return len(self._executions)
+
+    def __contains__(self, execution_id: object) -> bool:
+        return execution_id in self._executions
+
+    def _get_policy(self) -> dict[str, Any]:
+        policy = self._settings.get("runtime.trigger_flow_execution_retention", {})
+        return policy if isinstance(policy, dict) else {}
+
+    def mark_status(self, execution: "TriggerFlowExecution"):
+        """Called on every status change of a registered execution."""
+        execution_id = execution.id
+        if self._executions.get(execution_id) is not execution:
+            return
+        if execution.get_status() not in TRIGGER_FLOW_FINISHED_STATUSES:
+            self._finished.pop(execution_id, None)
+            self._evict_when_idle.pop(execution_id, None)
+            return
+        self._finished[execution_id] = time.monotonic()
+        self._finished.move_to_end(execution_id)
+        if self._get_policy().get("evict_on_finish") and execution_id not in self._restored_ids:
+            self._evict(execution_id, reason="finish")
+        else:
+            self._enforce()
+
+    def _enforce(self):
+        if not self._finished:
+            return
+        policy = self._get_policy()
+        ttl = policy.get("ttl")
+        if ttl is not None:
+            expired_before = time.monotonic() - float(ttl)
+            while self._finished:
+                execution_id, accessed_at = next(iter(self._finished.items()))
+                if accessed_at > expired_before:
+                    break
+                self._evict(execution_id, reason="ttl")
+        max_count = policy.get("max_count")
+        if max_count is not None:
+            while len(self._finished) > max(0, int(max_count)):
+                self._evict(next(iter(self._finished)), reason="max_count")
+
+    def mark_idle(self, execution: "TriggerFlowExecution"):
+        """Called when a registered execution has no signal left in flight."""
+        reason = self._evict_when_idle.pop(execution.id, None)
+        if reason is not None and self._executions.get(execution.id) is execution:
+            self._evict(execution.id, reason=reason)
+
+    def _evict(self, execution_id: str, *, reason: str):
+        self._finished.pop(execution_id, None)
+        execution = self._executions.get(execution_id)
+        if execution is None:
+            return
+        if execution._in_flight > 0:
+            self._evict_when_idle[execution_id] = reason
+            return
+        del self._executions[execution_id]
+        self._restored_ids.discard(execution_id)
+        self._evicted[reason] += 1
+        spill_path = self.get_spill_path(execution_id)
+        if spill_path is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._spill(execution, spill_path)
+            return
+        self._spilling[execution_id] = execution
+        spill_task = loop.create_task(self._async_spill(execution, spill_path))
+        self._spill_tasks.add(spill_task)
+        spill_task.add_done_callback(self._spill_tasks.discard)
+
+    def _spill(self, execution: "TriggerFlowExecution", spill_path: Path):
+        try:
+            execution.save(spill_path)
+            self._spilled += 1
+        except Exception as e:
+            self._spill_failed += 1
+            warnings.warn(f"Can not spill TriggerFlow execution '{ execution.id }' to '{ spill_path }'.\nError: { e }")
+
+    async def _async_spill(self, execution: "TriggerFlowExecution", spill_path: Path):
+        try:
+            await asyncio.to_thread(self._spill, execution, spill_path)
+        finally:
+            self._spilling.pop(execution.id, None)
+
+    def get_spilling(self, execution_id: str) -> "TriggerFlowExecution | None":
+        """An evicted execution whose spill file is not written yet."""
+        return self._spilling.get(execution_id)
+
+    async def async_wait_spills(self):
+        """Wait until every pending spill file is written."""
+        while self._spill_tasks:
+            await asyncio.gather(*list(self._spill_tasks), return_exceptions=True)
+
+    def get_spill_path(self, execution_id: str) -> Path | None:
+        spill_dir = self._get_policy().get("spill_dir")
+        if not spill_dir:
+            return None
+        return Path(str(spill_dir)) / f"{ execution_id }.json"
+
+    def mark_restored(self, execution_id: str):
+        """Call before loading a spilled state, the restored execution stays until `ttl` or `max_count` evicts it."""
+        self._restored_ids.add(execution_id)
+        self._restored += 1
+
+    def sweep(self):
+        """Apply `ttl` and `max_count` now instead of on the next registration or finish."""
+        self._enforce()
+        return self
+
+    def get_stats(self) -> dict[str, Any]:
+        finished = len(self._finished)
+        return {
+            "live": len(self._executions) - finished,
+            "finished": finished,
+            "evicted": sum(self._evicted.values()),
+            "evicted_by": self._evicted.copy(),
+            "spilled": self._spilled,
+            "spill_failed": self._spill_failed,
+            "restored": self._restored,
+        }
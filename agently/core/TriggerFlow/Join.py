@@ -0,0 +1,85 @@
+# Copyright 2023-2026 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Hashable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from agently.types.trigger_flow import TriggerFlowRuntimeData
+
+from agently.types.data import EMPTY
+
+
+class _TriggerFlowJoinLayer:
+    __slots__ = ("values", "remaining")
+
+    def __init__(self, size: int):
+        self.values: list[Any] = [EMPTY] * size
+        self.remaining = size
+
+
+class TriggerFlowJoinCounter:
+    """
+    AND-join state of one operator in one execution: a countdown per layer with one slot per
+    joined signal. Recording an arrival is O(1), and the layer is removed when its last slot
+    arrives, so only that arrival gets the values and the continuation is emitted once.
+
+    A slot that arrives again before the join completes keeps its latest value.
+    """
+
+    __slots__ = ("_slot_indexes", "_size", "_layers")
+
+    def __init__(self, slot_indexes: dict[Hashable, int]):
+        self._slot_indexes = slot_indexes
+        self._size = len(slot_indexes)
+        self._layers: dict[str, _TriggerFlowJoinLayer] = {}
+
+    def arrive(self, layer_key: str, slot_key: Hashable, value: Any) -> list[Any] | None:
+        """Record `value` for `slot_key`, return the values in slot order once every slot arrived."""
+        slot_index = self._slot_indexes.get(slot_key)
+        if slot_index is None:
+            return None
+        layer = self._layers.get(layer_key)
+        if layer is None:
+            layer = self._layers[layer_key] = _TriggerFlowJoinLayer(self._size)
+        if layer.values[slot_index] is EMPTY:
+            layer.remaining -= 1
+        layer.values[slot_index] = value
+        if layer.remaining > 0:
+            return None
+        del self._layers[layer_key]
+        return layer.values
+
+
+def get_join_counter(
+    data: "TriggerFlowRuntimeData",
+    key: str,
+    slot_indexes: dict[Hashable, int],
+) -> TriggerFlowJoinCounter:
+    counter = data._system_runtime_data.get(key, inherit=False)
+    if not isinstance(counter, TriggerFlowJoinCounter):
+        counter = TriggerFlowJoinCounter(slot_indexes)
+        data._system_runtime_data.set(key, counter)
+    return counter
+
+
+def add_join_slot(slot_indexes: dict[Hashable, int], slot_key: Hashable):
+    slot_indexes.setdefault(slot_key, len(slot_indexes))
+
+
+def group_signal_values(slot_indexes: dict[Hashable, int], values: list[Any]):
+    """`{trigger_type: {trigger_event: value}}`, the value shape of `when(mode="and")`."""
+    grouped: dict[str, dict[str, Any]] = {}
+    for (trigger_type, trigger_event), value in zip(slot_indexes, values):
+        grouped.setdefault(trigger_type, {})[trigger_event] = value
+    return grouped
@@ -0,0 +1,110 @@
+# Copyright 2023-2026 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from typing import Any, Awaitable, Callable, Sequence, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from agently.types.trigger_flow import TriggerFlowRuntimeData
+
+from agently.utils import FunctionShifter
+
+TriggerFlowBatchHandler = Callable[
+    [list["TriggerFlowRuntimeData"]],
+    Sequence[Any] | Awaitable[Sequence[Any]],
+]
+
+
+class TriggerFlowMicroBatcher:
+    """
+    Gathers the signals that reach one `.to_batch()` operator of an execution and calls the
+    batch handler once per group of them.
+
+    A batch is sent when `max_size` items are waiting or `max_wait_ms` after its first item
+    arrived, whichever comes first. The handler gets the runtime data of every item and must
+    return one result per item in the same order. If it raises, every item of the batch fails
+    with that error.
+    """
+
+    def __init__(self, handler: TriggerFlowBatchHandler, *, max_size: int, max_wait_ms: float):
+        self._handler = FunctionShifter.asyncify(handler)
+        self.max_size = max(1, int(max_size))
+        self.max_wait = max(0.0, float(max_wait_ms)) / 1000
+        self._pending: list[tuple["TriggerFlowRuntimeData", asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self.batches = 0
+        self.items = 0
+
+    async def submit(self, data: "TriggerFlowRuntimeData"):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((data, future))
+        if len(self._pending) >= self.max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        task = asyncio.ensure_future(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple["TriggerFlowRuntimeData", asyncio.Future]]):
+        self.batches += 1
+        self.items += len(batch)
+        try:
+            results = await self._handler([data for data, _ in batch])
+            if isinstance(results, (str, bytes)) or not isinstance(results, Sequence) or len(results) != len(batch):
+                raise ValueError(
+                    f"TriggerFlow batch handler must return a sequence of { len(batch) } results, got: { type(results) }."
+                )
+        except BaseException as error:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            if not isinstance(error, Exception):
+                raise
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+def build_micro_batch_handler(
+    handler: TriggerFlowBatchHandler,
+    *,
+    operator_id: str,
+    result_trigger: str,
+    max_size: int,
+    max_wait_ms: float,
+):
+    async def send_to_batch(data: "TriggerFlowRuntimeData"):
+        batcher_key = f"micro_batchers.{ operator_id }"
+        batcher = data._system_runtime_data.get(batcher_key, inherit=False)
+        if not isinstance(batcher, TriggerFlowMicroBatcher):
+            batcher = TriggerFlowMicroBatcher(handler, max_size=max_size, max_wait_ms=max_wait_ms)
+            data._system_runtime_data.set(batcher_key, batcher)
+        result = await batcher.submit(data)
+        await data.async_emit(result_trigger, result, _layer_marks=data._layer_marks.copy())
+        return result
+
+    return send_to_batch
@@ -0,0 +1,105 @@
+# Copyright 2023-2026 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dataclasses import dataclass
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from agently.types.trigger_flow import TriggerFlowAllHandlers, TriggerFlowHandler
+    from .Definition import TriggerFlowDefinition
+
+TriggerFlowRouteKey = tuple[str, str]
+
+
+@dataclass(slots=True, frozen=True)
+class TriggerFlowRoute:
+    """
+    One handler listening to a signal, with its operator resolved and the static part of its
+    chunk run context meta built at compile time.
+    """
+
+    handler_id: str
+    handler: "TriggerFlowHandler"
+    operator: dict[str, Any] | None
+    chunk_meta: dict[str, Any] | None
+
+
+TriggerFlowRoutingTable = dict[TriggerFlowRouteKey, tuple[TriggerFlowRoute, ...]]
+
+
+def serialize_operator_signals(signals: Any):
+    if not isinstance(signals, list):
+        return []
+    serialized: list[dict[str, Any]] = []
+    for signal in signals:
+        if not isinstance(signal, dict):
+            continue
+        trigger_event = signal.get("trigger_event")
+        trigger_type = signal.get("trigger_type")
+        if not isinstance(trigger_event, str) or not isinstance(trigger_type, str):
+            continue
+        serialized_signal: dict[str, Any] = {
+            "trigger_event": trigger_event,
+            "trigger_type": trigger_type,
+        }
+        role = signal.get("role")
+        if isinstance(role, str):
+            serialized_signal["role"] = role
+        signal_id = signal.get("id")
+        if isinstance(signal_id, str):
+            serialized_signal["id"] = signal_id
+        serialized.append(serialized_signal)
+    return serialized
+
+
+def build_chunk_meta(operator: dict[str, Any]):
+    operator_kind = str(operator.get("kind", "chunk"))
+    return {
+        "chunk_id": str(operator.get("id", "")),
+        "chunk_name": str(operator.get("name") or operator_kind),
+        "operator_kind": operator_kind,
+        "group_id": operator.get("group_id"),
+        "group_kind": operator.get("group_kind"),
+        "parent_group_id": operator.get("parent_group_id"),
+        "parent_group_kind": operator.get("parent_group_kind"),
+        "listen_signals": serialize_operator_signals(operator.get("listen_signals")),
+        "emit_signals": serialize_operator_signals(operator.get("emit_signals")),
+    }
+
+
+def build_routing_table(
+    handlers: "TriggerFlowAllHandlers",
+    definition: "TriggerFlowDefinition",
+) -> TriggerFlowRoutingTable:
+    """Compile handler tables into `(trigger_type, trigger_event) -> routes`, one lookup per signal."""
+    chunk_metas: dict[str, dict[str, Any]] = {}
+    routing_table: TriggerFlowRoutingTable = {}
+    for trigger_type, events in handlers.items():
+        for trigger_event, event_handlers in events.items():
+            if not event_handlers:
+                continue
+            routes = []
+            for handler_id, handler in event_handlers.items():
+                try:
+                    operator = definition.get_operator(handler_id)
+                except KeyError:
+                    operator = None
+                chunk_meta = None
+                if operator is not None:
+                    if handler_id not in chunk_metas:
+                        chunk_metas[handler_id] = build_chunk_meta(operator)
+                    chunk_meta = chunk_metas[handler_id]
+                routes.append(TriggerFlowRoute(handler_id, handler, operator, chunk_meta))
+            routing_table[(trigger_type, trigger_event)] = tuple(routes)
+    return routing_table
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+import json
 import uuid
 import asyncio
 from pathlib import Path
@@ -32,6 +34,7 @@ from agently.types.data import RunContext
 from agently.utils import Settings, StateData, FunctionShifter
 from agently.core.runtime_context import resolve_parent_run_context
 from .BluePrint import TriggerFlowBluePrint
+from .ExecutionRegistry import TriggerFlowExecutionRegistry
 from .Process import TriggerFlowProcess
 from .Chunk import TriggerFlowChunk
 from .Contract import CONTRACT_UNSET, TriggerFlowContract, TriggerFlowContractSpec
@@ -65,8 +68,12 @@ class TriggerFlow(Generic[InputT, StreamT, ResultT]):
         )
         self._blue_print = blue_print if blue_print is not None else TriggerFlowBluePrint()
         self._skip_exceptions = skip_exceptions
-        self._executions: dict[str, "TriggerFlowExecution[InputT, StreamT, ResultT]"] = {}
+        self._executions = TriggerFlowExecutionRegistry(self.settings)
         self._contract = TriggerFlowContract[InputT, StreamT, ResultT]()
+        self._bind_methods()
+
+    def _bind_methods(self):
+        # Every attribute bound to this instance or its state, `_fork_isolated()` binds them again
         self.set_settings = self.settings.set_settings
         self.load_settings = self.settings.load
 
@@ -101,6 +108,7 @@ class TriggerFlow(Generic[InputT, StreamT, ResultT]):
         self.when = self._start_process.when
         self.to = self._start_process.to
         self.to_sub_flow = self._start_process.to_sub_flow
+        self.to_batch = self._start_process.to_batch
         self.side_branch = self._start_process.side_branch
         self.batch = self._start_process.batch
         self.for_each = self._start_process.for_each
@@ -298,6 +306,36 @@ class TriggerFlow(Generic[InputT, StreamT, ResultT]):
             if execution.id in self._executions:
                 del self._executions[execution.id]
 
+    def get_execution(
+        self,
+        execution_id: str,
+        default: "TriggerFlowExecution[InputT, StreamT, ResultT] | None" = None,
+    ) -> "TriggerFlowExecution[InputT, StreamT, ResultT] | None":
+        """
+        Get a registered execution, or restore an evicted one from
+        `runtime.trigger_flow_execution_retention.spill_dir` if it was spilled there.
+        """
+        if execution_id in self._executions:
+            return self._executions[execution_id]
+        spilling_execution = self._executions.get_spilling(execution_id)
+        if spilling_execution is not None:
+            return spilling_execution
+        spill_path = self._executions.get_spill_path(execution_id)
+        if spill_path is None or not spill_path.is_file():
+            return default
+        state = json.loads(spill_path.read_text(encoding="utf-8"))
+        # Restoring a finished execution must not roll back the flow's current flow_data
+        state["flow_data"] = self._flow_data.get(None, {}, inherit=False)
+        execution = self.create_execution()
+        # `load()` registers the execution under the spilled id, it must not be evicted again right away
+        self._executions.mark_restored(execution_id)
+        execution.load(state)
+        return execution
+
+    def get_execution_stats(self):
+        """Counts of live, finished, evicted, spilled and restored executions of this flow."""
+        return self._executions.sweep().get_stats()
+
     async def async_start_execution(
         self,
         initial_value: InputT | None,
@@ -341,7 +379,7 @@ class TriggerFlow(Generic[InputT, StreamT, ResultT]):
                     return
 
         if emit:
-            for execution in self._executions.values():
+            for execution in list(self._executions.values()):
                 handlers = execution._handlers["flow_data"]
                 if key in handlers:
                     futures.append(
@@ -519,6 +557,18 @@ class TriggerFlow(Generic[InputT, StreamT, ResultT]):
     def save_blue_print(self):
         return self._blue_print.copy()
 
+    def _fork_isolated(self):
+        """
+        Lightweight per-call copy of a frozen sub flow template. The blueprint, settings,
+        runtime resources and contract are shared read-only, flow_data is a copy-on-write
+        fork and executions are tracked separately.
+        """
+        fork = copy.copy(self)
+        fork._flow_data = StateData().fork_from(self._flow_data)
+        fork._executions = TriggerFlowExecutionRegistry(fork.settings)
+        fork._bind_methods()
+        return fork
+
     def load_blue_print(self, new_blue_print: TriggerFlowBluePrint):
         self._blue_print = new_blue_print
         self._contract = TriggerFlowContract[InputT, StreamT, ResultT]()
@@ -30,8 +30,11 @@ if TYPE_CHECKING:
         TriggerFlowSubFlowWriteBack,
     )
     from ..TriggerFlow import TriggerFlow
+    from ..MicroBatch import TriggerFlowBatchHandler
 
 from ..Chunk import TriggerFlowChunk
+from ..Join import add_join_slot, get_join_counter, group_signal_values
+from ..MicroBatch import build_micro_batch_handler
 from agently.types.data import EMPTY
 from agently.types.trigger_flow import TriggerFlowBlockData
 
@@ -250,7 +253,10 @@ class TriggerFlowBaseProcess:
         when_id = uuid.uuid4().hex
         when_trigger = f"When-{ when_id }"
         when_operator_id = f"when-{ when_id }"
-        values_template = copy.deepcopy(values)
+        join_slots: dict[Any, int] = {}
+        for trigger_type, trigger_event_dict in values.items():
+            for trigger_event in trigger_event_dict.keys():
+                add_join_slot(join_slots, (trigger_type, trigger_event))
 
         async def wait_trigger(data: "TriggerFlowRuntimeData"):
             match mode:
@@ -265,24 +271,19 @@ class TriggerFlowBaseProcess:
                         _layer_marks=data._layer_marks.copy(),
                     )
                 case "and":
-                    state_key = f"when_states.{ when_id }.{ self._layer_key(data) }"
-                    state = data._system_runtime_data.get(state_key)
-                    if not isinstance(state, dict):
-                        state = copy.deepcopy(values_template)
-                    if data.trigger_type in state and data.trigger_event in state[data.trigger_type]:
-                        state[data.trigger_type][data.trigger_event] = data.value
-                    data._system_runtime_data.set(state_key, state)
-                    for trigger_event_dict in state.values():
-                        for event_value in trigger_event_dict.values():
-                            if event_value is EMPTY:
-                                return
-
+                    join_counter = get_join_counter(data, f"when_joins.{ when_id }", join_slots)
+                    joined_values = join_counter.arrive(
+                        self._layer_key(data),
+                        (data.trigger_type, data.trigger_event),
+                        data.value,
+                    )
+                    if joined_values is None:
+                        return
                     await data.async_emit(
                         when_trigger,
-                        state,
+                        group_signal_values(join_slots, joined_values),
                         _layer_marks=data._layer_marks.copy(),
                     )
-                    del data._system_runtime_data[state_key]
 
         for trigger_type, trigger_event_dict in values.items():
             for trigger_event in trigger_event_dict.keys():
@@ -402,6 +403,60 @@ class TriggerFlowBaseProcess:
             **self._options,
         )
 
+    def to_batch(
+        self,
+        handler: "TriggerFlowBatchHandler",
+        *,
+        max_size: int = 16,
+        max_wait_ms: float = 10,
+        name: str | None = None,
+        side_branch: bool = False,
+    ):
+        """
+        Like `.to()`, but signals arriving from concurrent branches (e.g. inside `for_each`) are
+        grouped and `handler` is called once per group with a list of their runtime data. It must
+        return one result per item, each branch then continues with its own result.
+        """
+        operator_id = uuid.uuid4().hex
+        result_trigger = f"MicroBatch-{ operator_id }-Result"
+        callable_ref = self._blue_print._register_callable("chunk", handler, name=name, strict=False)
+        parent_group_id, parent_group_kind = self._current_definition_parent_group()
+        self._blue_print.add_handler(
+            self.trigger_type,
+            self.trigger_event,
+            build_micro_batch_handler(
+                handler,
+                operator_id=operator_id,
+                result_trigger=result_trigger,
+                max_size=max_size,
+                max_wait_ms=max_wait_ms,
+            ),
+            id=operator_id,
+        )
+        self._blue_print.definition.add_operator(
+            id=operator_id,
+            kind="micro_batch",
+            name=name if name is not None else getattr(handler, "__name__", operator_id),
+            handler_ref=callable_ref,
+            listen_signals=self._definition_signals,
+            emit_signals=[self._event_signal(result_trigger, role="continuation")],
+            options={"max_size": max_size, "max_wait_ms": max_wait_ms},
+            group_id=self._definition_group_id,
+            group_kind=self._definition_group_kind,
+            parent_group_id=parent_group_id,
+            parent_group_kind=parent_group_kind,
+        )
+        return self._new(
+            trigger_event=result_trigger if not side_branch else self.trigger_event,
+            trigger_type="event" if not side_branch else self.trigger_type,
+            blue_print=self._blue_print,
+            block_data=self._block_data,
+            definition_signals=[self._event_signal(result_trigger)] if not side_branch else self._definition_signals,
+            definition_group_id=self._definition_group_id,
+            definition_group_kind=self._definition_group_kind,
+            **self._options,
+        )
+
     def side_branch(
         self,
         chunk: "TriggerFlowChunk | TriggerFlowHandler",
@@ -424,7 +479,7 @@ class TriggerFlowBaseProcess:
         batch_trigger = f"Batch-{ batch_id }"
         batch_collect_operator_id = f"batch-collect-{ batch_id }"
         results_template: dict[str, Any] = {}
-        triggers_template: dict[str, bool] = {}
+        join_slots: dict[Any, int] = {}
         trigger_to_chunk_name = {}
         branch_input_signals: list[dict[str, Any]] = []
         branch_output_signals: list[dict[str, Any]] = []
@@ -433,26 +488,18 @@ class TriggerFlowBaseProcess:
         async def wait_all_chunks(data: "TriggerFlowRuntimeData"):
             if data.event not in trigger_to_chunk_name:
                 return
-            layer_key = self._layer_key(data)
-            state_key = f"batch_states.{ batch_id }.{ layer_key }"
-            state = data._system_runtime_data.get(state_key)
-            if not isinstance(state, dict):
-                state = {
-                    "results": copy.deepcopy(results_template),
-                    "triggers": triggers_template.copy(),
-                }
-            state["results"][trigger_to_chunk_name[data.event]] = data.value
-            state["triggers"][data.event] = True
-            data._system_runtime_data.set(state_key, state)
-            for done in state["triggers"].values():
-                if done is False:
-                    return
+            join_counter = get_join_counter(data, f"batch_joins.{ batch_id }", join_slots)
+            joined_values = join_counter.arrive(self._layer_key(data), data.event, data.value)
+            if joined_values is None:
+                return
+            results = results_template.copy()
+            for trigger, value in zip(join_slots, joined_values):
+                results[trigger_to_chunk_name[trigger]] = value
             await data.async_emit(
                 batch_trigger,
-                state["results"],
+                results,
                 _layer_marks=data._layer_marks.copy(),
             )
-            del data._system_runtime_data[state_key]
 
         for chunk in chunks:
             if isinstance(chunk, tuple):
@@ -463,7 +510,7 @@ class TriggerFlowBaseProcess:
                 if callable(chunk):
                     chunk = self._flow_chunk(chunk)
             typed_chunk = cast(TriggerFlowChunk, chunk)
-            triggers_template[typed_chunk.trigger] = False
+            add_join_slot(join_slots, typed_chunk.trigger)
             trigger_to_chunk_name[typed_chunk.trigger] = typed_chunk.name
             results_template[typed_chunk.name] = None
 
@@ -1,28 +1,273 @@
 # Copyright 2023-2026 AgentEra(Agently.Tech)
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
 #
 #     http://www.apache.org/licenses/LICENSE-2.0
 #
 # Unless required by applicable law or agreed to in writing, software
 # distributed under the License is distributed on an "AS IS" BASIS,
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
 
 import uuid
 import asyncio
-from typing import Sequence, TYPE_CHECKING
+from collections.abc import AsyncIterable, Generator, Iterator
+from typing import Any, Literal, Sequence, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from agently.types.trigger_flow import TriggerFlowRuntimeData
 
 from .BaseProcess import TriggerFlowBaseProcess
-from agently.types.data import EMPTY
 from agently.types.trigger_flow import TriggerFlowBlockData
-from agently.utils import StateDataNamespace
+from agently.utils import FunctionShifter
+
+TriggerFlowForEachOrder = Literal["input", "completion"]
+TriggerFlowForEachCollect = Literal["list", "stream"]
+
+# Items of one run in flight at once when `for_each()` has no `concurrency`
+DEFAULT_FOR_EACH_WINDOW = 1024
+
+
+class _ForEachRun:
+    """
+    State of one `for_each` run, kept in `_system_runtime_data` until the run is collected.
+
+    Only in-flight items are tracked, so a lazily pulled source does not leave one entry per
+    item behind. Results are kept for `collect="list"` only.
+    """
+
+    __slots__ = (
+        "order",
+        "collect",
+        "end_trigger",
+        "item_indexes",
+        "results",
+        "pending",
+        "next_stream_index",
+        "stream_lock",
+        "sent",
+        "completed",
+        "total",
+        "finished",
+    )
+
+    def __init__(self, *, order: TriggerFlowForEachOrder, collect: TriggerFlowForEachCollect, end_trigger: str):
+        self.order = order
+        self.collect = collect
+        self.end_trigger = end_trigger
+        self.item_indexes: dict[str, int] = {}
+        self.results: dict[int, Any] | list[Any] = {} if order == "input" else []
+        self.pending: dict[int, Any] = {}
+        self.next_stream_index = 0
+        self.stream_lock = asyncio.Lock()
+        self.sent = 0
+        self.completed = 0
+        self.total: int | None = None
+        self.finished = False
+
+    async def add_result(self, data: "TriggerFlowRuntimeData", index: int, value: Any):
+        if self.collect == "list":
+            if isinstance(self.results, dict):
+                self.results[index] = value
+            else:
+                self.results.append(value)
+        elif self.order == "completion":
+            await data.async_put_into_stream(value)
+        else:
+            # Reorder buffer: hold results until every earlier item was streamed
+            self.pending[index] = value
+            async with self.stream_lock:
+                while self.next_stream_index in self.pending:
+                    await data.async_put_into_stream(self.pending.pop(self.next_stream_index))
+                    self.next_stream_index += 1
+        self.completed += 1
+
+    def get_collected_value(self):
+        if self.collect == "stream":
+            return self.completed
+        if isinstance(self.results, dict):
+            return [self.results[index] for index in range(self.sent) if index in self.results]
+        return list(self.results)
+
+
+def _validate_for_each_options(order: str, collect: str):
+    if order not in ("input", "completion"):
+        raise ValueError(f"TriggerFlow for_each order must be 'input' or 'completion', got: { order !r}.")
+    if collect not in ("list", "stream"):
+        raise ValueError(f"TriggerFlow for_each collect must be 'list' or 'stream', got: { collect !r}.")
+
+
+async def _iterate_for_each_items(value: Any):
+    if not isinstance(value, str) and isinstance(value, Sequence):
+        for item in value:
+            yield item
+    elif isinstance(value, AsyncIterable):
+        async for item in value:
+            yield item
+    elif isinstance(value, Iterator):
+        # Pulled on a dedicated thread, so a blocking iterator (file, cursor, paged API) never stalls the loop
+        sync_items = FunctionShifter.asyncify_sync_generator(
+            value if isinstance(value, Generator) else (item for item in value)
+        )
+        try:
+            async for item in sync_items:
+                yield item
+        finally:
+            await sync_items.aclose()
+    else:
+        yield value
+
+
+async def _finish_for_each_run(
+    data: "TriggerFlowRuntimeData",
+    run: _ForEachRun,
+    state_key: str,
+    layer_marks: list[str],
+):
+    if run.finished or run.total is None or run.completed < run.total:
+        return
+    run.finished = True
+    data._system_runtime_data.pop(state_key)
+    await data.async_emit(run.end_trigger, run.get_collected_value(), layer_marks)
+
+
+def build_for_each_split_handler(
+    *,
+    send_item_trigger: str,
+    end_trigger: str,
+    semaphore_key: str,
+    concurrency: int | None = None,
+    order: TriggerFlowForEachOrder = "input",
+    collect: TriggerFlowForEachCollect = "list",
+):
+    """
+    Build the handler that pulls items from the input and sends them into the loop body.
+
+    Items are pulled only when a slot of the `concurrency` window is free, so sync and async
+    iterators are consumed lazily. Without `concurrency` each run has its own window of
+    `DEFAULT_FOR_EACH_WINDOW` items. Sync iterators are pulled on a dedicated worker thread.
+    """
+
+    async def send_items(data: "TriggerFlowRuntimeData"):
+        data.layer_in()
+        for_each_instance_id = data.layer_mark
+        assert for_each_instance_id is not None
+        state_key = f"for_each_states.{ for_each_instance_id }"
+        run = _ForEachRun(order=order, collect=collect, end_trigger=end_trigger)
+        data._system_runtime_data.set(state_key, run)
+
+        if concurrency is not None and concurrency > 0:
+            # Shared by every run of this for_each in the execution, like before
+            semaphore = data._system_runtime_data.get(semaphore_key, inherit=False)
+            if not isinstance(semaphore, asyncio.Semaphore):
+                semaphore = asyncio.Semaphore(concurrency)
+                data._system_runtime_data.set(semaphore_key, semaphore)
+        else:
+            # A long source must not create one task per item up front
+            semaphore = asyncio.Semaphore(DEFAULT_FOR_EACH_WINDOW)
+
+        in_flight: set[asyncio.Future] = set()
+        errors: list[BaseException] = []
+
+        def on_item_done(task: asyncio.Future):
+            in_flight.discard(task)
+            semaphore.release()
+            if not task.cancelled() and task.exception() is not None:
+                errors.append(task.exception())  # type: ignore[arg-type]
+
+        items = _iterate_for_each_items(data.value)
+        try:
+            while not errors:
+                await semaphore.acquire()
+                try:
+                    item = await items.__anext__()
+                except BaseException:
+                    semaphore.release()
+                    raise
+                data.layer_in()
+                item_id = data.layer_mark
+                assert item_id is not None
+                layer_marks = data._layer_marks.copy()
+                data.layer_out()
+                run.item_indexes[item_id] = run.sent
+                run.sent += 1
+                task = asyncio.ensure_future(data.async_emit(send_item_trigger, item, layer_marks))
+                in_flight.add(task)
+                task.add_done_callback(on_item_done)
+        except StopAsyncIteration:
+            pass
+        except BaseException:
+            for task in list(in_flight):
+                task.cancel()
+            raise
+        finally:
+            await items.aclose()
+
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+        if errors:
+            raise errors[0]
+
+        run.total = run.sent
+        data.layer_out()
+        await _finish_for_each_run(data, run, state_key, data._layer_marks.copy())
+
+    return send_items
+
+
+def build_for_each_collect_handler():
+    """Build the handler that takes the result of one item at the end of the loop body."""
+
+    async def collect_results(data: "TriggerFlowRuntimeData"):
+        for_each_instance_id = data.upper_layer_mark
+        item_id = data.layer_mark
+        assert for_each_instance_id is not None and item_id is not None
+        state_key = f"for_each_states.{ for_each_instance_id }"
+        run = data._system_runtime_data.get(state_key, inherit=False)
+        if not isinstance(run, _ForEachRun):
+            return
+        index = run.item_indexes.pop(item_id, None)
+        if index is None:
+            return
+        await run.add_result(data, index, data.value)
+        await _finish_for_each_run(data, run, state_key, data._layer_marks[:-2])
+
+    return collect_results
+
+
+def get_for_each_end_trigger(for_each_id: str):
+    return f"ForEach-{ for_each_id }-End"
 
 
 class TriggerFlowForEachProcess(TriggerFlowBaseProcess):
-    def for_each(self, *, concurrency: int | None = None):
+    def for_each(
+        self,
+        *,
+        concurrency: int | None = None,
+        order: TriggerFlowForEachOrder = "input",
+        collect: TriggerFlowForEachCollect = "list",
+    ):
+        """
+        Run the following chunks once per item of the current value until `.end_for_each()`.
+
+        The value can be a sequence, a sync iterator or an async iterable, anything else is
+        handled as a single item. With `concurrency`, at most that many items are in the loop
+        body at once and the next item is only pulled when one of them is done. Without it,
+        each run keeps at most `DEFAULT_FOR_EACH_WINDOW` items in flight. Sync iterators are
+        pulled on a worker thread, so a blocking iterator does not stall the event loop.
+
+        Args:
+            concurrency: Max items in flight, shared by every run of this for_each.
+            order: Order of the collected results, `"input"` keeps the order of the items and
+                `"completion"` the order their loop bodies finished in.
+            collect: `"list"` passes the list of results on after `.end_for_each()`. `"stream"`
+                puts every result into the runtime stream instead of keeping it, and passes on
+                the number of items.
+        """
+        _validate_for_each_options(order, collect)
         for_each_id = uuid.uuid4().hex
         for_each_block_data = TriggerFlowBlockData(
             outer_block=self._block_data,
@@ -35,51 +280,14 @@ class TriggerFlowForEachProcess(TriggerFlowBaseProcess):
         send_item_trigger = f"ForEach-{ for_each_id }-Send"
         split_operator_id = f"for_each-split-{ for_each_id }"
 
-        async def send_items(data: "TriggerFlowRuntimeData"):
-            data.layer_in()
-            for_each_instance_id = data.layer_mark
-            assert for_each_instance_id is not None
-
-            send_tasks = []
-
-            def prepare_item(item):
-                data.layer_in()
-                item_id = data.layer_mark
-                assert item_id is not None
-                layer_marks = data._layer_marks.copy()
-                data._system_runtime_data.set(f"for_each_results.{ for_each_instance_id }.{ item_id }", EMPTY)
-                data.layer_out()
-                return item_id, layer_marks, item
-
-            async def emit_item(item, layer_marks):
-                if concurrency is None or concurrency <= 0:
-                    await data.async_emit(
-                        send_item_trigger,
-                        item,
-                        layer_marks,
-                    )
-                else:
-                    semaphore_key = f"for_each_semaphores.{ for_each_id }"
-                    semaphore = data._system_runtime_data.get(semaphore_key, inherit=False)
-                    if not isinstance(semaphore, asyncio.Semaphore):
-                        semaphore = asyncio.Semaphore(concurrency)
-                        data._system_runtime_data.set(semaphore_key, semaphore)
-                    async with semaphore:
-                        await data.async_emit(
-                            send_item_trigger,
-                            item,
-                            layer_marks,
-                        )
-
-            if not isinstance(data.value, str) and isinstance(data.value, Sequence):
-                items = list(data.value)
-                for item in items:
-                    _, layer_marks, item_value = prepare_item(item)
-                    send_tasks.append(emit_item(item_value, layer_marks))
-                await asyncio.gather(*send_tasks)
-            else:
-                _, layer_marks, item_value = prepare_item(data.value)
-                await emit_item(item_value, layer_marks)
+        send_items = build_for_each_split_handler(
+            send_item_trigger=send_item_trigger,
+            end_trigger=get_for_each_end_trigger(for_each_id),
+            semaphore_key=f"for_each_semaphores.{ for_each_id }",
+            concurrency=concurrency,
+            order=order,
+            collect=collect,
+        )
 
         self._blue_print.add_handler(
             self.trigger_type,
@@ -93,7 +301,7 @@ class TriggerFlowForEachProcess(TriggerFlowBaseProcess):
             name=f"for_each:{ for_each_id }",
             listen_signals=self._definition_signals,
             emit_signals=[self._event_signal(send_item_trigger, role="continuation")],
-            options={"concurrency": concurrency},
+            options={"concurrency": concurrency, "order": order, "collect": collect},
             group_id=for_each_id,
             group_kind="for_each",
             parent_group_id=self._definition_group_id,
@@ -115,37 +323,13 @@ class TriggerFlowForEachProcess(TriggerFlowBaseProcess):
             raise NotImplementedError("Cannot use .end_for_each() without .for_each().")
 
         for_each_id = self._block_data.data["for_each_id"]
-        end_for_each_trigger = f"ForEach-{ for_each_id }-End"
+        end_for_each_trigger = get_for_each_end_trigger(for_each_id)
         collect_operator_id = f"for_each-collect-{ for_each_id }"
 
-        async def collect_results(data: "TriggerFlowRuntimeData"):
-            for_each_instance_id = data.upper_layer_mark
-            item_id = data.layer_mark
-            assert for_each_instance_id is not None and item_id is not None
-
-            for_each_results = StateDataNamespace(data._system_runtime_data, "for_each_results")
-
-            if for_each_instance_id in for_each_results and item_id in for_each_results[for_each_instance_id]:
-                for_each_results.set(f"{ for_each_instance_id }.{ item_id }", data.value)
-
-                for value in for_each_results.get(for_each_instance_id, {}).values():
-                    if value is EMPTY:
-                        return
-
-                data.layer_out()
-                data.layer_out()
-
-                await data.async_emit(
-                    end_for_each_trigger,
-                    list(for_each_results[for_each_instance_id].values()),
-                    data._layer_marks.copy(),
-                )
-                for_each_results.delete(for_each_instance_id)
-
         self._blue_print.add_handler(
             self.trigger_type,
             self.trigger_event,
-            collect_results,
+            build_for_each_collect_handler(),
             id=collect_operator_id,
         )
         self._blue_print.definition.add_operator(
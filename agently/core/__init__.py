@@ -14,6 +14,7 @@
 
 from .PluginManager import PluginManager
 from .EventCenter import EventCenter, RuntimeEventEmitter
+from .EventDispatcher import RuntimeEventDispatcher
 from .Prompt import Prompt
 from .ExtensionHandlers import ExtensionHandlers
 from .ModelRequest import ModelRequest
@@ -71,6 +71,7 @@ from .event import (
     ErrorInfo,
     RunContext,
     RuntimeEvent,
+    LazyPayload,
     EventHook,
 )
 
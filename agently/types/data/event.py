@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import time
+import threading
 import traceback
 import uuid
 from typing import Any, Awaitable, Callable, Literal, TypeAlias
@@ -165,6 +166,40 @@ class RunContext(BaseModel):
         )
 
 
+class LazyPayload:
+    """
+    Runtime event payload built on first use.
+
+    Emit `payload=LazyPayload(build_payload)` when the payload is expensive. `EventCenter`
+    only calls `build_payload` if some receiving hook needs the payload; hooks registered
+    with `lazy_payload=True` receive it unresolved and read it with `event.get_payload()`.
+    """
+
+    __slots__ = ("_factory", "_value", "_resolved", "_lock")
+
+    def __init__(self, factory: Callable[[], Any]):
+        self._factory = factory
+        self._value: Any = None
+        self._resolved = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_resolved(self):
+        return self._resolved
+
+    def resolve(self) -> Any:
+        if not self._resolved:
+            with self._lock:
+                if not self._resolved:
+                    self._value = self._factory()
+                    self._resolved = True
+                    self._factory = None  # type: ignore
+        return self._value
+
+    def __repr__(self) -> str:
+        return f"LazyPayload(resolved={ self._resolved })"
+
+
 class RuntimeEvent(BaseModel):
     event_id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     event_type: str
@@ -177,8 +212,10 @@ class RuntimeEvent(BaseModel):
     meta: dict[str, Any] = Field(default_factory=dict)
     timestamp: int = Field(default_factory=lambda: int(time.time() * 1000))
 
+    # Events are shared by every hook (and kept by channel sinks) without copying.
     model_config = {
         "arbitrary_types_allowed": True,
+        "frozen": True,
     }
 
     @model_validator(mode="before")
@@ -193,5 +230,11 @@ class RuntimeEvent(BaseModel):
             return normalized
         return value
 
+    def get_payload(self) -> Any:
+        """Get the payload, resolving a `LazyPayload` if needed."""
+        if isinstance(self.payload, LazyPayload):
+            return self.payload.resolve()
+        return self.payload
+
 
 EventHook = Callable[[RuntimeEvent], None | Awaitable[None]]
@@ -37,7 +37,7 @@ class AgentlyRequestData(BaseModel):
     @field_validator("headers")
     @classmethod
     def fix_headers(cls, value: dict[str, str]):
-        value.update({"Connection": "close"})
+        value.setdefault("Connection", "close")
         return value
 
     @model_validator(mode="after")
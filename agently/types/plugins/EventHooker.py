@@ -16,12 +16,28 @@ from typing import TYPE_CHECKING, Protocol
 from agently.types.plugins import AgentlyPlugin
 
 if TYPE_CHECKING:
-    from agently.types.data import RuntimeEvent
+    from agently.types.data import RuntimeEvent, RuntimeEventLevel
 
 
 class EventHooker(AgentlyPlugin, Protocol):
+    """
+    **[Agently Plugin] Event Hooker**
+
+    Receives runtime events from `EventCenter`.
+
+    Optional attributes:
+    - `min_level`: only receive events at or above this level.
+    - `should_handle(event_type, level) -> bool`: dynamic interest check evaluated before the event
+      object is built, return False to make the event cost nothing for this hooker.
+    - `batch_handler(events)`: called with a list of events when `EventCenter` runs in dispatcher
+      mode and delivers several events to this hooker at once.
+    - `lazy_payload`: True if the handler reads payloads with `event.get_payload()`, so expensive
+      `LazyPayload` payloads are not built just for this hooker.
+    """
+
     name: str
     event_types: list[str] | None
+    min_level: "RuntimeEventLevel | None" = None
 
     @staticmethod
     def _on_register(): ...
@@ -80,6 +80,8 @@ StandardResizeHandler = Callable[
     ],
 ]
 
+LengthHandler = Callable[["ChatMessage"], int]
+
 # Backward-compatible aliases.
 ExecutionHandler = ResizeHandler
 StandardExecutionHandler = StandardResizeHandler
@@ -88,4 +90,5 @@ StandardExecutionHandler = StandardResizeHandler
 SessionAnalysisHandler = AnalysisHandler
 StandardSessionAnalysisHandler = StandardAnalysisHandler
 SessionResizeHandler = ResizeHandler
+SessionLengthHandler = LengthHandler
 StandardSessionResizeHandler = StandardResizeHandler
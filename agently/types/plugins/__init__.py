@@ -22,8 +22,10 @@ from .BuiltInTool import BuiltInTool
 from .Session import (
     AnalysisHandler,
     ExecutionHandler,
+    LengthHandler,
     ResizeHandler,
     SessionAnalysisHandler,
+    SessionLengthHandler,
     SessionResizeHandler,
     StandardExecutionHandler,
     StandardSessionAnalysisHandler,
@@ -18,6 +18,7 @@ import warnings
 from enum import Enum
 from typing import (
     Any,
+    Hashable,
     Literal,
     Mapping,
     Sequence,
@@ -231,6 +232,19 @@ class DataFormatter:
     def to_str(value: Any) -> str:
         return str(DataFormatter.sanitize(value))
 
+    @staticmethod
+    def to_hashable(value: Any) -> Hashable:
+        """Stable hashable key for a value of options: dicts become sorted tuples, unhashable leaves their repr."""
+        if isinstance(value, dict):
+            return tuple(sorted((str(k), DataFormatter.to_hashable(v)) for k, v in value.items()))
+        if isinstance(value, (list, tuple, set)):
+            return tuple(DataFormatter.to_hashable(item) for item in value)
+        try:
+            hash(value)
+            return value
+        except TypeError:
+            return repr(value)
+
     @staticmethod
     def from_schema_to_kwargs_format(input_schema: dict[str, Any] | None) -> "KwargsType | None":
         if input_schema and len(input_schema.keys()) > 0:
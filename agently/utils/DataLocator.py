@@ -14,11 +14,18 @@
 
 import re
 import json5
-from typing import Literal, Any, Mapping, Sequence, TYPE_CHECKING
+from functools import lru_cache
+from typing import Literal, Any, Callable, Mapping, Sequence, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from agently.types.data import PromptOutputStructure
 
+# Path step kinds, see `DataLocator._compile_path_steps`.
+_KEY = 0
+_INDEX = 1
+_KEY_OR_INDEX = 2
+_EACH = 3
+
 
 class DataLocator:
     @staticmethod
@@ -36,105 +43,120 @@ class DataLocator:
         return False
 
     @staticmethod
-    def _locate_path_parts(
+    @lru_cache(maxsize=1024)
+    def _compile_path_steps(path: str, style: Literal["dot", "slash"]) -> tuple[tuple[int, Any], ...] | None:
+        """Parse a path into `(step kind, value)` tuples, None if the path can never match."""
+        steps: list[tuple[int, Any]] = []
+        if style == "dot":
+            for path_part in path.split("."):
+                if "[" in path_part:
+                    path_key, path_index = path_part.split("[", 1)
+                    path_index = path_index[:-1]
+                    if path_key:
+                        steps.append((_KEY, path_key))
+                    if path_index in ("*", ""):
+                        steps.append((_EACH, None))
+                        continue
+                    try:
+                        steps.append((_INDEX, int(path_index)))
+                    except Exception:
+                        return None
+                else:
+                    steps.append((_KEY, path_part))
+        else:
+            for path_part in path.split("/"):
+                if not path_part:
+                    continue
+                if path_part.startswith("[") and path_part.endswith("]"):
+                    path_part = path_part[1:-1]
+                if path_part in ("*", ""):
+                    steps.append((_EACH, None))
+                else:
+                    steps.append((_KEY_OR_INDEX, path_part))
+        return tuple(steps)
+
+    @staticmethod
+    def _locate_path_steps(
         result: Any,
-        path_parts: list[str],
-        *,
-        style: Literal["dot", "slash"],
+        steps: tuple[tuple[int, Any], ...],
+        start: int,
         default: Any,
     ):
-        if not path_parts:
-            return result
-        path_part = path_parts[0]
-        remaining = path_parts[1:]
-        if style == "dot":
-            if "[" in path_part:
-                path_key_and_index = path_part.split("[", 1)
-                path_key = path_key_and_index[0]
-                path_index = path_key_and_index[1][:-1]
-                if path_key:
-                    if isinstance(result, Mapping):
-                        result = result.get(path_key, default)
-                    else:
-                        return default
-                elif not DataLocator._is_structure_sequence(result):
+        for position in range(start, len(steps)):
+            kind, value = steps[position]
+            if kind == _KEY:
+                if type(result) is dict or isinstance(result, Mapping):
+                    result = result.get(value, default)
+                else:
                     return default
-                if path_index in ("*", ""):
-                    if DataLocator._is_structure_sequence(result):
-                        values = []
-                        for item in result:
-                            value = DataLocator._locate_path_parts(
-                                item,
-                                remaining,
-                                style=style,
-                                default=default,
-                            )
-                            if value is default:
-                                return default
-                            values.append(value)
-                        return values
+            elif kind == _INDEX:
+                if not DataLocator._is_structure_sequence(result):
                     return default
                 try:
-                    index = int(path_index)
+                    result = result[value]
                 except Exception:
                     return default
-                if DataLocator._is_structure_sequence(result):
+            elif kind == _KEY_OR_INDEX:
+                if type(result) is dict or isinstance(result, Mapping):
+                    result = result.get(value, default)
+                elif DataLocator._is_structure_sequence(result):
                     try:
-                        return DataLocator._locate_path_parts(
-                            result[index],
-                            remaining,
-                            style=style,
-                            default=default,
-                        )
+                        result = result[int(value)]
                     except Exception:
                         return default
-                return default
+                else:
+                    return default
             else:
-                if isinstance(result, Mapping):
-                    return DataLocator._locate_path_parts(
-                        result.get(path_part, default),
-                        remaining,
-                        style=style,
-                        default=default,
-                    )
-                return default
-        else:
-            if path_part.startswith("[") and path_part.endswith("]"):
-                path_part = path_part[1:-1]
-
-            if path_part in ("*", ""):
-                if DataLocator._is_structure_sequence(result):
-                    values = []
-                    for item in result:
-                        value = DataLocator._locate_path_parts(
-                            item,
-                            remaining,
-                            style=style,
-                            default=default,
-                        )
-                        if value is default:
-                            return default
-                        values.append(value)
-                    return values
-                return default
-            if isinstance(result, Mapping):
-                return DataLocator._locate_path_parts(
-                    result.get(path_part, default),
-                    remaining,
-                    style=style,
-                    default=default,
-                )
-            if DataLocator._is_structure_sequence(result):
-                try:
-                    return DataLocator._locate_path_parts(
-                        result[int(path_part)],
-                        remaining,
-                        style=style,
-                        default=default,
-                    )
-                except Exception:
+                if not DataLocator._is_structure_sequence(result):
                     return default
-            return default
+                values = []
+                for item in result:
+                    item_value = DataLocator._locate_path_steps(item, steps, position + 1, default)
+                    if item_value is default:
+                        return default
+                    values.append(item_value)
+                return values
+        return result
+
+    @staticmethod
+    def compile_path(
+        path: str,
+        style: Literal["dot", "slash"] = "dot",
+        *,
+        default: Any = None,
+    ) -> Callable[[Any], Any]:
+        """
+        Parse `path` once and return a locator function with the same results as
+        `locate_path_in_dict(data, path, style, default=default)`.
+
+        Use it when the same path is located in many objects, like content mappings
+        applied to every streaming chunk.
+        """
+        if path == "" or not isinstance(path, str):
+            return lambda data: data
+        steps = DataLocator._compile_path_steps(path, "slash" if style == "slash" else "dot")
+        if steps is None:
+            return lambda data: default
+        if all(kind == _KEY for kind, _ in steps):
+            keys = tuple(value for _, value in steps)
+
+            def locate_keys(data: Any):
+                for key in keys:
+                    if type(data) is dict or isinstance(data, Mapping):
+                        data = data.get(key, default)
+                    else:
+                        return default
+                return data
+
+            return locate_keys
+
+        def locate(data: Any):
+            try:
+                return DataLocator._locate_path_steps(data, steps, 0, default)
+            except Exception:
+                return default
+
+        return locate
 
     @staticmethod
     def locate_path_in_dict(
@@ -146,29 +168,15 @@ class DataLocator:
     ):
         if path == "" or not isinstance(path, str):
             return original_dict
-        match style:
-            case "dot":
-                try:
-                    path_parts = path.split(".")
-                    return DataLocator._locate_path_parts(
-                        original_dict,
-                        path_parts,
-                        style="dot",
-                        default=default,
-                    )
-                except Exception:
-                    return default
-            case "slash":
-                try:
-                    path_parts = [part for part in path.split("/") if part]
-                    return DataLocator._locate_path_parts(
-                        original_dict,
-                        path_parts,
-                        style="slash",
-                        default=default,
-                    )
-                except Exception:
-                    return default
+        if style not in ("dot", "slash"):
+            return None
+        try:
+            steps = DataLocator._compile_path_steps(path, style)
+            if steps is None:
+                return default
+            return DataLocator._locate_path_steps(original_dict, steps, 0, default)
+        except Exception:
+            return default
 
     @staticmethod
     def locate_all_json(original_text: str) -> list[str]:
@@ -0,0 +1,153 @@
+# Copyright 2023-2026 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+
+class EventLoopRunner:
+    """
+    Long-lived background event loops that sync entry points submit coroutines to.
+
+    Running every sync call through `asyncio.run` creates and tears down an event loop,
+    and often an OS thread, per call, and throws away every loop-bound resource such as
+    pooled HTTP clients and MCP sessions. The runner keeps `size` loops alive in daemon
+    threads instead, so sync calls reuse the same loop and its pooled connections.
+
+    - Loops start lazily on the first submit.
+    - Each calling thread sticks to one loop (assigned round-robin), so resources a thread
+      creates through sync calls stay on the same loop.
+    - A coroutine running on a runner loop must not block on `run()`, that would deadlock
+      the loop it waits on. Check `is_runner_thread()` first.
+    - `shutdown()` lets pending tasks finish for up to `shutdown_timeout` seconds, cancels
+      the rest, then stops and closes the loops. Later submits start new loops.
+    """
+
+    def __init__(self, size: int = 1, *, shutdown_timeout: float = 1.0):
+        self.size = max(1, int(size))
+        self.shutdown_timeout = shutdown_timeout
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._loops: list[tuple[asyncio.AbstractEventLoop, threading.Thread] | None] = [None] * self.size
+        self._next_index = 0
+        self._started = 0
+        self._submitted = 0
+
+    def _run_loop(self, loop: asyncio.AbstractEventLoop):
+        self._local.runner_loop = loop
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        index = getattr(self._local, "index", None)
+        with self._lock:
+            if index is None:
+                index = self._next_index % self.size
+                self._next_index += 1
+                self._local.index = index
+            started = self._loops[index]
+            if started is not None and not started[0].is_closed():
+                return started[0]
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=self._run_loop,
+                args=(loop,),
+                name=f"AgentlyEventLoop-{ index }",
+                daemon=True,
+            )
+            thread.start()
+            self._loops[index] = (loop, thread)
+            self._started += 1
+            return loop
+
+    def is_runner_thread(self) -> bool:
+        """Whether the current thread is running one of this runner's loops."""
+        return getattr(self._local, "runner_loop", None) is not None
+
+    def submit(self, coroutine: Coroutine[Any, Any, T]) -> Future[T]:
+        """Schedule `coroutine` on the calling thread's runner loop and return its future."""
+        loop = self._get_loop()
+        self._submitted += 1
+        return asyncio.run_coroutine_threadsafe(coroutine, loop)
+
+    def run(self, coroutine: Coroutine[Any, Any, T], *, timeout: float | None = None) -> T:
+        """
+        Run `coroutine` on a runner loop and block until it returns.
+
+        If the wait is interrupted (timeout, KeyboardInterrupt), the coroutine is canceled.
+        """
+        if self.is_runner_thread():
+            coroutine.close()
+            raise RuntimeError("EventLoopRunner.run() can not be called from a runner loop thread.")
+        future = self.submit(coroutine)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    @staticmethod
+    async def _drain(timeout: float):
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks() if task is not current]
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=timeout)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending, timeout=timeout)
+        await asyncio.get_running_loop().shutdown_asyncgens()
+
+    def shutdown(self, timeout: float | None = None):
+        """Stop and close every started loop. Safe to call more than once."""
+        timeout = self.shutdown_timeout if timeout is None else timeout
+        with self._lock:
+            started = [item for item in self._loops if item is not None]
+            self._loops = [None] * self.size
+        for loop, thread in started:
+            if loop.is_closed():
+                continue
+            if thread is threading.current_thread():
+                loop.call_soon(loop.stop)
+                continue
+            try:
+                asyncio.run_coroutine_threadsafe(self._drain(timeout), loop).result(timeout * 2 + 1)
+            except BaseException:
+                pass
+            try:
+                loop.call_soon_threadsafe(loop.stop)
+            except RuntimeError:
+                continue
+            thread.join(timeout + 1)
+            if not thread.is_alive():
+                loop.close()
+
+    def _reset_after_fork(self):
+        # Runner threads do not survive fork, their loops belong to the parent process.
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._loops = [None] * self.size
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "size": self.size,
+                "live": sum(1 for item in self._loops if item is not None and item[1].is_alive()),
+                "started": self._started,
+                "submitted": self._submitted,
+            }
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import queue
+import os
 import asyncio
 import threading
 from functools import wraps
@@ -20,6 +20,9 @@ from functools import wraps
 import inspect
 from typing import Any, Callable, Coroutine, Awaitable, TypeVar, ParamSpec, Generator, AsyncGenerator
 from asyncio import Future
+from concurrent.futures import ThreadPoolExecutor
+
+from .EventLoopRunner import EventLoopRunner
 
 T = TypeVar("T")
 R = TypeVar("R")
@@ -27,9 +30,7 @@ P = ParamSpec("P")
 
 
 class FunctionShifter:
-    _future_loop = None
-    _future_thread = None
-    _future_lock = threading.Lock()
+    loop_runner = EventLoopRunner()
 
     @staticmethod
     def run_async_func_in_thread(func, *args, **kwargs):
@@ -55,14 +56,10 @@ class FunctionShifter:
 
             @wraps(func)
             def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-                try:
-                    loop = asyncio.get_running_loop()
-                except RuntimeError:
-                    # No running loop, safe to use asyncio.run
-                    return asyncio.run(func(*args, **kwargs))
-                else:
-                    # Running loop exists, move coroutine to thread
+                if FunctionShifter.loop_runner.is_runner_thread():
+                    # Called from a coroutine on the runner loop, waiting on that loop would deadlock
                     return FunctionShifter.run_async_func_in_thread(func, *args, **kwargs)
+                return FunctionShifter.loop_runner.run(func(*args, **kwargs))
 
             return wrapper
         else:
@@ -91,14 +88,8 @@ class FunctionShifter:
             try:
                 loop = asyncio.get_running_loop()
             except RuntimeError:
-                if FunctionShifter._future_thread is None or FunctionShifter._future_loop is None:
-                    with FunctionShifter._future_lock:
-                        if FunctionShifter._future_thread is None or FunctionShifter._future_loop is None:
-                            FunctionShifter._future_loop = asyncio.new_event_loop()
-                            FunctionShifter._future_thread = threading.Thread(
-                                target=FunctionShifter._future_loop.run_forever, daemon=True
-                            ).start()
-                loop = FunctionShifter._future_loop
+                # No caller loop to bind to, run on the background loop and return a thread-safe future
+                return FunctionShifter.loop_runner.submit(async_func(*args, **kwargs))  # type: ignore
 
             future = asyncio.ensure_future(async_func(*args, **kwargs), loop=loop)
             exception = future.add_done_callback(lambda t: t.exception())
@@ -110,89 +101,43 @@ class FunctionShifter:
 
     @staticmethod
     def syncify_async_generator(async_gen: AsyncGenerator[R, Any]) -> Generator[R, Any, Any]:
+        from .GeneratorConsumer import GeneratorConsumer
 
-        q: "queue.Queue" = queue.Queue()
-        SENTINEL = object()
-
-        async def _consume():
-            try:
-                async for item in async_gen:
-                    q.put(("item", item))
-            except Exception as e:
-                q.put(("error", e))
-            finally:
-                q.put(("end", SENTINEL))
-
-        def _runner():
-            loop = asyncio.new_event_loop()
-            try:
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(_consume())
-            finally:
-                loop.close()
-                asyncio.set_event_loop(None)
-
-        thread = threading.Thread(target=_runner, daemon=True)
-        thread.start()
-
+        consumer = GeneratorConsumer(async_gen, history=False)
+        sync_gen = consumer.get_generator()
         try:
-            while True:
-                kind, payload = q.get()
-                if kind == "item":
-                    yield payload
-                elif kind == "error":
-                    raise payload
-                elif kind == "end":
-                    break
+            yield from sync_gen
         finally:
-            thread.join()
+            sync_gen.close()
+            # Stops the source if the caller left early, no-op once it is exhausted
+            consumer.cancel()
 
     @staticmethod
     def asyncify_sync_generator(sync_gen: Generator[R, Any, Any]) -> AsyncGenerator[R, Any]:
         SENTINEL = object()
 
+        def _next():
+            try:
+                return next(sync_gen)
+            except StopIteration:
+                return SENTINEL
+
         async def _wrapper():
-            q: "asyncio.Queue[tuple[str, Any]]" = asyncio.Queue()
             loop = asyncio.get_running_loop()
-            stop_event = threading.Event()
-
-            def _put(kind: str, payload: Any):
-                try:
-                    loop.call_soon_threadsafe(q.put_nowait, (kind, payload))
-                except RuntimeError:
-                    pass
-
-            def _consume():
-                try:
-                    while not stop_event.is_set():
-                        item = next(sync_gen)
-                        _put("item", item)
-                except StopIteration:
-                    pass
-                except Exception as e:
-                    _put("error", e)
-                finally:
-                    try:
-                        sync_gen.close()
-                    except Exception:
-                        pass
-                    _put("end", SENTINEL)
-
-            thread = threading.Thread(target=_consume, daemon=True)
-            thread.start()
-
+            # One dedicated thread per generator: thread-bound generators (sqlite cursors, threading.local)
+            # keep working and blocked steps never hold threads of the default executor. Steps are pulled
+            # one at a time, results come back to the loop through `call_soon_threadsafe`.
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="agently-sync-generator")
             try:
                 while True:
-                    kind, payload = await q.get()
-                    if kind == "item":
-                        yield payload
-                    elif kind == "error":
-                        raise payload
-                    elif kind == "end":
+                    item = await loop.run_in_executor(executor, _next)
+                    if item is SENTINEL:
                         break
+                    yield item
             finally:
-                stop_event.set()
-                await asyncio.to_thread(thread.join)
+                # Queued behind a step still running after cancellation, so it never closes a running generator
+                await loop.run_in_executor(executor, sync_gen.close)
+                executor.shutdown(wait=False)
 
         return _wrapper()
 
@@ -220,3 +165,7 @@ class FunctionShifter:
             return result
 
         return _wrapper
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=FunctionShifter.loop_runner._reset_after_fork)
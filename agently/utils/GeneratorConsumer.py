@@ -12,11 +12,128 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+
+import sys
 import asyncio
 import threading
-import queue as sync_queue
+import weakref
+from collections import deque
 from types import AsyncGeneratorType, GeneratorType
-from typing import AsyncGenerator, Generator, cast, Any
+from typing import AsyncGenerator, Callable, Generator, Literal, cast, Any
+
+
+def _set_if_pending(future: asyncio.Future):
+    if not future.done():
+        future.set_result(None)
+
+
+def _wake(future: asyncio.Future | None):
+    """Resolve a waiter future from any thread."""
+    if future is None or future.done():
+        return
+    loop = future.get_loop()
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+    if running_loop is loop:
+        future.set_result(None)
+        return
+    try:
+        loop.call_soon_threadsafe(_set_if_pending, future)
+    except RuntimeError:
+        # Waiter loop is closed, nobody is waiting anymore
+        pass
+
+
+def _approximate_size(value: Any, depth: int = 2) -> int:
+    size = sys.getsizeof(value)
+    if depth <= 0 or isinstance(value, (str, bytes, bytearray)):
+        return size
+    if isinstance(value, dict):
+        return size + sum(
+            _approximate_size(key, depth - 1) + _approximate_size(item, depth - 1) for key, item in value.items()
+        )
+    if isinstance(value, (list, tuple, set, frozenset, deque)):
+        return size + sum(_approximate_size(item, depth - 1) for item in value)
+    return size
+
+
+class _Subscription:
+    """
+    Message buffer of one subscriber.
+
+    The producer writes from its own loop and the subscriber reads from its loop or from
+    a plain thread. Waiting sides park on a future of their own loop or on the condition,
+    and the other side wakes them with `call_soon_threadsafe` or `notify`.
+    """
+
+    def __init__(self, maxsize: int | None, overflow: Literal["block", "drop"] = "block"):
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.dropped = 0
+        self.buffer: deque = deque()
+        self.condition = threading.Condition()
+        self.closed = False
+        self._getter: asyncio.Future | None = None
+        self._putter: asyncio.Future | None = None
+
+    def _append(self, msg: Any):
+        self.buffer.append(msg)
+        self.condition.notify()
+        getter, self._getter = self._getter, None
+        _wake(getter)
+
+    def _pop(self):
+        msg = self.buffer.popleft()
+        putter, self._putter = self._putter, None
+        _wake(putter)
+        return msg
+
+    def put_nowait(self, msg: Any):
+        """Append ignoring `maxsize`, used for history replay and end markers."""
+        with self.condition:
+            if not self.closed:
+                self._append(msg)
+
+    async def put(self, msg: Any):
+        while True:
+            with self.condition:
+                if self.closed:
+                    return
+                if self.maxsize is None or len(self.buffer) < self.maxsize:
+                    self._append(msg)
+                    return
+                if self.overflow == "drop":
+                    self.buffer.popleft()
+                    self.dropped += 1
+                    self._append(msg)
+                    return
+                putter = asyncio.get_running_loop().create_future()
+                self._putter = putter
+            await putter
+
+    async def get(self):
+        while True:
+            with self.condition:
+                if self.buffer:
+                    return self._pop()
+                getter = asyncio.get_running_loop().create_future()
+                self._getter = getter
+            await getter
+
+    def get_sync(self):
+        with self.condition:
+            while not self.buffer:
+                self.condition.wait()
+            return self._pop()
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.buffer.clear()
+            putter, self._putter = self._putter, None
+            _wake(putter)
 
 
 class GeneratorConsumer:
@@ -24,14 +141,34 @@ class GeneratorConsumer:
     A utility to wrap a Generator or AsyncGenerator and allow multiple
     asynchronous or synchronous consumers to subscribe to its output,
     with history replay, error propagation, and graceful shutdown.
+
+    The source is consumed by one task on one event loop: the loop of the first async
+    subscriber, or the shared background loop of `FunctionShifter.loop_runner` when a
+    sync subscriber comes first. Subscribers on other loops or threads are fed through
+    thread-safe wakeups, so a sync subscriber costs no thread and no event loop.
     """
 
-    def __init__(self, original_generator: AsyncGenerator | Generator):
+    def __init__(
+        self,
+        original_generator: AsyncGenerator | Generator,
+        *,
+        history: bool | int = True,
+        history_filter: Callable[[Any], bool] | None = None,
+        buffer_size: int | None = None,
+        overflow: Literal["block", "drop"] = "block",
+    ):
         """
         Initialize the consumer with a generator or async generator.
 
         Args:
             original_generator: The original generator to consume.
+            history: Replay policy for late subscribers and `get_result()`. True keeps every
+                message, False keeps none, an int keeps the last N messages.
+            history_filter: Only messages it returns True for are kept in history. Every
+                message is still sent to live subscribers.
+            buffer_size: Max messages buffered per subscriber. None means unbounded.
+            overflow: What happens when a subscriber's buffer is full. "block" makes the
+                producer wait for that subscriber, "drop" discards its oldest buffered message.
 
         Raises:
             TypeError: If input is neither Generator nor AsyncGenerator.
@@ -44,14 +181,24 @@ class GeneratorConsumer:
             raise TypeError(f"Expected Generator or AsyncGenerator, got: {original_generator}")
 
         self.original_generator = original_generator
-        self._history: list = []
-        self._listeners: list[asyncio.Queue] = []
+        if history is True:
+            self._history: list | deque = []
+        else:
+            self._history = deque(maxlen=max(0, int(history)))
+        self.history_limit = None if history is True else max(0, int(history))
+        self.history_filter = history_filter
+        self.buffer_size = buffer_size if buffer_size is None or buffer_size > 0 else None
+        self.overflow: Literal["block", "drop"] = overflow
+        self._dropped = 0
+        self._listeners: list[_Subscription] = []
+        self._lock = threading.Lock()
         self._consume_task: asyncio.Task | None = None
-        self._done = asyncio.Event()
+        self._home_loop: asyncio.AbstractEventLoop | None = None
+        self._done = threading.Event()
+        self._done_waiters: list[asyncio.Future] = []
         self._sentinel = object()
         self._exception: Exception | None = None
         self._closed = False
-        self._closing_lock = asyncio.Lock()
         self._generator_closed = False
 
     async def _consume(self):
@@ -67,32 +214,99 @@ class GeneratorConsumer:
                     await self._broadcast(msg)
         except Exception as e:
             self._exception = e
-            await self._broadcast(e)
+            self._broadcast_end(e)
         finally:
-            self._done.set()
-            if not self._generator_closed:
-                await self._broadcast(self._sentinel)
-                self._generator_closed = True
+            self._finish()
 
     async def _broadcast(self, msg: Any):
         """
-        Broadcast a message to all listeners and store history if it's not an error or sentinel.
+        Broadcast a message to all listeners and store it in history.
 
         Args:
-            msg: The message, exception, or sentinel object to broadcast.
+            msg: The message to broadcast.
         """
-        if msg is not self._sentinel and not isinstance(msg, Exception):
-            self._history.append(msg)
-
-        for queue in self._listeners:
-            await queue.put(msg)
+        with self._lock:
+            if self.history_limit != 0 and (self.history_filter is None or self.history_filter(msg)):
+                self._history.append(msg)
+            listeners = list(self._listeners)
+
+        for listener in listeners:
+            await listener.put(msg)
+
+    def _broadcast_end(self, msg: Any):
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener.put_nowait(msg)
+
+    def _finish(self):
+        with self._lock:
+            if self._generator_closed:
+                return
+            self._generator_closed = True
+            self._done.set()
+            waiters, self._done_waiters = self._done_waiters, []
+        self._broadcast_end(self._sentinel)
+        for waiter in waiters:
+            _wake(waiter)
+
+    async def _wait_done(self):
+        with self._lock:
+            if self._done.is_set():
+                return
+            waiter = asyncio.get_running_loop().create_future()
+            self._done_waiters.append(waiter)
+        await waiter
 
     async def _ensure_started(self):
         """
-        Start the internal consumer task if it hasn't been started.
+        Start the internal consumer task on the running loop if it hasn't been started.
         """
-        if self._consume_task is None:
-            self._consume_task = asyncio.create_task(self._consume())
+        with self._lock:
+            if self._home_loop is not None:
+                return
+            self._home_loop = asyncio.get_running_loop()
+        self._consume_task = asyncio.create_task(self._consume())
+
+    def _ensure_started_from_sync(self):
+        from .FunctionShifter import FunctionShifter
+
+        if self._home_loop is not None:
+            return
+        runner = FunctionShifter.loop_runner
+        if not runner.is_runner_thread():
+            runner.run(self._ensure_started())
+            return
+
+        # The caller blocks a runner loop, so the source gets a loop of its own
+        started = threading.Event()
+
+        async def run_source():
+            await self._ensure_started()
+            started.set()
+            await self._wait_done()
+
+        threading.Thread(target=asyncio.run, args=(run_source(),), daemon=True).start()
+        started.wait()
+
+    def _subscribe(self) -> _Subscription:
+        listener = _Subscription(self.buffer_size, self.overflow)
+        with self._lock:
+            for msg in self._history:
+                listener.put_nowait(msg)
+            if self._exception:
+                listener.put_nowait(self._exception)
+            if self._done.is_set():
+                listener.put_nowait(self._sentinel)
+            self._listeners.append(listener)
+        return listener
+
+    def _unsubscribe(self, listener: _Subscription):
+        listener.close()
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+                self._dropped += listener.dropped
 
     async def get_async_generator(self) -> AsyncGenerator:
         """
@@ -105,28 +319,18 @@ class GeneratorConsumer:
         if self._closed:
             raise RuntimeError("GeneratorConsumer has been closed.")
 
-        await self._ensure_started()
-        queue = asyncio.Queue()
-        self._listeners.append(queue)
-
+        listener = self._subscribe()
         try:
-            for msg in self._history:
-                await queue.put(msg)
-
-            if self._exception:
-                await queue.put(self._exception)
-            elif self._done.is_set():
-                await queue.put(self._sentinel)
-
+            await self._ensure_started()
             while True:
-                msg = await queue.get()
+                msg = await listener.get()
                 if msg is self._sentinel:
                     break
                 if isinstance(msg, Exception):
                     raise msg
                 yield msg
         finally:
-            self._listeners.remove(queue)
+            self._unsubscribe(listener)
 
     def get_generator(self) -> Generator:
         """
@@ -138,67 +342,80 @@ class GeneratorConsumer:
         if self._closed:
             raise RuntimeError("GeneratorConsumer has been closed.")
 
-        sync_q: sync_queue.Queue = sync_queue.Queue()
-
-        def run_bridge():
-            async def bridge():
-                await self._ensure_started()
-                queue = asyncio.Queue()
-                self._listeners.append(queue)
-
-                try:
-                    for msg in self._history:
-                        await queue.put(msg)
-
-                    if self._exception:
-                        await queue.put(self._exception)
-                    elif self._done.is_set():
-                        await queue.put(self._sentinel)
-
-                    while True:
-                        msg = await queue.get()
-                        if msg is self._sentinel:
-                            break
-                        sync_q.put(msg)
-                except Exception as e:
-                    sync_q.put(e)
-                finally:
-                    self._listeners.remove(queue)
-                    sync_q.put(self._sentinel)
-
-            try:
-                asyncio.run(bridge())
-            except Exception as e:
-                sync_q.put(e)
-                sync_q.put(self._sentinel)
-
-        threading.Thread(target=run_bridge, daemon=True).start()
+        listener = self._subscribe()
+        try:
+            self._ensure_started_from_sync()
+        except BaseException:
+            self._unsubscribe(listener)
+            raise
 
         def generator():
-            while True:
-                msg = sync_q.get()
-                if msg is self._sentinel:
-                    break
-                if isinstance(msg, Exception):
-                    raise msg
-                yield msg
-
-        return generator()
+            try:
+                while True:
+                    msg = listener.get_sync()
+                    if msg is self._sentinel:
+                        break
+                    if isinstance(msg, Exception):
+                        raise msg
+                    yield msg
+            finally:
+                self._unsubscribe(listener)
+
+        sync_generator = generator()
+        # A generator dropped before its first step never runs its finally block
+        weakref.finalize(sync_generator, self._unsubscribe, listener)
+        return sync_generator
 
     async def get_result(self) -> list:
         """
         Wait for the generator to finish and return the full history.
 
         Returns:
-            A list of all messages produced by the generator.
+            A list of the messages kept by the `history` policy.
         """
         await self._ensure_started()
-        await self._done.wait()
+        await self._wait_done()
 
         if self._exception:
             raise self._exception
 
-        return self._history
+        return self._history if isinstance(self._history, list) else list(self._history)
+
+    def get_memory_usage(self) -> dict[str, Any]:
+        """
+        Approximate memory held by history and subscriber buffers, in messages and bytes.
+
+        Sizes are measured with `sys.getsizeof` two levels deep when this is called, so they
+        cost nothing while streaming but are estimates.
+        """
+        with self._lock:
+            history = list(self._history)
+            listeners = list(self._listeners)
+            dropped = self._dropped
+        buffered: list = []
+        for listener in listeners:
+            with listener.condition:
+                buffered.extend(listener.buffer)
+                dropped += listener.dropped
+        return {
+            "history_limit": self.history_limit,
+            "history_messages": len(history),
+            "history_bytes": sum(_approximate_size(msg) for msg in history),
+            "subscribers": len(listeners),
+            "buffered_messages": len(buffered),
+            "buffered_bytes": sum(_approximate_size(msg) for msg in buffered),
+            "dropped_messages": dropped,
+        }
+
+    def _cancel_consume_task(self) -> bool:
+        task, home_loop = self._consume_task, self._home_loop
+        if task is None or home_loop is None or task.done():
+            return False
+        try:
+            home_loop.call_soon_threadsafe(task.cancel)
+        except RuntimeError:
+            return False
+        return True
 
     async def close(self):
         """
@@ -206,16 +423,24 @@ class GeneratorConsumer:
         After calling this, no new listeners can be added.
         """
         self._closed = True
-        async with self._closing_lock:
-            if self._consume_task:
-                self._consume_task.cancel()
+        task = self._consume_task
+        if task is not None and not task.done():
+            if task.get_loop() is asyncio.get_running_loop():
+                task.cancel()
                 try:
-                    await self._consume_task
+                    await task
                 except asyncio.CancelledError:
                     pass
                 except Exception as e:
                     self._exception = e
-            self._done.set()
-            if not self._generator_closed:
-                await self._broadcast(self._sentinel)
-                self._generator_closed = True
+            elif self._cancel_consume_task():
+                await self._wait_done()
+        self._finish()
+
+    def cancel(self):
+        """
+        Close the consumer from any thread without waiting for the source to stop.
+        """
+        self._closed = True
+        if not self._cancel_consume_task():
+            self._finish()
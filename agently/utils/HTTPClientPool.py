@@ -0,0 +1,198 @@
+# Copyright 2023-2026 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import asyncio
+import threading
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable
+from urllib.parse import urlsplit
+
+from httpx import AsyncClient, Limits
+
+from .DataFormatter import DataFormatter
+
+
+@dataclass
+class _PooledClient:
+    client: Any
+    key: Hashable
+    created_at: float = field(default_factory=time.time)
+    last_used_at: float = field(default_factory=time.time)
+    acquired: int = 0
+
+
+class HTTPClientPool:
+    """
+    Process-wide pool of `httpx.AsyncClient` instances.
+
+    Clients are keyed by the event loop they are used on plus a frozen form of the
+    client options (and optionally the request origin), so every agent and model
+    requester that talks to the same endpoint with the same options shares one
+    keep-alive connection pool instead of opening a new TCP/TLS connection per turn.
+
+    Clients bound to a closed event loop are dropped automatically on the next
+    acquire, because an `AsyncClient` can not be used across event loops.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 30.0,
+    ):
+        self._lock = threading.Lock()
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[Hashable, _PooledClient]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._limits = {
+            "max_connections": max_connections,
+            "max_keepalive_connections": max_keepalive_connections,
+            "keepalive_expiry": keepalive_expiry,
+        }
+        self._created = 0
+        self._reused = 0
+        self._closed = 0
+
+    def configure(
+        self,
+        *,
+        max_connections: int | None = None,
+        max_keepalive_connections: int | None = None,
+        keepalive_expiry: float | None = None,
+    ):
+        """Update default connection limits. Only affects clients created afterwards."""
+        with self._lock:
+            if max_connections is not None:
+                self._limits["max_connections"] = max_connections
+            if max_keepalive_connections is not None:
+                self._limits["max_keepalive_connections"] = max_keepalive_connections
+            if keepalive_expiry is not None:
+                self._limits["keepalive_expiry"] = keepalive_expiry
+        return self
+
+    @staticmethod
+    def _get_origin(url: str | None) -> str | None:
+        if not url:
+            return None
+        parts = urlsplit(url)
+        return f"{ parts.scheme }://{ parts.netloc }"
+
+    def _prune_closed_loops(self):
+        for loop in list(self._clients.keys()):
+            if loop.is_closed():
+                self._closed += len(self._clients.pop(loop, {}))
+
+    def get_client(
+        self,
+        client_options: dict[str, Any] | None = None,
+        *,
+        url: str | None = None,
+        client_factory: Callable[..., Any] = AsyncClient,
+    ):
+        """
+        Get a shared async client for the running event loop.
+
+        Args:
+            client_options (dict): Keyword arguments for the client factory, such as `proxy`,
+                `timeout`, `http2` or `limits`. Default `limits` are used if not provided.
+            url (str | None): Request URL. Its origin is part of the pool key so connection
+                limits apply per endpoint.
+            client_factory (Callable): Client class or factory, `httpx.AsyncClient` by default.
+
+        Returns:
+            The pooled client. Callers must not close it or mutate its default headers.
+        """
+        loop = asyncio.get_running_loop()
+        client_options = dict(client_options or {})
+        key = (
+            id(client_factory),
+            self._get_origin(url),
+            DataFormatter.to_hashable(client_options),
+        )
+        with self._lock:
+            self._prune_closed_loops()
+            loop_clients = self._clients.setdefault(loop, {})
+            pooled = loop_clients.get(key)
+            if pooled is not None and not getattr(pooled.client, "is_closed", False):
+                pooled.acquired += 1
+                pooled.last_used_at = time.time()
+                self._reused += 1
+                return pooled.client
+            if "limits" not in client_options:
+                client_options["limits"] = Limits(**self._limits)
+            pooled = _PooledClient(client=client_factory(**client_options), key=key, acquired=1)
+            loop_clients[key] = pooled
+            self._created += 1
+            return pooled.client
+
+    async def async_close(self):
+        """Close every pooled client that belongs to the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            loop_clients = self._clients.pop(loop, {})
+            self._closed += len(loop_clients)
+        for pooled in loop_clients.values():
+            try:
+                await pooled.client.aclose()
+            except Exception:
+                pass
+
+    def close(self):
+        """
+        Close every pooled client on every event loop.
+
+        Clients on a loop that is not running are closed synchronously, clients on a
+        running loop are scheduled onto that loop, and clients on a closed loop are dropped.
+        """
+        with self._lock:
+            all_clients = list(self._clients.items())
+            self._clients.clear()
+            self._closed += sum(len(loop_clients) for _, loop_clients in all_clients)
+        for loop, loop_clients in all_clients:
+            if loop.is_closed():
+                continue
+            for pooled in loop_clients.values():
+                try:
+                    if loop.is_running():
+                        asyncio.run_coroutine_threadsafe(pooled.client.aclose(), loop)
+                    else:
+                        loop.run_until_complete(pooled.client.aclose())
+                except Exception:
+                    pass
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            self._prune_closed_loops()
+            clients = [
+                {
+                    "origin": pooled.key[1],  # type: ignore
+                    "acquired": pooled.acquired,
+                    "reused": pooled.acquired - 1,
+                    "created_at": pooled.created_at,
+                    "last_used_at": pooled.last_used_at,
+                }
+                for loop_clients in self._clients.values()
+                for pooled in loop_clients.values()
+            ]
+            return {
+                "limits": dict(self._limits),
+                "live": len(clients),
+                "created": self._created,
+                "reused": self._reused,
+                "closed": self._closed,
+                "clients": clients,
+            }
@@ -0,0 +1,498 @@
+# Copyright 2023-2026 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+import json5
+from typing import Any, AsyncGenerator, Mapping, Sequence, TYPE_CHECKING
+
+from agently.types.data import StreamingData
+
+if TYPE_CHECKING:
+    from agently.types.data import PromptOutputStructure
+
+
+_STRING_SPECIAL_PATTERNS = {
+    "\"": re.compile(r"[\"\\]"),
+    "'": re.compile(r"['\\]"),
+}
+_ESCAPES = {
+    "\"": "\"",
+    "'": "'",
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+    "v": "\v",
+    "0": "\0",
+}
+_LINE_END_PATTERN = re.compile(r"[\r\n]")
+_BARE_TOKEN_END = frozenset(",:]}{[ \t\r\n/\"'")
+_WHITESPACES = frozenset(" \t\r\n\ufeff\u00a0")
+_LITERALS = {"true": True, "false": False, "null": None}
+
+
+class _Frame:
+    __slots__ = ("kind", "container", "path", "key", "expect", "attached")
+
+    def __init__(self, kind: str, container: dict | list, path: str, attached: bool):
+        self.kind = kind
+        self.container = container
+        self.path = path
+        self.key: str | None = None
+        # object: key -> colon -> value -> comma; array: value -> comma
+        self.expect = "key" if kind == "object" else "value"
+        self.attached = attached
+
+
+class _Token:
+    __slots__ = ("kind", "quote", "triple", "is_key", "path", "slot", "value", "new_parts", "attached")
+
+    def __init__(self, kind: str, *, is_key: bool, path: str, slot: tuple | None, attached: bool):
+        self.kind = kind
+        self.quote = ""
+        self.triple = False
+        self.is_key = is_key
+        self.path = path
+        self.slot = slot
+        self.value = ""
+        self.new_parts: list[str] = []
+        self.attached = attached
+
+
+class IncrementalStreamingJSONParser:
+    """
+    IncrementalStreamingJSONParser parses streamed JSON text with a resumable tokenizer instead of
+    re-completing and re-parsing the whole buffer for every chunk like `StreamingJSONParser` does.
+
+    Scan position, container stack and partial scalar values are kept between chunks, so each chunk costs
+    work proportional to its own length. It emits the same `StreamingData` "delta" / "done" events:
+    string fields emit one "delta" per chunk with the appended text, and every field or container emits
+    "done" as soon as its token is closed.
+
+    Text before the first JSON block (prose, markdown fences) and after the root block is ignored. JSON5
+    comments, single-quoted strings, unquoted keys, trailing commas and `\"\"\"` strings are accepted.
+
+    Attributes:
+        schema (PromptOutputStructure): The schema describing the expected JSON structure.
+        current_data (dict | list): The JSON value built so far, shared as `full_data` in events.
+    """
+
+    def __init__(self, schema: "PromptOutputStructure"):
+        self.schema = schema
+        self.current_data: Any = {}
+        if isinstance(schema, Mapping):
+            self._root_openers = "{"
+        elif isinstance(schema, Sequence) and not isinstance(schema, str):
+            self._root_openers = "["
+        else:
+            self._root_openers = "{["
+        self._pending = ""
+        self._stack: list[_Frame] = []
+        self._token: _Token | None = None
+        self._comment: str | None = None
+        self._started = False
+        self._finished = False
+
+    @property
+    def is_finished(self) -> bool:
+        return self._finished
+
+    @staticmethod
+    def _child_path(parent_path: str, key: str | int) -> str:
+        if isinstance(key, int):
+            return f"{ parent_path }[{ key }]"
+        if key in ("*", "[]", "[*]"):
+            return f"{ parent_path }[*]"
+        return f"{ parent_path }.{ key }" if parent_path else key
+
+    @staticmethod
+    def _convert_bare(text: str) -> Any:
+        if text in _LITERALS:
+            return _LITERALS[text]
+        try:
+            return int(text)
+        except ValueError:
+            pass
+        try:
+            return float(text)
+        except ValueError:
+            pass
+        try:
+            return json5.loads(text)
+        except Exception:
+            return text
+
+    def _event(self, path: str, value: Any, delta: str | None, event_type: str) -> StreamingData:
+        return StreamingData(
+            path=path,
+            value=value,
+            delta=delta,
+            is_complete=event_type == "done",
+            event_type=event_type,  # type: ignore
+            full_data=self.current_data,
+        )
+
+    def _assign(self, slot: tuple | None, value: Any):
+        if slot is not None:
+            container, key = slot
+            container[key] = value
+
+    def _open_value(self, frame: _Frame) -> tuple[str, tuple | None, bool]:
+        container = frame.container
+        if frame.kind == "array":
+            index = len(container)
+            container.append(None)  # type: ignore
+            return self._child_path(frame.path, index), (container, index), frame.attached
+        key = frame.key
+        frame.key = None
+        if key is None:
+            return frame.path, None, False
+        container[key] = None  # type: ignore
+        return self._child_path(frame.path, key), (container, key), frame.attached
+
+    def _flush_string(self, token: _Token, events: list[StreamingData]):
+        if not token.new_parts:
+            return
+        delta = "".join(token.new_parts)
+        token.new_parts.clear()
+        token.value += delta
+        if token.is_key:
+            return
+        self._assign(token.slot, token.value)
+        if token.attached and delta:
+            events.append(self._event(token.path, token.value, delta, "delta"))
+
+    def _close_token(self, token: _Token, events: list[StreamingData]):
+        self._token = None
+        frame = self._stack[-1]
+        if token.kind == "string":
+            self._flush_string(token, events)
+            if token.is_key:
+                frame.key = token.value
+                frame.expect = "colon"
+                return
+            value = token.value
+        else:
+            text = "".join(token.new_parts)
+            if token.is_key:
+                frame.key = text
+                frame.expect = "colon"
+                return
+            value = self._convert_bare(text)
+            self._assign(token.slot, value)
+        if token.attached:
+            events.append(self._event(token.path, value, None, "done"))
+        frame.expect = "comma"
+
+    def _close_frame(self, events: list[StreamingData]):
+        frame = self._stack.pop()
+        if frame.path and frame.attached:
+            events.append(self._event(frame.path, frame.container, None, "done"))
+        if self._stack:
+            self._stack[-1].expect = "comma"
+        else:
+            self._finished = True
+
+    def _feed(self, text: str, *, final: bool = False) -> list[StreamingData]:
+        events: list[StreamingData] = []
+        buf = self._pending + text if self._pending else text
+        self._pending = ""
+        i = 0
+        n = len(buf)
+
+        while i < n and not self._finished:
+            if not self._started:
+                starts = [index for index in (buf.find(opener, i) for opener in self._root_openers) if index >= 0]
+                if not starts:
+                    i = n
+                    break
+                i = min(starts)
+                container: dict | list = {} if buf[i] == "{" else []
+                self.current_data = container
+                self._stack.append(_Frame("object" if buf[i] == "{" else "array", container, "", True))
+                self._started = True
+                i += 1
+                continue
+
+            if self._comment is not None:
+                if self._comment == "//":
+                    match = _LINE_END_PATTERN.search(buf, i)
+                    if match is None:
+                        i = n
+                        break
+                    self._comment = None
+                    i = match.end()
+                else:
+                    end = buf.find("*/", i)
+                    if end < 0:
+                        if buf.endswith("*") and not final:
+                            self._pending = "*"
+                        i = n
+                        break
+                    self._comment = None
+                    i = end + 2
+                continue
+
+            token = self._token
+            if token is not None:
+                if token.kind == "string":
+                    if token.triple:
+                        end = buf.find(token.quote * 3, i)
+                        if end < 0:
+                            # keep possible partial closing quotes for the next chunk
+                            keep = 0
+                            while keep < 2 and n - keep - 1 >= i and buf[n - keep - 1] == token.quote:
+                                keep += 1
+                            if final:
+                                keep = 0
+                            token.new_parts.append(buf[i : n - keep])
+                            self._pending = buf[n - keep :]
+                            i = n
+                            break
+                        token.new_parts.append(buf[i:end])
+                        i = end + 3
+                        self._close_token(token, events)
+                        continue
+                    match = _STRING_SPECIAL_PATTERNS[token.quote].search(buf, i)
+                    if match is None:
+                        token.new_parts.append(buf[i:])
+                        i = n
+                        break
+                    j = match.start()
+                    if j > i:
+                        token.new_parts.append(buf[i:j])
+                    if buf[j] == token.quote:
+                        i = j + 1
+                        self._close_token(token, events)
+                        continue
+                    # escape sequence
+                    if j + 1 >= n:
+                        if not final:
+                            self._pending = buf[j:]
+                        i = n
+                        break
+                    escape = buf[j + 1]
+                    if escape == "u":
+                        if j + 6 > n and not final:
+                            self._pending = buf[j:]
+                            i = n
+                            break
+                        try:
+                            code = int(buf[j + 2 : j + 6], 16)
+                        except ValueError:
+                            token.new_parts.append(buf[j + 1 : j + 6])
+                            i = j + 6
+                            continue
+                        if 0xD800 <= code < 0xDC00:
+                            if j + 12 > n and not final:
+                                self._pending = buf[j:]
+                                i = n
+                                break
+                            if buf[j + 6 : j + 8] == "\\u":
+                                try:
+                                    low = int(buf[j + 8 : j + 12], 16)
+                                except ValueError:
+                                    low = 0
+                                if 0xDC00 <= low < 0xE000:
+                                    token.new_parts.append(chr(0x10000 + ((code - 0xD800) << 10) + (low - 0xDC00)))
+                                    i = j + 12
+                                    continue
+                        token.new_parts.append(chr(code))
+                        i = j + 6
+                    elif escape == "x":
+                        if j + 4 > n and not final:
+                            self._pending = buf[j:]
+                            i = n
+                            break
+                        try:
+                            token.new_parts.append(chr(int(buf[j + 2 : j + 4], 16)))
+                        except ValueError:
+                            token.new_parts.append(buf[j + 1 : j + 4])
+                        i = j + 4
+                    elif escape == "\r":
+                        # line continuation, also swallow "\r\n"
+                        if j + 2 >= n and not final:
+                            self._pending = buf[j:]
+                            i = n
+                            break
+                        i = j + 3 if buf[j + 2 : j + 3] == "\n" else j + 2
+                    elif escape == "\n":
+                        i = j + 2
+                    else:
+                        token.new_parts.append(_ESCAPES.get(escape, escape))
+                        i = j + 2
+                    continue
+                # bare token: number, literal or unquoted key
+                j = i
+                while j < n and buf[j] not in _BARE_TOKEN_END:
+                    j += 1
+                if j > i:
+                    token.new_parts.append(buf[i:j])
+                i = j
+                if j < n:
+                    self._close_token(token, events)
+                continue
+
+            ch = buf[i]
+            if ch in _WHITESPACES:
+                i += 1
+                continue
+            frame = self._stack[-1]
+            if ch == "/":
+                if i + 1 >= n:
+                    if not final:
+                        self._pending = "/"
+                    i = n
+                    break
+                next_ch = buf[i + 1]
+                if next_ch == "/":
+                    self._comment = "//"
+                    i += 2
+                elif next_ch == "*":
+                    self._comment = "/*"
+                    i += 2
+                else:
+                    i += 1
+                continue
+            if ch == ",":
+                frame.expect = "key" if frame.kind == "object" else "value"
+                i += 1
+                continue
+            if ch == ":":
+                if frame.kind == "object":
+                    frame.expect = "value"
+                i += 1
+                continue
+            if ch == "}" or ch == "]":
+                if (ch == "}") == (frame.kind == "object"):
+                    self._close_frame(events)
+                # unmatched closing brackets are ignored
+                i += 1
+                continue
+            is_key = frame.kind == "object" and frame.expect in ("key", "comma")
+            if ch == "{" or ch == "[":
+                if is_key:
+                    # a value without a key, keep brackets balanced but detach it
+                    frame.key = None
+                path, slot, attached = self._open_value(frame)
+                container = {} if ch == "{" else []
+                self._assign(slot, container)
+                self._stack.append(_Frame("object" if ch == "{" else "array", container, path, attached))
+                i += 1
+                continue
+            if ch == "\"" or ch == "'":
+                if buf.startswith(ch * 3, i):
+                    triple = True
+                elif n - i < 3 and buf[i:] == ch * (n - i) and not final:
+                    # can not tell an empty string from a triple-quoted string yet
+                    self._pending = buf[i:]
+                    i = n
+                    break
+                else:
+                    triple = False
+                if is_key:
+                    token = _Token("string", is_key=True, path=frame.path, slot=None, attached=False)
+                else:
+                    path, slot, attached = self._open_value(frame)
+                    self._assign(slot, "")
+                    token = _Token("string", is_key=False, path=path, slot=slot, attached=attached)
+                token.quote = ch
+                token.triple = triple
+                self._token = token
+                i += 3 if triple else 1
+                continue
+            if is_key:
+                self._token = _Token("bare", is_key=True, path=frame.path, slot=None, attached=False)
+            else:
+                path, slot, attached = self._open_value(frame)
+                self._token = _Token("bare", is_key=False, path=path, slot=slot, attached=attached)
+
+        if self._token is not None and self._token.kind == "string" and not self._token.is_key:
+            self._flush_string(self._token, events)
+        return events
+
+    def _end(self) -> list[StreamingData]:
+        events = self._feed("", final=True)
+        if self._token is not None and not self._finished:
+            token = self._token
+            if token.is_key:
+                self._token = None
+            else:
+                self._close_token(token, events)
+        while self._stack:
+            self._close_frame(events)
+        self._finished = True
+        return events
+
+    def feed(self, chunk: str) -> list[StreamingData]:
+        """
+        Parse a chunk synchronously and return the StreamingData events it produces.
+        Args:
+            chunk (str): A chunk of JSON text (possibly incomplete).
+        Returns:
+            list[StreamingData]: Events for every field updated or completed by this chunk.
+        """
+        if self._finished:
+            return []
+        return self._feed(chunk)
+
+    def end(self) -> list[StreamingData]:
+        """
+        Finish parsing synchronously and return "done" events for every field still open.
+        Returns:
+            list[StreamingData]: The completion events.
+        """
+        if self._finished:
+            return []
+        return self._end()
+
+    async def parse_chunk(self, chunk: str) -> AsyncGenerator[StreamingData, None]:
+        """
+        Parse a single chunk of streamed JSON data and yield StreamingData events for any
+        detected incremental or completion updates.
+        Args:
+            chunk (str): A chunk of JSON text (possibly incomplete).
+        Yields:
+            StreamingData: The event for each detected update or completion.
+        """
+        for event in self.feed(chunk):
+            yield event
+
+    async def finalize(self) -> AsyncGenerator[StreamingData, None]:
+        """
+        Mark all remaining fields as complete and yield "done" events for every incomplete path.
+        This should be called at the end of the stream to ensure all fields are finalized.
+        Yields:
+            StreamingData: The completion event for each remaining field.
+        """
+        for event in self.end():
+            yield event
+
+    async def parse_stream(self, chunk_stream: AsyncGenerator[str, None]) -> AsyncGenerator[StreamingData, None]:
+        """
+        Parse a stream of JSON chunks and yield StreamingData events.
+        Args:
+            chunk_stream (AsyncGenerator[str, None]): An async generator that yields JSON chunks.
+        Yields:
+            StreamingData: The event for each detected update or completion.
+        """
+        async for chunk in chunk_stream:
+            async for event in self.parse_chunk(chunk):
+                yield event
+
+        async for event in self.finalize():
+            yield event
@@ -0,0 +1,303 @@
+# Copyright 2023-2026 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import asyncio
+import threading
+import weakref
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable
+
+from .DataFormatter import DataFormatter
+
+
+@dataclass
+class _PooledSession:
+    key: Hashable
+    transport: Any
+    idle_timeout: float | None
+    semaphore: asyncio.Semaphore | None
+    client: Any = None
+    connect_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    idle_handle: asyncio.TimerHandle | None = None
+    created_at: float = field(default_factory=time.time)
+    last_used_at: float = field(default_factory=time.time)
+    in_use: int = 0
+    acquired: int = 0
+    connects: int = 0
+    failed_health_checks: int = 0
+
+
+def _default_client_factory(transport: Any):
+    from fastmcp import Client
+
+    return Client(transport)
+
+
+class MCPSessionPool:
+    """
+    Process-wide pool of connected MCP client sessions.
+
+    Sessions are keyed by the event loop they are used on plus a frozen form of the
+    transport, so every tool call to the same MCP server reuses one initialized session
+    instead of spawning a new stdio server process or redoing the HTTP handshake.
+
+    - Sessions connect lazily on the first `session()` call.
+    - A session idle for longer than `health_check_interval` is pinged before reuse and
+      reconnected if the ping fails. Sessions that dropped their connection are reconnected.
+    - Sessions idle for longer than `idle_timeout` are closed.
+    - `max_concurrency` limits concurrent calls per server, extra callers wait.
+
+    Sessions bound to a closed event loop are dropped on the next acquire, because an MCP
+    session runs as a task of the loop it was opened on.
+    """
+
+    def __init__(
+        self,
+        *,
+        idle_timeout: float | None = 300.0,
+        max_concurrency: int | None = 8,
+        health_check_interval: float | None = 30.0,
+        health_check_timeout: float = 5.0,
+        client_factory: Callable[[Any], Any] = _default_client_factory,
+    ):
+        self._lock = threading.Lock()
+        self._sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[Hashable, _PooledSession]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._closing_tasks: set[asyncio.Task] = set()
+        self.idle_timeout = idle_timeout
+        self.max_concurrency = max_concurrency
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        self.client_factory = client_factory
+        self._connects = 0
+        self._reconnects = 0
+        self._reused = 0
+        self._closed = 0
+
+    def configure(
+        self,
+        *,
+        idle_timeout: float | None = None,
+        max_concurrency: int | None = None,
+        health_check_interval: float | None = None,
+        health_check_timeout: float | None = None,
+    ):
+        """Update pool defaults. Limits only affect sessions created afterwards."""
+        with self._lock:
+            if idle_timeout is not None:
+                self.idle_timeout = idle_timeout if idle_timeout > 0 else None
+            if max_concurrency is not None:
+                self.max_concurrency = max_concurrency if max_concurrency > 0 else None
+            if health_check_interval is not None:
+                self.health_check_interval = health_check_interval if health_check_interval >= 0 else None
+            if health_check_timeout is not None:
+                self.health_check_timeout = health_check_timeout
+        return self
+
+    def _prune_closed_loops(self):
+        for loop in list(self._sessions.keys()):
+            if loop.is_closed():
+                self._closed += len(self._sessions.pop(loop, {}))
+
+    def _get_entry(self, loop: asyncio.AbstractEventLoop, transport: Any):
+        key = DataFormatter.to_hashable(transport)
+        with self._lock:
+            self._prune_closed_loops()
+            loop_sessions = self._sessions.setdefault(loop, {})
+            entry = loop_sessions.get(key)
+            if entry is None:
+                entry = _PooledSession(
+                    key=key,
+                    transport=transport,
+                    idle_timeout=self.idle_timeout,
+                    semaphore=asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None,
+                )
+                loop_sessions[key] = entry
+            return entry
+
+    @staticmethod
+    def _is_connected(client: Any):
+        is_connected = getattr(client, "is_connected", None)
+        return bool(is_connected()) if callable(is_connected) else True
+
+    async def _disconnect(self, entry: _PooledSession):
+        client, entry.client = entry.client, None
+        if client is None:
+            return
+        try:
+            await client.__aexit__(None, None, None)
+        except Exception:
+            pass
+
+    async def _ensure_connected(self, entry: _PooledSession):
+        async with entry.connect_lock:
+            client = entry.client
+            if client is not None and self._is_connected(client):
+                idle_for = time.time() - entry.last_used_at
+                if (
+                    self.health_check_interval is None
+                    or entry.in_use > 1
+                    or idle_for < self.health_check_interval
+                    or not hasattr(client, "ping")
+                ):
+                    self._reused += 1
+                    return client
+                try:
+                    await asyncio.wait_for(client.ping(), self.health_check_timeout)
+                    self._reused += 1
+                    return client
+                except Exception:
+                    entry.failed_health_checks += 1
+            if client is not None:
+                await self._disconnect(entry)
+                self._reconnects += 1
+            client = self.client_factory(entry.transport)
+            await client.__aenter__()
+            entry.client = client
+            entry.connects += 1
+            self._connects += 1
+            return client
+
+    def _schedule_idle_close(self, loop: asyncio.AbstractEventLoop, entry: _PooledSession):
+        if entry.idle_timeout is None or entry.client is None:
+            return
+        entry.idle_handle = loop.call_later(entry.idle_timeout, self._close_if_idle, loop, entry)
+
+    def _close_if_idle(self, loop: asyncio.AbstractEventLoop, entry: _PooledSession):
+        entry.idle_handle = None
+        if entry.in_use > 0:
+            return
+        with self._lock:
+            loop_sessions = self._sessions.get(loop, {})
+            if loop_sessions.get(entry.key) is entry:
+                del loop_sessions[entry.key]
+                self._closed += 1
+        task = loop.create_task(self._disconnect(entry))
+        self._closing_tasks.add(task)
+        task.add_done_callback(self._closing_tasks.discard)
+
+    @asynccontextmanager
+    async def session(self, transport: Any):
+        """
+        Borrow a connected client for `transport` on the running event loop.
+
+        The client is shared with other callers, do not close it or enter it as a context
+        manager again.
+        """
+        loop = asyncio.get_running_loop()
+        entry = self._get_entry(loop, transport)
+        if entry.semaphore is not None:
+            await entry.semaphore.acquire()
+        entry.in_use += 1
+        entry.acquired += 1
+        if entry.idle_handle is not None:
+            entry.idle_handle.cancel()
+            entry.idle_handle = None
+        try:
+            client = await self._ensure_connected(entry)
+            yield client
+        finally:
+            entry.in_use -= 1
+            entry.last_used_at = time.time()
+            if entry.in_use == 0:
+                self._schedule_idle_close(loop, entry)
+            if entry.semaphore is not None:
+                entry.semaphore.release()
+
+    async def call_tool(self, transport: Any, name: str, arguments: dict[str, Any], **kwargs):
+        """
+        Call an MCP tool on a pooled session.
+
+        If the call fails because the session lost its connection, the session is
+        reconnected and the call is sent once more. Errors on a healthy session are raised.
+        """
+        for attempt in range(2):
+            async with self.session(transport) as client:
+                try:
+                    return await client.call_tool(name=name, arguments=arguments, **kwargs)
+                except Exception:
+                    if attempt > 0 or self._is_connected(client):
+                        raise
+
+    async def list_tools(self, transport: Any):
+        async with self.session(transport) as client:
+            return await client.list_tools()
+
+    async def async_close(self):
+        """Close every pooled session that belongs to the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            loop_sessions = self._sessions.pop(loop, {})
+            self._closed += len(loop_sessions)
+        for entry in loop_sessions.values():
+            if entry.idle_handle is not None:
+                entry.idle_handle.cancel()
+            await self._disconnect(entry)
+
+    def close(self):
+        """
+        Close every pooled session on every event loop.
+
+        Sessions on a loop that is not running are closed synchronously, sessions on a
+        running loop are scheduled onto that loop, and sessions on a closed loop are dropped.
+        """
+        with self._lock:
+            all_sessions = list(self._sessions.items())
+            self._sessions.clear()
+            self._closed += sum(len(loop_sessions) for _, loop_sessions in all_sessions)
+        for loop, loop_sessions in all_sessions:
+            if loop.is_closed():
+                continue
+            for entry in loop_sessions.values():
+                try:
+                    if loop.is_running():
+                        asyncio.run_coroutine_threadsafe(self._disconnect(entry), loop)
+                    else:
+                        if entry.idle_handle is not None:
+                            entry.idle_handle.cancel()
+                        loop.run_until_complete(self._disconnect(entry))
+                except Exception:
+                    pass
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            self._prune_closed_loops()
+            sessions = [
+                {
+                    "transport": repr(entry.transport),
+                    "connected": entry.client is not None and self._is_connected(entry.client),
+                    "in_use": entry.in_use,
+                    "acquired": entry.acquired,
+                    "connects": entry.connects,
+                    "failed_health_checks": entry.failed_health_checks,
+                    "created_at": entry.created_at,
+                    "last_used_at": entry.last_used_at,
+                }
+                for loop_sessions in self._sessions.values()
+                for entry in loop_sessions.values()
+            ]
+            return {
+                "idle_timeout": self.idle_timeout,
+                "max_concurrency": self.max_concurrency,
+                "health_check_interval": self.health_check_interval,
+                "live": len(sessions),
+                "connects": self._connects,
+                "reconnects": self._reconnects,
+                "reused": self._reused,
+                "closed": self._closed,
+                "sessions": sessions,
+            }
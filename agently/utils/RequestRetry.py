@@ -0,0 +1,172 @@
+# Copyright 2023-2026 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import random
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Iterable, Literal, Mapping
+
+from httpx import TransportError
+
+RetryReason = Literal["rate_limited", "server_error", "connection"]
+
+
+class RetryBudget:
+    """
+    Sliding-window cap on retries per endpoint, shared by every request in the process.
+
+    When one upstream keeps failing, requests to it stop retrying once the budget of the
+    current window is spent instead of piling up backoff sleeps.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._retries: dict[str, deque[float]] = {}
+        self._rejected: dict[str, int] = {}
+
+    def try_acquire(self, endpoint: str, *, max_retries: int | None, window: float) -> bool:
+        if max_retries is None:
+            return True
+        now = time.monotonic()
+        with self._lock:
+            retries = self._retries.setdefault(endpoint, deque())
+            while retries and now - retries[0] > window:
+                retries.popleft()
+            if len(retries) >= max_retries:
+                self._rejected[endpoint] = self._rejected.get(endpoint, 0) + 1
+                return False
+            retries.append(now)
+            return True
+
+    def reset(self, endpoint: str | None = None):
+        with self._lock:
+            if endpoint is None:
+                self._retries.clear()
+                self._rejected.clear()
+            else:
+                self._retries.pop(endpoint, None)
+                self._rejected.pop(endpoint, None)
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                endpoint: {
+                    "recent_retries": len(retries),
+                    "rejected": self._rejected.get(endpoint, 0),
+                }
+                for endpoint, retries in self._retries.items()
+            }
+
+
+class RequestRetryPolicy:
+    """
+    Decides whether and when a failed model request is sent again.
+
+    - Status codes in `retry_on_status` are retried, `429` as `rate_limited` and the
+      others as `server_error`. httpx transport errors are retried as `connection`.
+    - Delays grow exponentially from `initial_delay` up to `max_delay`, with +/- `jitter`
+      (a fraction of the delay) so clients do not retry in lockstep.
+    - A `Retry-After` header is used as the delay. If it asks for more than `max_delay`
+      the request is not retried.
+    - `max_attempts` counts the first attempt. Every retry also takes one slot from the
+      endpoint's `RetryBudget`.
+    """
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = True,
+        max_attempts: int = 3,
+        initial_delay: float = 0.5,
+        max_delay: float = 30.0,
+        backoff_multiplier: float = 2.0,
+        jitter: float = 0.2,
+        retry_on_status: Iterable[int] = (408, 429, 500, 502, 503, 504),
+        budget_max_retries: int | None = 30,
+        budget_window: float = 60.0,
+        budget: RetryBudget | None = None,
+    ):
+        self.enabled = enabled
+        self.max_attempts = max(1, int(max_attempts))
+        self.initial_delay = max(0.0, float(initial_delay))
+        self.max_delay = max(0.0, float(max_delay))
+        self.backoff_multiplier = max(1.0, float(backoff_multiplier))
+        self.jitter = min(1.0, max(0.0, float(jitter)))
+        self.retry_on_status = frozenset(int(status_code) for status_code in retry_on_status)
+        self.budget_max_retries = budget_max_retries
+        self.budget_window = float(budget_window)
+        self.budget = budget if budget is not None else RetryBudget()
+
+    @classmethod
+    def from_settings(cls, retry_settings: Mapping[str, Any] | None, *, budget: RetryBudget | None = None):
+        retry_settings = dict(retry_settings or {})
+        budget_settings = retry_settings.pop("budget", None) or {}
+        if "max_retries" in budget_settings:
+            retry_settings["budget_max_retries"] = budget_settings["max_retries"]
+        if "window" in budget_settings:
+            retry_settings["budget_window"] = budget_settings["window"]
+        return cls(**retry_settings, budget=budget)
+
+    def classify_status(self, status_code: int) -> RetryReason | None:
+        if status_code not in self.retry_on_status:
+            return None
+        return "rate_limited" if status_code == 429 else "server_error"
+
+    @staticmethod
+    def classify_error(error: BaseException) -> RetryReason | None:
+        if isinstance(error, TransportError):
+            return "connection"
+        return None
+
+    @staticmethod
+    def parse_retry_after(value: str | None) -> float | None:
+        """Parse `Retry-After` given in seconds or as an HTTP date."""
+        if not value:
+            return None
+        value = value.strip()
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def get_delay(self, retry_count: int, *, retry_after: float | None = None, base_delay: float | None = None):
+        """
+        Seconds to wait before retry number `retry_count` (starting at 1), or None if the
+        server asked to wait longer than `max_delay`.
+        """
+        if retry_after is not None:
+            if retry_after > self.max_delay:
+                return None
+            return retry_after + random.uniform(0, retry_after * self.jitter)
+        delay = self.initial_delay if base_delay is None else base_delay
+        delay = min(self.max_delay, delay * self.backoff_multiplier ** (retry_count - 1))
+        if self.jitter:
+            delay = random.uniform(delay * (1 - self.jitter), delay * (1 + self.jitter))
+        return min(self.max_delay, delay)
+
+    def allow_retry(self, attempt: int, endpoint: str) -> bool:
+        """Whether attempt number `attempt` (starting at 1) may be followed by another one."""
+        if not self.enabled or attempt >= self.max_attempts:
+            return False
+        return self.budget.try_acquire(endpoint, max_retries=self.budget_max_retries, window=self.budget_window)
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import datetime
+import itertools
 from copy import deepcopy
 from pathlib import Path
 from typing import Any, Iterator, Literal, Mapping, Sequence, TypeVar, cast
@@ -25,6 +26,11 @@ from agently.types.data import SerializableValue
 from .DataFormatter import DataFormatter
 
 T = TypeVar("T")
+S = TypeVar("S", bound="StateData")
+
+# Process-wide so a generation is never reused, even by a replaced parent.
+_generation_counter = itertools.count(1)
+_ATOMIC_TYPES = (str, int, float, bool, bytes, type(None))
 
 
 class DictRef:
@@ -58,6 +64,18 @@ class DictRef:
 
 
 class StateData:
+    """
+    Dictionary state with optional parent inheritance.
+
+    Reads with `inherit=True` resolve against a merged view of this node and all of
+    its ancestors. The merged view is cached per node and stamped with the generation
+    of every node in the chain, so it is only rebuilt after this node or an ancestor
+    changes. Handing out a local dict/list/set by reference (`get(key, inherit=False)`,
+    `state[None]`) also marks the node changed, so edits made through it before the
+    next read are seen; code that keeps such a reference across reads must call
+    `_touch()` after editing it.
+    """
+
     instance_counter = 0
 
     def __init__(
@@ -68,6 +86,10 @@ class StateData:
         parent: "StateData | None" = None,
     ):
         self._data = data if data is not None else {}
+        self._generation = next(_generation_counter)
+        self._view_cache: tuple[tuple[int, ...], dict[Any, Any]] | None = None
+        # Top-level keys whose values are still shared with the view this node was forked from.
+        self._shared_keys: set[Any] = set()
         if name is None:
             # Keep the historical auto-generated prefix for compatibility.
             self.name = f"runtime_data_{ StateData.instance_counter }"
@@ -76,6 +98,94 @@ class StateData:
             self.name = name
         self.parent = parent
 
+    @property
+    def parent(self) -> "StateData | None":
+        return self._parent
+
+    @parent.setter
+    def parent(self, parent: "StateData | None"):
+        self._parent = parent
+        self._touch()
+
+    def _touch(self):
+        """Mark local data as changed, cached views of this node and its descendants become stale."""
+        self._generation = next(_generation_counter)
+
+    def _get_chain_stamp(self) -> tuple[int, ...]:
+        stamp = []
+        node: StateData | None = self
+        while node is not None:
+            stamp.append(node._generation)
+            node = node._parent
+        return tuple(stamp)
+
+    def get_version(self) -> tuple[int, ...]:
+        """Opaque version of the inherited view, it changes whenever this node or an ancestor changes."""
+        return self._get_chain_stamp()
+
+    def _get_resolved_view(self) -> dict[Any, Any]:
+        """
+        Get the cached inherited view, O(depth) when nothing changed.
+
+        The returned dict is shared by every reader and must never be mutated or handed
+        out without `_copy()`.
+        """
+        stamp = self._get_chain_stamp()
+        cache = self._view_cache
+        if cache is not None and cache[0] == stamp:
+            return cache[1]
+        shared_keys = self._shared_keys
+        if self._parent is None and shared_keys:
+            # Values still shared with the fork source are immutable, only owned values need a copy.
+            view = {
+                key: value if key in shared_keys else self._copy(value) for key, value in self._data.items()
+            }
+        elif self._parent is not None and not self._data:
+            # Empty layers (fresh execution settings, resources) reuse the parent's cached view.
+            view = self._parent._get_resolved_view()
+        else:
+            view = self._get_inherited_view(self, {})
+        self._view_cache = (stamp, view)
+        return view
+
+    def fork_from(self: S, source: "StateData") -> S:
+        """
+        Replace local data with a copy-on-write fork of `source`'s inherited view.
+
+        Forking only copies the top-level key table, values stay shared with the source's
+        cached view until a key is written (or read by reference with `inherit=False`),
+        then only that key is copied. Later changes to `source` are not visible here.
+        """
+        view = source._get_resolved_view()
+        self._data.clear()
+        self._data.update(view)
+        self._shared_keys = set(view.keys())
+        self._touch()
+        return self
+
+    def _hand_out(self, value: Any) -> Any:
+        """Return a local value by reference, containers copied into cached views may be mutated by the caller."""
+        if isinstance(value, (dict, list, set)):
+            self._touch()
+        return value
+
+    def _own(self, key: Any = None):
+        """Copy-on-write: make a forked top-level value private before it can be mutated."""
+        shared_keys = self._shared_keys
+        if not shared_keys:
+            return
+        if key is None:
+            for shared_key in shared_keys:
+                if shared_key in self._data:
+                    self._data[shared_key] = self._copy(self._data[shared_key])
+            shared_keys.clear()
+            return
+        top_key = key.split(".", 1)[0] if isinstance(key, str) else key
+        if top_key in shared_keys:
+            shared_keys.discard(top_key)
+            if top_key in self._data:
+                self._data[top_key] = self._copy(self._data[top_key])
+
     def __repr__(self) -> str:
         return f"StateData(name={ self.name }, data={ str(self.data) })"
 
@@ -83,16 +193,18 @@ class StateData:
         return self.data == equal_target
 
     def __iter__(self) -> Iterator[Any]:
-        return iter(self.data)
+        return iter(list(self._get_resolved_view()))
 
     def __len__(self) -> int:
-        return len(self.data)
+        return len(self._get_resolved_view())
 
     @property
     def data(self) -> dict[Any, Any]:
         return cast(dict[Any, Any], self.get(default={}))
 
     def _copy(self, origin: Any) -> Any:
+        if type(origin) in _ATOMIC_TYPES:
+            return origin
         try:
             if isinstance(origin, dict):
                 result = {}
@@ -147,21 +259,23 @@ class StateData:
         return result
 
     def _get_item_by_dot_path(self, dot_path: str, inherit: bool = True):
-        current = self._get_inherited_view(self, {}) if inherit else self._copy(self._data)
+        # Without inherit the local value is returned as-is, callers copy before storing it back.
+        current = self._get_resolved_view() if inherit else self._data
         path_list = dot_path.split(".")
         for path in path_list:
-            if path in current:
+            if isinstance(current, dict) and path in current:
                 current = current[path]
             else:
                 return None
-        return current
+        return self._copy(current) if inherit else current
 
     def __getitem__(self, key: Any = None) -> Any:
         if isinstance(key, str) and "." in key:
             return self._get_item_by_dot_path(key)
         if key is None:
-            return self._data
-        return self.data.get(key)
+            self._own()
+            return self._hand_out(self._data)
+        return self._copy(self._get_resolved_view().get(key))
 
     def get(
         self,
@@ -171,10 +285,15 @@ class StateData:
     ) -> Any | T:
         if key is None:
             if inherit:
-                return self._get_inherited_view(self, {})
+                return self._copy(self._get_resolved_view())
             return self._copy(self._data)
 
-        data = self.data if inherit else self._data
+        # Inherited reads return a copy of the requested value only, local reads return a reference.
+        if inherit:
+            data = self._get_resolved_view()
+        else:
+            self._own(key)
+            data = self._data
 
         if isinstance(key, str) and "." in key:
             current = data
@@ -185,7 +304,7 @@ class StateData:
                         current = current[path]
                     else:
                         return default
-                return current
+                return self._copy(current) if inherit else self._hand_out(current)
             except Exception:
                 return default
 
@@ -194,11 +313,11 @@ class StateData:
             result = data.get(key, sentinel)
             if result is sentinel:
                 return default
-            return result
+            return self._copy(result) if inherit else self._hand_out(result)
         return default
 
     def keys(self):
-        return self.data.keys()
+        return self._get_resolved_view().keys()
 
     def values(self):
         return self.data.values()
@@ -207,6 +326,7 @@ class StateData:
         return self.data.items()
 
     def pop(self, key: Any, default: Any = None) -> Any:
+        self._own(key)
         if isinstance(key, str) and "." in key:
             val = self.get(key, default=None, inherit=False)
             if val is None:
@@ -214,14 +334,21 @@ class StateData:
             del self[key]
             return val
         if key in self._data:
-            return self._data.pop(key)
+            try:
+                return self._data.pop(key)
+            finally:
+                self._touch()
         return default
 
     def clear(self):
-        return self._data.clear()
+        self._shared_keys.clear()
+        try:
+            return self._data.clear()
+        finally:
+            self._touch()
 
     def __contains__(self, key: Any) -> bool:
-        return key in self.data
+        return key in self._get_resolved_view()
 
     def _set_item(self, ref: DictRef, value: Any):
         if isinstance(ref.get(), dict) and isinstance(value, Mapping):
@@ -289,13 +416,17 @@ class StateData:
             self._set_item(current, value)
 
     def __setitem__(self, key: Any, value: Any):
-        if isinstance(key, str) and "." in key:
-            return self._set_item_by_dot_path(key, value)
-        if key in self._data:
-            ref = DictRef(self._data, key)
-            self._set_item(ref, value)
-        else:
-            self._data[key] = self._copy(value)
+        self._own(key)
+        try:
+            if isinstance(key, str) and "." in key:
+                return self._set_item_by_dot_path(key, value)
+            if key in self._data:
+                ref = DictRef(self._data, key)
+                self._set_item(ref, value)
+            else:
+                self._data[key] = self._copy(value)
+        finally:
+            self._touch()
 
     def set(self, key: Any, value: Any):
         return self.__setitem__(key, value)
@@ -371,6 +502,13 @@ class StateData:
                 return toml.dumps(DataFormatter.to_str_key_dict(serializable_data, default_key="data"))
 
     def __delitem__(self, key: Any):
+        self._own(key)
+        try:
+            self._delete_item(key)
+        finally:
+            self._touch()
+
+    def _delete_item(self, key: Any):
         if isinstance(key, str) and "." in key:
             path_list = key.split(".")
             current = DictRef(self._data)
@@ -391,6 +529,13 @@ class StateData:
                 del self._data[key]
 
     def append(self, key: Any, value: Any):
+        self._own(key)
+        try:
+            self._append_item(key, value)
+        finally:
+            self._touch()
+
+    def _append_item(self, key: Any, value: Any):
         if isinstance(key, str) and "." in key:
             current = self._get_item_by_dot_path(key, inherit=False)
         else:
@@ -415,6 +560,13 @@ class StateData:
             self._data[key] = new_value
 
     def extend(self, key: Any, values: Sequence[Any]):
+        self._own(key)
+        try:
+            self._extend_items(key, values)
+        finally:
+            self._touch()
+
+    def _extend_items(self, key: Any, values: Sequence[Any]):
         if isinstance(key, str) and "." in key:
             current = self._get_item_by_dot_path(key, inherit=False)
         else:
@@ -534,6 +686,7 @@ class StateDataNamespace:
             return self.root.set(f"{self.namespace}.{key}", value)
         if self.root.get(self.namespace, inherit=False) is None:
             self.root._data[self.namespace] = {}
+            self.root._touch()
         self.root.set(f"{self.namespace}.{key}", value)
 
     def __delitem__(self, key: Any):
@@ -544,6 +697,7 @@ class StateDataNamespace:
             if isinstance(ns, dict) and key in ns:
                 del ns[key]
                 self.root._data[self.namespace] = ns
+                self.root._touch()
 
     def pop(self, key: str, default: Any = None) -> Any:
         if isinstance(key, str) and "." in key:
@@ -552,11 +706,13 @@ class StateDataNamespace:
         if isinstance(ns, dict) and key in ns:
             val = ns.pop(key)
             self.root._data[self.namespace] = ns
+            self.root._touch()
             return val
         return default
 
     def clear(self):
         self.root._data[self.namespace] = {}
+        self.root._touch()
 
     def __contains__(self, key: Any) -> bool:
         return key in self.keys()
@@ -0,0 +1,183 @@
+# Copyright 2023-2026 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+from typing import Literal, Mapping, Sequence, TYPE_CHECKING
+
+from .DataLocator import DataLocator
+from .IncrementalStreamingJSONParser import IncrementalStreamingJSONParser
+
+if TYPE_CHECKING:
+    from agently.types.data import PromptOutputStructure, StreamingData
+
+_DOT_PATH_TOKEN = re.compile(r"\[[^\]]*\]|[^.\[]+")
+_EMPTY = object()
+
+
+class StreamingEnsureKeysValidator:
+    """
+    Watches a streamed JSON answer and reports as soon as it can no longer contain every
+    `ensure_keys` path, so the request can be canceled and retried without waiting for the
+    rest of the generation.
+
+    The answer is judged on the first JSON block that has a key of the output schema, which
+    is the block `DataLocator.locate_output_json` picks later. A violation is reported when a
+    field of that block is completed without a required child path. A root block completed
+    without a required key is left to the regular check after the response ends, since the
+    generation is over by then anyway.
+
+    With `strict_schema=True` it is also reported when the first JSON opener in the text does
+    not match the schema root type, or when a top-level key of the schema shows up while an
+    earlier required top-level key was skipped. Models usually follow the schema order, but
+    JSON does not guarantee it, so this mode can abort answers that would have been valid.
+    """
+
+    def __init__(
+        self,
+        ensure_keys: list[str],
+        *,
+        key_style: Literal["dot", "slash"] = "dot",
+        output_schema: "PromptOutputStructure | None" = None,
+        strict_schema: bool = False,
+    ):
+        self.ensure_keys = list(ensure_keys)
+        self.key_style: Literal["dot", "slash"] = key_style
+        self.strict_schema = strict_schema
+        self._schema = output_schema if output_schema is not None else {}
+        self._parser = IncrementalStreamingJSONParser(self._schema)
+        self._keys = [(key, self._tokenize_key(key)) for key in self.ensure_keys]
+        self._schema_keys: list[str] = list(self._schema.keys()) if isinstance(self._schema, Mapping) else []
+        self._required_top_keys = {tokens[0] for _, tokens in self._keys if tokens and tokens[0][0] != "["}
+        self._seen_top_keys: set[str] = set()
+        self._root_type_checked = False
+        self.violation: str | None = None
+        self.streamed_chars = 0
+        self.streamed_chunks = 0
+
+    @staticmethod
+    def _tokenize_dot(path: str) -> list[str]:
+        return _DOT_PATH_TOKEN.findall(path)
+
+    def _tokenize_key(self, key: str) -> list[str]:
+        if self.key_style == "dot":
+            return self._tokenize_dot(key)
+        tokens = []
+        for part in key.split("/"):
+            if not part:
+                continue
+            if part.startswith("[") and part.endswith("]"):
+                part = part[1:-1]
+            if part in ("*", ""):
+                tokens.append("[*]")
+            elif part.lstrip("-").isdigit():
+                tokens.append(f"[{ part }]")
+            else:
+                tokens.append(part)
+        return tokens
+
+    def _relative_path(self, tokens: list[str], depth: int) -> str:
+        remaining = tokens[depth:]
+        if self.key_style == "slash":
+            return "/" + "/".join(token[1:-1] if token.startswith("[") else token for token in remaining)
+        path = ""
+        for token in remaining:
+            if token.startswith("[") or not path:
+                path += token
+            else:
+                path += f".{ token }"
+        return path
+
+    @staticmethod
+    def _is_ancestor(path_tokens: list[str], key_tokens: list[str]) -> bool:
+        if len(path_tokens) >= len(key_tokens):
+            return False
+        for path_token, key_token in zip(path_tokens, key_tokens):
+            if path_token != key_token and not (key_token == "[*]" and path_token.startswith("[")):
+                return False
+        return True
+
+    def _matches_output_shape(self) -> bool:
+        data = self._parser.current_data
+        if isinstance(self._schema, Mapping):
+            return isinstance(data, Mapping) and (
+                not self._schema_keys or any(key in data for key in self._schema_keys)
+            )
+        return True
+
+    def _check_root_type(self, chunk: str):
+        match = re.search(r"[\[{]", chunk)
+        if match is None:
+            return
+        self._root_type_checked = True
+        opener = match.group(0)
+        if isinstance(self._schema, Mapping) and opener == "[":
+            self.violation = "Output root is a list but the output schema is an object."
+        elif isinstance(self._schema, Sequence) and not isinstance(self._schema, str) and opener == "{":
+            self.violation = "Output root is an object but the output schema is a list."
+
+    def _check_key_order(self, key: str):
+        if key in self._seen_top_keys:
+            return
+        self._seen_top_keys.add(key)
+        if key not in self._schema_keys:
+            return
+        index = self._schema_keys.index(key)
+        for required_key in self._required_top_keys:
+            if (
+                required_key not in self._seen_top_keys
+                and required_key in self._schema_keys
+                and self._schema_keys.index(required_key) < index
+            ):
+                self.violation = f"Top-level key '{ key }' came before required key '{ required_key }'."
+                return
+
+    def _check_event(self, event: "StreamingData"):
+        path_tokens = self._tokenize_dot(event.path)
+        if self.strict_schema and len(path_tokens) == 1 and path_tokens[0][0] != "[":
+            self._check_key_order(path_tokens[0])
+            if self.violation is not None:
+                return
+        if not event.is_complete:
+            return
+        for key, key_tokens in self._keys:
+            if not self._is_ancestor(path_tokens, key_tokens):
+                continue
+            relative_path = self._relative_path(key_tokens, len(path_tokens))
+            if (
+                DataLocator.locate_path_in_dict(event.value, relative_path, self.key_style, default=_EMPTY) is _EMPTY
+                and self._matches_output_shape()
+            ):
+                self.violation = f"Required key '{ key }' is missing from completed field '{ event.path }'."
+                return
+
+    def feed(self, chunk: str) -> str | None:
+        """
+        Feed the next streamed text chunk.
+
+        Returns:
+            The violation reason if the answer can no longer satisfy `ensure_keys`, else None.
+        """
+        if self.violation is not None:
+            return self.violation
+        self.streamed_chars += len(chunk)
+        self.streamed_chunks += 1
+        if self.strict_schema and not self._root_type_checked:
+            self._check_root_type(chunk)
+            if self.violation is not None:
+                return self.violation
+        for event in self._parser.feed(chunk):
+            self._check_event(event)
+            if self.violation is not None:
+                return self.violation
+        return self.violation
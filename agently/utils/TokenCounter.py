@@ -0,0 +1,177 @@
+# Copyright 2023-2026 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import math
+import hashlib
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, ClassVar, TYPE_CHECKING
+
+from .LazyImport import LazyImport
+
+if TYPE_CHECKING:
+    from agently.types.data import ChatMessage
+
+
+class TokenCounter(ABC):
+    """
+    Counts tokens of texts and chat messages, with an LRU cache of counts keyed by a hash
+    of the text so repeated contents are only tokenized once.
+
+    Subclasses implement the abstract `_count(text)` and may override `keep_tail(text,
+    max_tokens)`, which otherwise binary searches the longest text suffix within the budget.
+
+    An instance is a Session length handler: `session.register_length_handler(counter)`.
+    """
+
+    _shared: ClassVar[dict[str, "TokenCounter"]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, *, cache_size: int = 4096, message_overhead: int = 4):
+        self.cache_size = max(0, int(cache_size))
+        self.message_overhead = max(0, int(message_overhead))
+        self._cache: OrderedDict[bytes, int] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @classmethod
+    def from_name(cls, name: str) -> "TokenCounter":
+        """
+        Shared counter by name, so every session using it shares one cache.
+
+        - `"bytes"` or `"bytes:<bytes_per_token>"`: `ByteLengthTokenCounter`.
+        - `"tiktoken"` or `"tiktoken:<encoding or model name>"`: `TiktokenTokenCounter`.
+        """
+        with cls._shared_lock:
+            if name not in cls._shared:
+                kind, _, option = name.partition(":")
+                if kind == "bytes":
+                    counter: TokenCounter = ByteLengthTokenCounter(bytes_per_token=float(option) if option else 4.0)
+                elif kind == "tiktoken":
+                    counter = TiktokenTokenCounter(option or "cl100k_base")
+                else:
+                    raise ValueError(f"Unknown token counter '{ name }', expect 'bytes' or 'tiktoken'.")
+                cls._shared[name] = counter
+            return cls._shared[name]
+
+    @abstractmethod
+    def _count(self, text: str) -> int: ...
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        if self.cache_size == 0:
+            return self._count(text)
+        key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return self._cache[key]
+        count = self._count(text)
+        with self._lock:
+            self._misses += 1
+            self._cache[key] = count
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return count
+
+    @staticmethod
+    def message_text(message: "ChatMessage") -> str:
+        if isinstance(message.content, str):
+            return message.content
+        return json.dumps(message.model_dump()["content"], ensure_ascii=False)
+
+    def count_message(self, message: "ChatMessage") -> int:
+        return self.count(self.message_text(message)) + self.message_overhead
+
+    def __call__(self, message: "ChatMessage") -> int:
+        return self.count_message(message)
+
+    def keep_tail(self, text: str, max_tokens: int) -> str:
+        """Longest suffix of `text` within `max_tokens`."""
+        if max_tokens <= 0:
+            return ""
+        if self._count(text) <= max_tokens:
+            return text
+        low, high = 0, len(text)
+        while low < high:
+            middle = (low + high) // 2
+            if self._count(text[middle:]) <= max_tokens:
+                high = middle
+            else:
+                low = middle + 1
+        return text[low:]
+
+    def get_cache_stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "size": len(self._cache),
+                "max_size": self.cache_size,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+    def clear_cache(self):
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+class ByteLengthTokenCounter(TokenCounter):
+    """Dependency-free estimate: UTF-8 bytes divided by `bytes_per_token`, rounded up."""
+
+    def __init__(self, bytes_per_token: float = 4.0, **kwargs):
+        super().__init__(**kwargs)
+        self.bytes_per_token = max(0.1, float(bytes_per_token))
+
+    def _count(self, text: str) -> int:
+        return math.ceil(len(text.encode("utf-8", "surrogatepass")) / self.bytes_per_token)
+
+    def keep_tail(self, text: str, max_tokens: int) -> str:
+        if max_tokens <= 0:
+            return ""
+        data = text.encode("utf-8", "surrogatepass")
+        max_bytes = int(max_tokens * self.bytes_per_token)
+        if len(data) <= max_bytes:
+            return text
+        # Drop a multi-byte character cut in half at the start
+        return data[len(data) - max_bytes :].decode("utf-8", "ignore")
+
+
+class TiktokenTokenCounter(TokenCounter):
+    """Exact counts with a local `tiktoken` BPE, by encoding name or model name."""
+
+    def __init__(self, encoding: str = "cl100k_base", **kwargs):
+        super().__init__(**kwargs)
+        tiktoken = LazyImport.import_package("tiktoken", auto_install=False)
+        try:
+            self._encoding = tiktoken.get_encoding(encoding)
+        except ValueError:
+            self._encoding = tiktoken.encoding_for_model(encoding)
+
+    def _count(self, text: str) -> int:
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+    def keep_tail(self, text: str, max_tokens: int) -> str:
+        if max_tokens <= 0:
+            return ""
+        tokens = self._encoding.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        return self._encoding.decode(tokens[len(tokens) - max_tokens :])
@@ -24,13 +24,20 @@ SerializableRuntimeData = SerializableStateData
 SerializableRuntimeDataNamespace = SerializableStateDataNamespace
 
 # from .Storage import Storage, AsyncStorage
+from .EventLoopRunner import EventLoopRunner
 from .FunctionShifter import FunctionShifter
 from .DataFormatter import DataFormatter
 from .DataPathBuilder import DataPathBuilder
 from .LazyImport import LazyImport
 from .DataLocator import DataLocator
 from .GeneratorConsumer import GeneratorConsumer
+from .HTTPClientPool import HTTPClientPool
+from .MCPSessionPool import MCPSessionPool
+from .RequestRetry import RequestRetryPolicy, RetryBudget
 from .StreamingJSONCompleter import StreamingJSONCompleter
 from .StreamingJSONParser import StreamingJSONParser
+from .IncrementalStreamingJSONParser import IncrementalStreamingJSONParser
+from .StreamingEnsureKeysValidator import StreamingEnsureKeysValidator
+from .TokenCounter import TokenCounter, ByteLengthTokenCounter, TiktokenTokenCounter
 from .PythonSandbox import PythonSandbox
 from .TimeInfo import TimeInfo
@@ -0,0 +1,86 @@
+# Copyright 2023-2026 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measure `Settings.get` on deep inheritance chains.
+
+`uncached` rebuilds the merged view on every read, which is what every inherited
+read cost before views were cached. `cached` is the current `Settings.get`, and
+`cached+write` mutates the leaf between reads so every read rebuilds the view.
+
+Usage:
+    python benchmarks/settings_get.py [--depths 1 3 6 12] [--keys 200] [--reads 2000]
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from agently.utils import Settings
+
+
+def build_chain(depth: int, key_count: int) -> Settings:
+    node = Settings(name="level-0")
+    node.update({"plugins": {f"Plugin{ index }": {"option": index, "tags": ["a", "b"]} for index in range(key_count)}})
+    for level in range(1, depth):
+        node = Settings(name=f"level-{ level }", parent=node)
+        node.update({"plugins": {f"Plugin{ level }": {"option": level * 10}}, f"level_{ level }": True})
+    return node
+
+
+def measure(read, reads: int) -> float:
+    start = time.perf_counter()
+    for index in range(reads):
+        read(index)
+    return (time.perf_counter() - start) / reads * 1_000_000
+
+
+def main():
+    argument_parser = argparse.ArgumentParser()
+    argument_parser.add_argument("--depths", type=int, nargs="+", default=[1, 3, 6, 12])
+    argument_parser.add_argument("--keys", type=int, default=200)
+    argument_parser.add_argument("--reads", type=int, default=2000)
+    args = argument_parser.parse_args()
+
+    print(f"{ 'depth':>5} { 'uncached':>12} { 'cached':>12} { 'cached+write':>14} { 'speedup':>8}")
+    for depth in args.depths:
+        leaf = build_chain(depth, args.keys)
+        key = "plugins.Plugin1.option"
+
+        def uncached(_):
+            view = leaf._get_inherited_view(leaf, {})
+            return view["plugins"]["Plugin1"]["option"]
+
+        def cached(_):
+            return leaf.get(key)
+
+        def cached_with_write(index):
+            leaf.set("counter", index)
+            return leaf.get(key)
+
+        assert uncached(0) == cached(0)
+        uncached_us = measure(uncached, max(1, args.reads // 10))
+        cached_us = measure(cached, args.reads)
+        write_us = measure(cached_with_write, max(1, args.reads // 10))
+        print(
+            f"{ depth:>5} { uncached_us:>10.1f}us { cached_us:>10.2f}us { write_us:>12.1f}us"
+            f" { uncached_us / cached_us:>7.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+# Copyright 2023-2026 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measure per-token decode cost of `OpenAICompatible.broadcast_response`.
+
+`per-chunk paths` replays the previous decode loop: `json.loads`, a copy of every
+chunk and a `DataLocator.locate_path_in_dict` call per mapped field. `compiled` is
+the current `broadcast_response`, with content mappings compiled once per requester
+and orjson used when it is installed.
+
+A recorded stream can be passed with `--stream`, one SSE line (`data: {...}`) per
+line, otherwise an OpenAI-style stream is synthesized.
+
+Usage:
+    python benchmarks/sse_decode.py [--tokens 2000] [--rounds 5] [--stream recorded.sse]
+"""
+
+import sys
+import json
+import time
+import asyncio
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from agently import Agently
+from agently.utils import DataLocator, Settings
+from agently.builtins.plugins.ModelRequester.OpenAICompatible import OpenAICompatible
+import agently.builtins.plugins.ModelRequester.OpenAICompatible as openai_module
+
+
+def synthesize_stream(token_count: int) -> list[str]:
+    messages = [
+        json.dumps(
+            {
+                "id": "chatcmpl-1",
+                "object": "chat.completion.chunk",
+                "model": "gpt-4.1",
+                "choices": [{"index": 0, "delta": {"role": "assistant", "content": ""}, "finish_reason": None}],
+            }
+        )
+    ]
+    for index in range(token_count):
+        messages.append(
+            json.dumps(
+                {
+                    "id": "chatcmpl-1",
+                    "object": "chat.completion.chunk",
+                    "model": "gpt-4.1",
+                    "choices": [{"index": 0, "delta": {"content": f"tok{ index } "}, "finish_reason": None}],
+                }
+            )
+        )
+    messages.append(
+        json.dumps(
+            {
+                "id": "chatcmpl-1",
+                "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+                "usage": {"prompt_tokens": 10, "completion_tokens": token_count, "total_tokens": token_count + 10},
+            }
+        )
+    )
+    messages.append("[DONE]")
+    return messages
+
+
+def load_stream(path: str) -> list[str]:
+    messages = []
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        if line.startswith("data:"):
+            messages.append(line[5:].strip())
+    if not messages or messages[-1] != "[DONE]":
+        messages.append("[DONE]")
+    return messages
+
+
+async def decode_per_chunk_paths(plugin: OpenAICompatible, messages: list[str]):
+    content_mapping = plugin.plugin_settings.get("content_mapping")
+    assert isinstance(content_mapping, dict)
+    count = 0
+    for message in messages:
+        if message == "[DONE]":
+            break
+        loaded_message = json.loads(message)
+        _ = loaded_message.copy()
+        for field in ("id", "role", "reasoning", "delta", "tool_calls"):
+            if content_mapping[field]:
+                DataLocator.locate_path_in_dict(loaded_message, content_mapping[field], style="dot")
+        for extra_path in (content_mapping["extra_delta"] or {}).values():
+            DataLocator.locate_path_in_dict(loaded_message, extra_path, style="dot")
+        count += 1
+    return count
+
+
+async def decode_compiled(plugin: OpenAICompatible, messages: list[str]):
+    async def response_generator():
+        for message in messages:
+            yield "message", message
+
+    count = 0
+    async for _event, _data in plugin.broadcast_response(response_generator()):
+        count += 1
+    return count
+
+
+def measure(decode, messages: list[str], rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        plugin = OpenAICompatible(Agently.create_prompt(), Settings(parent=Agently.settings))
+        started_at = time.perf_counter()
+        asyncio.run(decode(plugin, messages))
+        best = min(best, time.perf_counter() - started_at)
+    return best / max(1, len(messages) - 1) * 1_000_000
+
+
+def main():
+    argument_parser = argparse.ArgumentParser()
+    argument_parser.add_argument("--tokens", type=int, default=2000)
+    argument_parser.add_argument("--rounds", type=int, default=5)
+    argument_parser.add_argument("--stream", type=str, default=None)
+    args = argument_parser.parse_args()
+
+    messages = load_stream(args.stream) if args.stream else synthesize_stream(args.tokens)
+    print(f"chunks: { len(messages) - 1 }, orjson: { openai_module.orjson is not None }")
+    baseline_us = measure(decode_per_chunk_paths, messages, args.rounds)
+    compiled_us = measure(decode_compiled, messages, args.rounds)
+    print(f"{ 'per-chunk paths':>16} { baseline_us:>8.2f}us/token")
+    print(f"{ 'compiled':>16} { compiled_us:>8.2f}us/token  ({ baseline_us / compiled_us:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# Copyright 2023-2026 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compare `StreamingJSONParser` (re-parse per chunk) with `IncrementalStreamingJSONParser`.
+
+Usage:
+    python benchmarks/streaming_json_parser.py [--sizes 1000 10000 100000] [--chunk-size 4] [--legacy-timeout 30]
+"""
+
+import sys
+import json
+import time
+import asyncio
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from agently.utils import IncrementalStreamingJSONParser, StreamingJSONParser
+
+SCHEMA = {
+    "title": (str,),
+    "summary": (str,),
+    "items": [
+        {
+            "id": (int,),
+            "name": (str,),
+            "description": (str,),
+            "tags": [(str,)],
+        }
+    ],
+}
+
+
+def build_output(target_size: int) -> str:
+    data = {"title": "Benchmark output", "summary": "A structured output used for streaming parse benchmark.", "items": []}
+    index = 0
+    while len(json.dumps(data, ensure_ascii=False)) < target_size:
+        data["items"].append(
+            {
+                "id": index,
+                "name": f"item-{ index }",
+                "description": "Some streaming text with a few words in it. " * 2,
+                "tags": ["alpha", "beta"],
+            }
+        )
+        index += 1
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+async def run_parser(parser, chunks: list[str], timeout: float | None):
+    start = time.perf_counter()
+    events = 0
+    for chunk in chunks:
+        async for _ in parser.parse_chunk(chunk):
+            events += 1
+        if timeout is not None and time.perf_counter() - start > timeout:
+            return None, events
+    async for _ in parser.finalize():
+        events += 1
+    return time.perf_counter() - start, events
+
+
+async def main():
+    argument_parser = argparse.ArgumentParser()
+    argument_parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    argument_parser.add_argument("--chunk-size", type=int, default=4)
+    argument_parser.add_argument("--legacy-timeout", type=float, default=30.0)
+    args = argument_parser.parse_args()
+
+    print(f"{ 'size':>8} { 'chunks':>7} { 'incremental':>12} { 'legacy':>12} { 'speedup':>8}")
+    for size in args.sizes:
+        text = build_output(size)
+        chunks = [text[i : i + args.chunk_size] for i in range(0, len(text), args.chunk_size)]
+        incremental_time, _ = await run_parser(IncrementalStreamingJSONParser(SCHEMA), chunks, None)
+        legacy_time, _ = await run_parser(StreamingJSONParser(SCHEMA), chunks, args.legacy_timeout)
+        assert incremental_time is not None
+        if legacy_time is None:
+            legacy_text = f">{ args.legacy_timeout:.0f}s"
+            speedup_text = f">{ args.legacy_timeout / incremental_time:.0f}x"
+        else:
+            legacy_text = f"{ legacy_time:.3f}s"
+            speedup_text = f"{ legacy_time / incremental_time:.0f}x"
+        print(f"{ len(text):>8} { len(chunks):>7} { incremental_time:>11.3f}s { legacy_text:>12} { speedup_text:>8}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
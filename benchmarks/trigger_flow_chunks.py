@@ -0,0 +1,94 @@
+# Copyright 2023-2026 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measure TriggerFlow chunk throughput per observation level.
+
+Every chunk passes a payload of `--payload` floats to the next one. `full+hook` has a hook
+that reads chunk event payloads, so inputs and outputs are serialized for every chunk,
+which is what every chunk paid before payloads were lazy. `full` has no payload reader,
+`lifecycle` and `off` set `runtime.trigger_flow_observation_level`. The logger is set to
+WARNING so the console is not part of the measurement.
+
+Usage:
+    python benchmarks/trigger_flow_chunks.py [--chunks 200] [--payload 2000] [--runs 5]
+"""
+
+import sys
+import time
+import asyncio
+import logging
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from agently import Agently, TriggerFlow
+
+
+def build_flow(chunk_count: int) -> TriggerFlow:
+    flow = TriggerFlow(name="chunk-throughput")
+
+    def step(data):
+        return data.value
+
+    process = flow.to(step)
+    for _ in range(chunk_count - 1):
+        process = process.to(step)
+    process.end()
+    return flow
+
+
+async def measure(flow: TriggerFlow, payload: dict, runs: int) -> float:
+    start = time.perf_counter()
+    for _ in range(runs):
+        await flow.async_start(payload)
+    return (time.perf_counter() - start) / runs
+
+
+async def main():
+    argument_parser = argparse.ArgumentParser()
+    argument_parser.add_argument("--chunks", type=int, default=200)
+    argument_parser.add_argument("--payload", type=int, default=2000)
+    argument_parser.add_argument("--runs", type=int, default=5)
+    args = argument_parser.parse_args()
+
+    Agently.logger.setLevel(logging.WARNING)
+    flow = build_flow(args.chunks)
+    payload = {"embedding": [index / 7 for index in range(args.payload)], "text": "x" * args.payload}
+
+    def read_payload(event):
+        event.get_payload()
+
+    cases = [("full+hook", "full", True), ("full", "full", False), ("lifecycle", "lifecycle", False), ("off", "off", False)]
+    print(f"{ 'level':>10} { 'per run':>10} { 'chunks/s':>10}")
+    for label, level, with_hook in cases:
+        flow.settings.set("runtime.trigger_flow_observation_level", level)
+        if with_hook:
+            Agently.event_center.register_hook(
+                read_payload,
+                event_types=["chunk.started", "chunk.completed"],
+                hook_name="benchmark.read_payload",
+            )
+        try:
+            await measure(flow, payload, 1)
+            seconds = await measure(flow, payload, args.runs)
+        finally:
+            if with_hook:
+                Agently.event_center.unregister_hook("benchmark.read_payload")
+        print(f"{ label:>10} { seconds * 1000:>8.1f}ms { args.chunks / seconds:>10.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,120 @@
+# Copyright 2023-2026 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measure TriggerFlow signal dispatch throughput on fan-out/fan-in graphs.
+
+- `batch`: `--layers` batches of `--width` branches each, every batch fans in before the next.
+- `when_and`: one signal fans out to `--width` chunks joined by `when(mode="and")`.
+- `for_each`: `--width` items through a `for_each` with `--layers` chunks per item.
+
+Signals per run are counted once, then runs are timed. `runtime.trigger_flow_observation_level`
+is `off` so only dispatch is measured.
+
+Usage:
+    python benchmarks/trigger_flow_signals.py [--width 50] [--layers 5] [--runs 5]
+"""
+
+import sys
+import time
+import asyncio
+import logging
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from agently import Agently, TriggerFlow
+
+
+def step(data):
+    return data.value
+
+
+def build_batch_flow(width: int, layers: int) -> TriggerFlow:
+    flow = TriggerFlow(name="signals-batch")
+    process = flow.to(step)
+    for _ in range(layers):
+        process = process.batch(*[(f"branch_{ index }", step) for index in range(width)]).to(lambda data: 0)
+    process.end()
+    return flow
+
+
+def build_when_and_flow(width: int, layers: int) -> TriggerFlow:
+    flow = TriggerFlow(name="signals-when-and")
+    events = [f"Branch-{ index }" for index in range(width)]
+
+    async def fan_out(data):
+        for event in events:
+            await data.async_emit(event, data.value)
+
+    flow.to(fan_out)
+    flow.when({"event": events}, mode="and").to(lambda data: len(data.value)).end()
+    return flow
+
+
+def build_for_each_flow(width: int, layers: int) -> TriggerFlow:
+    flow = TriggerFlow(name="signals-for-each")
+    process = flow.for_each()
+    for _ in range(layers):
+        process = process.to(step)
+    process.end_for_each().end()
+    return flow
+
+
+async def count_signals(flow: TriggerFlow, value) -> int:
+    execution = flow.create_execution()
+    dispatch = execution._async_dispatch_signal
+    count = 0
+
+    async def counting_dispatch(signal):
+        nonlocal count
+        count += 1
+        return await dispatch(signal)
+
+    execution._async_dispatch_signal = counting_dispatch  # type: ignore[method-assign]
+    await execution.async_start(value)
+    return count
+
+
+async def measure(flow: TriggerFlow, value, runs: int) -> float:
+    start = time.perf_counter()
+    for _ in range(runs):
+        await flow.async_start(value)
+    return (time.perf_counter() - start) / runs
+
+
+async def main():
+    argument_parser = argparse.ArgumentParser()
+    argument_parser.add_argument("--width", type=int, default=50)
+    argument_parser.add_argument("--layers", type=int, default=5)
+    argument_parser.add_argument("--runs", type=int, default=5)
+    args = argument_parser.parse_args()
+
+    Agently.logger.setLevel(logging.WARNING)
+    Agently.settings.set("runtime.trigger_flow_observation_level", "off")
+    cases: list[tuple[str, TriggerFlow, object]] = [
+        ("batch", build_batch_flow(args.width, args.layers), 1),
+        ("when_and", build_when_and_flow(args.width, args.layers), 1),
+        ("for_each", build_for_each_flow(args.width, args.layers), list(range(args.width))),
+    ]
+    print(f"{ 'graph':>10} { 'signals':>8} { 'per run':>10} { 'signals/s':>10}")
+    for label, flow, value in cases:
+        signals = await count_signals(flow, value)
+        seconds = await measure(flow, value, args.runs)
+        print(f"{ label:>10} { signals:>8} { seconds * 1000:>8.1f}ms { signals / seconds:>10.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
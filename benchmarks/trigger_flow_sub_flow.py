@@ -0,0 +1,95 @@
+# Copyright 2023-2026 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measure the per-call overhead of `.to_sub_flow()` inside `for_each` against a plain chunk.
+
+The child flow has `--steps` chunks and a `--flow-data` entries flow_data, which every call
+used to deep copy along with the child blueprint. `runtime.trigger_flow_observation_level` is
+`off` so only the flow machinery is measured.
+
+Usage:
+    python benchmarks/trigger_flow_sub_flow.py [--items 2000] [--steps 5] [--flow-data 200] [--runs 3]
+"""
+
+import sys
+import time
+import asyncio
+import logging
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from agently import Agently, TriggerFlow
+
+
+def step(data):
+    return data.value
+
+
+def build_child_flow(step_count: int, flow_data_size: int) -> TriggerFlow:
+    child_flow = TriggerFlow(name="sub-flow-child")
+    for index in range(flow_data_size):
+        child_flow.set_flow_data(f"key_{ index }", {"index": index, "tags": ["a", "b", "c"]}, emit=False)
+    process = child_flow.to(step)
+    for _ in range(step_count - 1):
+        process = process.to(step)
+    process.end()
+    return child_flow
+
+
+def build_chunk_flow() -> TriggerFlow:
+    flow = TriggerFlow(name="sub-flow-baseline")
+    flow.for_each().to(step).end_for_each().end()
+    return flow
+
+
+def build_sub_flow_flow(child_flow: TriggerFlow) -> TriggerFlow:
+    flow = TriggerFlow(name="sub-flow-parent")
+    flow.for_each().to_sub_flow(child_flow).end_for_each().end()
+    return flow
+
+
+async def measure(flow: TriggerFlow, items: list[int], runs: int) -> float:
+    start = time.perf_counter()
+    for _ in range(runs):
+        await flow.async_start(items)
+    return (time.perf_counter() - start) / runs
+
+
+async def main():
+    argument_parser = argparse.ArgumentParser()
+    argument_parser.add_argument("--items", type=int, default=2000)
+    argument_parser.add_argument("--steps", type=int, default=5)
+    argument_parser.add_argument("--flow-data", type=int, default=200)
+    argument_parser.add_argument("--runs", type=int, default=3)
+    args = argument_parser.parse_args()
+
+    Agently.logger.setLevel(logging.WARNING)
+    Agently.settings.set("runtime.trigger_flow_observation_level", "off")
+    items = list(range(args.items))
+    cases = [
+        ("chunk", build_chunk_flow()),
+        ("sub_flow", build_sub_flow_flow(build_child_flow(args.steps, args.flow_data))),
+    ]
+    print(f"{ 'case':>10} { 'per run':>10} { 'per item':>10}")
+    for label, flow in cases:
+        await measure(flow, items[:10], 1)
+        seconds = await measure(flow, items, args.runs)
+        print(f"{ label:>10} { seconds * 1000:>8.1f}ms { seconds / args.items * 1_000_000:>8.1f}us")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
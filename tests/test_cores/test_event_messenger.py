@@ -1,3 +1,6 @@
+import time
+import asyncio
+import threading
 from typing import TYPE_CHECKING
 
 import pytest
@@ -99,3 +102,197 @@ async def test_event_center_infers_source_for_emitter_and_direct_emit():
     assert len(captured) == 2
     assert captured[0].source == "InferredOwner"
     assert captured[1].source == "InferredOwner"
+
+
+@pytest.mark.asyncio
+async def test_event_center_skips_unobserved_events():
+    ec = EventCenter()
+    captured: list["RuntimeEvent"] = []
+    accept_debug = {"value": False}
+
+    def capture(event: "RuntimeEvent"):
+        captured.append(event)
+
+    def broken(event: "RuntimeEvent"):
+        raise ValueError("hook failure")
+
+    ec.register_hook(broken, event_types="custom.info", hook_name="broken")
+    ec.register_hook(capture, hook_name="warning_only", min_level="WARNING")
+    ec.register_hook(
+        capture,
+        event_types="custom.debug",
+        hook_name="dynamic_debug",
+        event_filter=lambda event_type, level: accept_debug["value"],
+    )
+
+    assert ec.is_observed("custom.info", "INFO")
+    assert ec.is_observed("custom.other", "ERROR")
+    assert not ec.is_observed("custom.other", "INFO")
+    assert not ec.is_observed("custom.debug", "DEBUG")
+
+    # Unobserved events are dropped before validation, so an invalid payload is never touched.
+    await ec.async_emit({"event_type": "custom.debug", "level": "DEBUG", "payload": object()})
+    assert captured == []
+
+    accept_debug["value"] = True
+    assert ec.is_observed("custom.debug", "DEBUG")
+    await ec.async_emit({"event_type": "custom.debug", "level": "DEBUG", "message": "debug"})
+    await ec.async_emit({"event_type": "custom.info", "message": "info"})
+    await ec.async_emit({"event_type": "custom.info", "level": "ERROR", "message": "error"})
+
+    assert [event.message for event in captured] == ["debug", "error"]
+
+    ec.unregister_hook("dynamic_debug")
+    assert not ec.is_observed("custom.debug", "DEBUG")
+
+
+@pytest.mark.asyncio
+async def test_event_center_runs_sync_hooks_off_loop_and_async_hooks_concurrently():
+    ec = EventCenter()
+    loop_thread = threading.get_ident()
+    sync_threads: list[int] = []
+    left_seen = asyncio.Event()
+    right_seen = asyncio.Event()
+
+    def slow_sync_hook(event: "RuntimeEvent"):
+        time.sleep(0.05)
+        sync_threads.append(threading.get_ident())
+
+    async def left(event: "RuntimeEvent"):
+        left_seen.set()
+        await right_seen.wait()
+
+    async def right(event: "RuntimeEvent"):
+        right_seen.set()
+        await left_seen.wait()
+
+    ec.register_hook(slow_sync_hook, hook_name="slow_sync")
+    await ec.async_emit({"event_type": "custom.info", "message": "sync"})
+    assert sync_threads and sync_threads[0] != loop_thread
+
+    ec.unregister_hook("slow_sync")
+    ec.register_hook(left, hook_name="left")
+    ec.register_hook(right, hook_name="right")
+    # Sequential delivery would wait forever, each hook waits for the other one
+    await asyncio.wait_for(ec.async_emit({"event_type": "custom.info", "message": "async"}), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_event_center_dispatcher_delivers_in_background():
+    ec = EventCenter()
+    captured: list[str] = []
+    batches: list[int] = []
+    release = threading.Event()
+
+    def slow_capture(event: "RuntimeEvent"):
+        release.wait(5)
+        captured.append(str(event.message))
+
+    def batch_capture(events: list["RuntimeEvent"]):
+        batches.append(len(events))
+
+    ec.register_hook(slow_capture, hook_name="slow_capture")
+    ec.register_hook(lambda event: None, hook_name="batch_capture", batch_callback=batch_capture)
+    ec.enable_dispatcher(capacity=3, batch_size=10, overflow_policy="drop_oldest_debug")
+    try:
+        # The first event is taken by the worker which then blocks in the slow hook.
+        await ec.async_emit({"event_type": "custom.info", "message": "first"})
+        while ec.get_metrics()["dispatcher"]["in_flight"] == 0:
+            await asyncio.sleep(0.001)
+        for index in range(3):
+            await ec.async_emit({"event_type": "custom.debug", "level": "DEBUG", "message": f"debug-{ index }"})
+        await ec.async_emit({"event_type": "custom.info", "message": "kept"})
+        metrics = ec.get_metrics()["dispatcher"]
+        assert metrics["queue_depth"] == 3
+        assert metrics["dropped_by_level"] == {"DEBUG": 1}
+
+        release.set()
+        assert await ec.async_flush(timeout=5)
+        assert captured == ["first", "debug-1", "debug-2", "kept"]
+        assert batches == [3]
+        metrics = ec.get_metrics()["dispatcher"]
+        assert metrics["delivered"] == 4
+        assert metrics["hooks"]["slow_capture"]["events"] == 4
+    finally:
+        release.set()
+        ec.disable_dispatcher()
+    assert ec.get_metrics()["mode"] == "inline"
+
+
+def test_event_dispatcher_sample_and_block_policies():
+    ec = EventCenter()
+    captured: list[str] = []
+    release = threading.Event()
+
+    def capture(event: "RuntimeEvent"):
+        release.wait(5)
+        captured.append(str(event.message))
+
+    ec.register_hook(capture, hook_name="capture")
+    ec.enable_dispatcher(capacity=2, overflow_policy="sample", sample_rate=3)
+    try:
+        ec.emit({"event_type": "custom.info", "message": "in-flight"})
+        while ec.get_metrics()["dispatcher"]["in_flight"] == 0:
+            time.sleep(0.001)
+        for index in range(8):
+            ec.emit({"event_type": "custom.info", "message": str(index)})
+        release.set()
+        assert ec.flush(timeout=5)
+        # 0 and 1 fill the queue, then every third overflowing event evicts the oldest one.
+        assert captured == ["in-flight", "4", "7"]
+        assert ec.get_metrics()["dispatcher"]["dropped"] == 6
+    finally:
+        release.set()
+        ec.disable_dispatcher()
+
+    release.clear()
+    captured.clear()
+    ec.enable_dispatcher(capacity=1, overflow_policy="block")
+    try:
+        ec.emit({"event_type": "custom.info", "message": "in-flight"})
+        while ec.get_metrics()["dispatcher"]["in_flight"] == 0:
+            time.sleep(0.001)
+        ec.emit({"event_type": "custom.info", "message": "queued"})
+        threading.Timer(0.05, release.set).start()
+        started_at = time.monotonic()
+        ec.emit({"event_type": "custom.info", "message": "blocked"})
+        assert time.monotonic() - started_at >= 0.03
+        assert ec.flush(timeout=5)
+        assert captured == ["in-flight", "queued", "blocked"]
+        assert ec.get_metrics()["dispatcher"]["dropped"] == 0
+    finally:
+        release.set()
+        ec.disable_dispatcher()
+
+
+@pytest.mark.asyncio
+async def test_lazy_payload_is_built_only_when_needed():
+    from agently.types.data import LazyPayload
+
+    ec = EventCenter()
+    builds: list[int] = []
+    captured: list["RuntimeEvent"] = []
+
+    def build_payload():
+        builds.append(1)
+        return {"expensive": True}
+
+    def lazy_hook(event: "RuntimeEvent"):
+        captured.append(event)
+
+    ec.register_hook(lazy_hook, hook_name="lazy_hook", lazy_payload=True)
+    await ec.async_emit({"event_type": "custom.lazy", "message": "built", "payload": LazyPayload(build_payload)})
+    assert builds == []
+    assert isinstance(captured[0].payload, LazyPayload)
+    assert captured[0].get_payload() == {"expensive": True}
+    assert captured[0].get_payload() == {"expensive": True}
+    assert len(builds) == 1
+
+    def eager_hook(event: "RuntimeEvent"):
+        captured.append(event)
+
+    ec.register_hook(eager_hook, hook_name="eager_hook")
+    captured.clear()
+    await ec.async_emit({"event_type": "custom.lazy", "payload": LazyPayload(build_payload)})
+    assert len(builds) == 2
+    assert [event.payload for event in captured] == [{"expensive": True}, {"expensive": True}]
@@ -75,10 +75,45 @@ class MockObservationRequester:
         yield "meta", {"provider": "mock-observation", "model": "mock-1"}
 
 
-def _create_request():
+class MockEarlyAbortRequester(MockObservationRequester):
+    name = "MockEarlyAbortRequester"
+    closed_attempts: list[int] = []
+
+    @classmethod
+    def reset(cls):
+        cls.attempts = 0
+        cls.closed_attempts = []
+
+    async def request_model(self, request_data: AgentlyRequestData):
+        attempt = int(request_data.data.get("attempt", 1))
+        reply = '"done"' if attempt > 1 else '"missing"'
+        info_key = "reply" if attempt > 1 else "note"
+        chunks = ['{"info": {"summary": "ok", ', f'"{ info_key }": { reply }', '}, "details": "']
+        chunks.extend(["more text " for _ in range(20)])
+        chunks.append('"}')
+        try:
+            for chunk in chunks:
+                yield "message", chunk
+                await asyncio.sleep(0)
+        finally:
+            type(self).closed_attempts.append(attempt)
+
+    async def broadcast_response(
+        self,
+        response_generator: AsyncGenerator[tuple[str, Any], None],
+    ):
+        response_text = ""
+        async for event, data in response_generator:
+            if event == "message":
+                response_text += str(data)
+                yield "delta", str(data)
+        yield "done", response_text
+
+
+def _create_request(requester: type[MockObservationRequester] = MockObservationRequester):
     settings = Settings(name="ObservationTestSettings", parent=Agently.settings)
     plugin_manager = PluginManager(settings, parent=Agently.plugin_manager, name="ObservationTestPluginManager")
-    plugin_manager.register("ModelRequester", MockObservationRequester, activate=True)
+    plugin_manager.register("ModelRequester", requester, activate=True)
     return ModelRequest(
         plugin_manager,
         agent_name="observation-agent",
@@ -208,6 +243,48 @@ async def test_model_request_retry_creates_multiple_attempt_runs():
         Agently.event_center.unregister_hook(hook_name)
 
 
+@pytest.mark.asyncio
+async def test_model_request_aborts_stream_missing_ensure_keys_early():
+    MockEarlyAbortRequester.reset()
+    captured = []
+
+    async def capture(event):
+        captured.append(event)
+
+    hook_name = "test_model_request_observation.early_abort_capture"
+    Agently.event_center.register_hook(capture, hook_name=hook_name)
+    try:
+        request = _create_request(MockEarlyAbortRequester)
+        request.input("Return a structured operations update.")
+        request.output(
+            {
+                "info": {"summary": (str,), "reply": (str,)},
+                "details": (str,),
+            }
+        )
+
+        data = await request.get_response().async_get_data(ensure_keys=["info.reply"], max_retries=1)
+
+        assert data["info"]["reply"] == "done"
+        assert MockEarlyAbortRequester.attempts == 2
+        assert MockEarlyAbortRequester.closed_attempts == [1, 2]
+
+        retry_event = next(event for event in captured if event.event_type == "model.retrying")
+        early_abort = retry_event.payload["early_abort"]
+        assert "info.reply" in early_abort["reason"]
+        assert early_abort["streamed_chunks"] == 3
+        assert "more text" not in retry_event.payload["response_text"]
+
+        savings_event = next(event for event in captured if event.event_type == "model.early_abort_savings")
+        assert savings_event.payload["aborted_attempts"] == 1
+        assert savings_event.payload["estimated_saved_chars"] >= 200
+
+        completed_events = [event for event in captured if event.event_type == "model.completed"]
+        assert len(completed_events) == 1
+    finally:
+        Agently.event_center.unregister_hook(hook_name)
+
+
 @pytest.mark.asyncio
 async def test_agent_turn_wraps_request_and_model_request_runs():
     MockObservationRequester.reset()
@@ -105,3 +105,72 @@ async def test_session_legacy_execution_aliases():
     with pytest.warns(DeprecationWarning):
         await session.async_execute_strategy("legacy_drop")
     assert len(session.context_window) == 0
+
+
+@pytest.mark.asyncio
+async def test_session_measures_each_message_once():
+    session = Session()
+    session.session_settings.set("max_length", 50)
+    measured = []
+
+    def length_handler(message):
+        measured.append(message.content)
+        return len(message.content)
+
+    session.register_length_handler(length_handler)
+    for index in range(200):
+        await session.async_add_chat_history({"role": "user", "content": f"message-{ index:03d}"})
+
+    assert len(measured) == 200
+    assert [message.content for message in session.context_window] == [
+        f"message-{ index }" for index in range(196, 200)
+    ]
+    assert session.get_context_window_length() == 44
+    assert len(session.full_context) == 200
+
+    await session.async_set_chat_history([{"role": "user", "content": "x" * 80}])
+    assert session.context_window[0].content == "x" * 50
+    assert session.get_context_window_length() == 50
+
+
+@pytest.mark.asyncio
+async def test_session_token_budget_cut_with_cached_counts():
+    from agently.utils import ByteLengthTokenCounter, TokenCounter
+
+    counter = ByteLengthTokenCounter(bytes_per_token=1, message_overhead=2)
+    session = Session(settings={"session": {"max_length": 30}})
+    session.register_length_handler(counter)
+    await session.async_add_chat_history({"role": "user", "content": "a" * 20})
+    await session.async_add_chat_history({"role": "assistant", "content": "b" * 10})
+    await session.async_add_chat_history({"role": "user", "content": "c" * 10})
+
+    assert [message.content for message in session.context_window] == ["a" * 4, "b" * 10, "c" * 10]
+    assert session.get_context_window_length() == 30
+    assert counter.count("b" * 10) == 10
+    assert counter.get_cache_stats()["hits"] >= 1
+
+    assert TokenCounter.from_name("bytes") is TokenCounter.from_name("bytes")
+    tokenized_session = Session(settings={"session": {"tokenizer": "bytes:1", "max_length": 8}})
+    await tokenized_session.async_add_chat_history({"role": "user", "content": "x" * 20})
+    assert tokenized_session.context_window[0].content == "x" * 4
+
+
+@pytest.mark.asyncio
+async def test_session_measures_replaced_middle_message_of_kept_window():
+    from agently.types.data import ChatMessage
+
+    session = Session(auto_resize=False)
+    session.register_length_handler(lambda message: len(message.content))
+    await session.async_set_chat_history(
+        [{"role": "user", "content": content} for content in ("a" * 10, "b" * 20, "c" * 30, "d" * 40)]
+    )
+    assert session.get_context_window_length() == 100
+
+    def shorten_middle(full_context, context_window, memo, session_settings):
+        # Same first and last message as the old tail, the one in between is replaced
+        return None, [context_window[1], ChatMessage(role="user", content="c" * 3), context_window[3]], None
+
+    session.register_resize_handler("shorten_middle", shorten_middle)
+    await session.async_run_resize_strategy("shorten_middle")
+    assert [len(message.content) for message in session.context_window] == [20, 3, 40]
+    assert session.get_context_window_length() == 63
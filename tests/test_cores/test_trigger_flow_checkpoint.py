@@ -0,0 +1,101 @@
+import pytest
+
+from agently import TriggerFlow, TriggerFlowRuntimeData
+from agently.core.TriggerFlow.Checkpoint import TriggerFlowCheckpointStore
+
+
+def _build_review_flow(checkpoint_path: str):
+    flow = TriggerFlow(name="checkpoint-review-flow")
+    flow.set_settings("runtime.trigger_flow_checkpoint.path", checkpoint_path)
+    flow.set_settings("runtime.trigger_flow_checkpoint.compact_every", 3)
+
+    async def draft(data: TriggerFlowRuntimeData):
+        for index in range(4):
+            await data.async_append_runtime_data("steps", f"draft-{ index }")
+        await data.async_set_runtime_data("draft.topic", data.value)
+        await data.async_set_runtime_data("scratch", True)
+        return data.value
+
+    async def ask_review(data: TriggerFlowRuntimeData):
+        await data.async_del_runtime_data("scratch")
+        return await data.async_pause_for(
+            type="human_input",
+            payload={"question": "approve?"},
+            resume_event="Review",
+        )
+
+    async def finalize(data: TriggerFlowRuntimeData):
+        return {
+            "steps": data.get_runtime_data("steps"),
+            "draft": data.get_runtime_data("draft"),
+            "scratch": data.get_runtime_data("scratch"),
+            "review": data.value,
+        }
+
+    flow.to(draft).to(ask_review)
+    flow.when("Review").to(finalize).end()
+    return flow
+
+
+@pytest.mark.asyncio
+async def test_trigger_flow_checkpoints_after_chunks_and_resumes_in_new_flow(tmp_path):
+    checkpoint_path = str(tmp_path / "checkpoints.db")
+    flow = _build_review_flow(checkpoint_path)
+    execution = await flow.async_start_execution("pricing", wait_for_result=False)
+    assert execution.get_status() == "waiting"
+
+    store = TriggerFlowCheckpointStore.from_path(checkpoint_path, compact_every=3)
+    assert store.list_executions() == [execution.id]
+    stats = store.get_stats(execution.id)
+    assert stats["seq"] == 7
+    assert stats["pending"] < 3
+
+    state = store.load_state(execution.id)
+    assert state is not None
+    assert state["status"] == "waiting"
+    assert state["runtime_data"] == execution.get_runtime_data()
+
+    restarted_flow = _build_review_flow(checkpoint_path)
+    restored = restarted_flow.create_execution().load_checkpoint(execution.id)
+    assert restored.id == execution.id
+    interrupt_id = next(iter(restored.get_pending_interrupts()))
+
+    await restored.async_continue_with(interrupt_id, {"approved": True})
+    assert await restored.async_get_result(timeout=1) == {
+        "steps": [f"draft-{ index }" for index in range(4)],
+        "draft": {"topic": "pricing"},
+        "scratch": None,
+        "review": {"approved": True},
+    }
+    assert store.load_state(execution.id)["status"] == "completed"
+
+    with pytest.raises(KeyError):
+        restarted_flow.create_execution().load_checkpoint("missing")
+    with pytest.raises(RuntimeError):
+        TriggerFlow().create_execution().load_checkpoint(execution.id)
+
+
+@pytest.mark.asyncio
+async def test_trigger_flow_checkpoint_appends_store_only_the_appended_item(tmp_path):
+    checkpoint_path = str(tmp_path / "checkpoints.db")
+    flow = TriggerFlow(name="checkpoint-append-flow")
+    flow.set_settings("runtime.trigger_flow_checkpoint.path", checkpoint_path)
+    flow.set_settings("runtime.trigger_flow_checkpoint.compact_every", 1000)
+
+    async def collect(data: TriggerFlowRuntimeData):
+        for index in range(20):
+            await data.async_append_runtime_data("rows", f"{ index:03d}" + "x" * 97)
+        return data.value
+
+    flow.to(collect).end()
+    execution = await flow.async_start_execution("go", wait_for_result=True)
+
+    store = TriggerFlowCheckpointStore.from_path(checkpoint_path, compact_every=1000)
+    rows = store._connection.execute(
+        "SELECT operation, value FROM changes WHERE execution_id = ?",
+        (execution.id,),
+    ).fetchall()
+    assert [operation for operation, _ in rows] == ["append"] * 20
+    # Each row holds one ~100 byte item instead of the whole list so far
+    assert sum(len(value) for _, value in rows) < 2500
+    assert store.load_state(execution.id)["runtime_data"] == execution.get_runtime_data()
@@ -87,6 +87,31 @@ def test_trigger_flow_config_and_mermaid_include_contract_metadata():
     assert "ContractConfigInput" in restored.to_mermaid(mode="detailed")
 
 
+@pytest.mark.asyncio
+async def test_trigger_flow_routing_table_is_shared_until_blue_print_changes():
+    flow = TriggerFlow(name="routing-flow")
+
+    async def double(data: TriggerFlowRuntimeData):
+        return data.value * 2
+
+    flow.to(double).end()
+    first = flow.create_execution()
+    second = flow.create_execution()
+    assert first._routes is second._routes
+
+    route = first._routes[("event", "START")][0]
+    assert route.operator is not None
+    assert route.chunk_meta is not None
+    assert route.chunk_meta["chunk_name"] == "double"
+    assert route.chunk_meta["listen_signals"][0]["trigger_event"] == "START"
+
+    flow.when("Extra").to(double)
+    third = flow.create_execution()
+    assert third._routes is not first._routes
+    assert ("event", "Extra") in third._routes
+    assert await third.async_start(2) == 4
+
+
 @pytest.mark.asyncio
 async def test_trigger_flow_batch_round_trip_and_mermaid():
     flow = TriggerFlow(name="batch-flow")
@@ -530,6 +555,62 @@ async def test_trigger_flow_sub_flow_uses_isolated_child_flow_state():
     assert child_flow.get_flow_data("count") is None
 
 
+@pytest.mark.asyncio
+async def test_trigger_flow_sub_flow_template_is_compiled_once_per_child_change():
+    child_flow = TriggerFlow(name="child-template-flow")
+    child_flow.set_flow_data("seen", [], emit=False)
+
+    async def child_record(data: TriggerFlowRuntimeData):
+        seen = data.get_flow_data("seen") + [data.value]
+        data.set_flow_data("seen", seen)
+        return f"{ data.get_flow_data('prefix', '') }{ len(seen) }"
+
+    child_flow.to(child_record).end()
+
+    parent_flow = TriggerFlow(name="parent-template-flow")
+    parent_flow.for_each().to_sub_flow(child_flow).end_for_each().end()
+
+    compiled = []
+    blue_print = parent_flow._blue_print
+    original_instantiate = blue_print._instantiate_isolated_sub_flow
+
+    def counting_instantiate(trigger_flow: TriggerFlow):
+        compiled.append(trigger_flow.name)
+        return original_instantiate(trigger_flow)
+
+    blue_print._instantiate_isolated_sub_flow = counting_instantiate
+
+    assert await parent_flow.async_start([1, 2, 3]) == ["1", "1", "1"]
+    assert await parent_flow.async_start([4]) == ["1"]
+    assert compiled == ["child-template-flow"]
+    assert child_flow.get_flow_data("seen") == []
+
+    child_flow.set_flow_data("prefix", "#", emit=False)
+    assert await parent_flow.async_start([5, 6]) == ["#1", "#1"]
+    assert compiled == ["child-template-flow", "child-template-flow"]
+
+
+def test_trigger_flow_isolated_fork_binds_its_own_methods():
+    import inspect
+
+    template = TriggerFlow(name="fork-template-flow")
+    template.to(lambda data: data.value).end()
+    fork = template._fork_isolated()
+
+    for name, value in vars(fork).items():
+        if inspect.ismethod(value):
+            assert value.__self__ is not template, name
+            assert value.__self__ is not template._start_process, name
+    assert fork.to.__self__ is fork._start_process
+    assert fork._start_process._flow_chunk.__self__ is fork
+
+    fork.set_flow_data("scope", "fork", emit=False)
+    assert fork.get_flow_data("scope") == "fork"
+    assert template.get_flow_data("scope") is None
+    assert fork.start_execution(1).id in fork._executions
+    assert len(template._executions) == 0
+
+
 @pytest.mark.asyncio
 async def test_trigger_flow_sub_flow_bridges_child_runtime_stream():
     child_flow = TriggerFlow(name="child-stream-flow")
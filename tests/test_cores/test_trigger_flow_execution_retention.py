@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+from agently import TriggerFlow, TriggerFlowRuntimeData
+
+
+def _build_flow(name: str):
+    flow = TriggerFlow(name=name)
+
+    async def double(data: TriggerFlowRuntimeData):
+        data.set_runtime_data("input", data.value)
+        return data.value * 2
+
+    flow.to(double).end()
+    return flow
+
+
+@pytest.mark.asyncio
+async def test_trigger_flow_evicts_finished_executions_and_restores_spilled_ones(tmp_path):
+    flow = _build_flow("retention-evict-on-finish")
+    flow.set_settings("runtime.trigger_flow_execution_retention.evict_on_finish", True)
+    flow.set_settings("runtime.trigger_flow_execution_retention.spill_dir", str(tmp_path))
+    flow.set_flow_data("current", "live", emit=False)
+
+    execution_ids = []
+    for value in range(3):
+        execution = await flow.async_start_execution(value, wait_for_result=True)
+        assert await execution.async_get_result() == value * 2
+        execution_ids.append(execution.id)
+
+    await flow._executions.async_wait_spills()
+    stats = flow.get_execution_stats()
+    assert stats["live"] == 0 and stats["finished"] == 0
+    assert stats["evicted_by"]["finish"] == 3
+    assert stats["spilled"] == 3
+    assert sorted(path.stem for path in tmp_path.iterdir()) == sorted(execution_ids)
+
+    flow.set_flow_data("current", "changed", emit=False)
+    restored = flow.get_execution(execution_ids[1])
+    assert restored is not None
+    assert restored.id == execution_ids[1]
+    assert await restored.async_get_result() == 2
+    assert restored.get_runtime_data("input") == 1
+    assert flow.get_flow_data("current") == "changed"
+    assert flow.get_execution_stats()["restored"] == 1
+    # The restored execution stays registered instead of being evicted and spilled again
+    await flow._executions.async_wait_spills()
+    stats = flow.get_execution_stats()
+    assert stats["evicted_by"]["finish"] == 3
+    assert stats["spilled"] == 3
+    assert execution_ids[1] in flow._executions
+    assert flow.get_execution(execution_ids[1]) is restored
+    assert flow.get_execution("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_trigger_flow_evicts_only_after_side_branches_finish(tmp_path):
+    flow = TriggerFlow(name="retention-side-branch")
+    flow.set_settings("runtime.trigger_flow_execution_retention.evict_on_finish", True)
+    flow.set_settings("runtime.trigger_flow_execution_retention.spill_dir", str(tmp_path))
+
+    async def late(data: TriggerFlowRuntimeData):
+        await asyncio.sleep(0.05)
+        data.set_runtime_data("late", 1)
+
+    flow.to(lambda data: data.value).side_branch(late)
+    flow.to(lambda data: data.value).end()
+
+    execution = flow.create_execution()
+    start_task = asyncio.create_task(execution.async_start("done", wait_for_result=False))
+    assert await execution.async_get_result(timeout=1) == "done"
+    # The result is set while the side branch is still running, the execution stays live
+    assert flow.get_execution(execution.id) is execution
+    assert not list(tmp_path.iterdir())
+
+    await start_task
+    assert flow.get_execution(execution.id) is execution
+    await flow._executions.async_wait_spills()
+    assert flow.get_execution_stats()["spilled"] == 1
+
+    restored = flow.get_execution(execution.id)
+    assert restored is not None and restored is not execution
+    assert restored.get_runtime_data("late") == 1
+
+
+@pytest.mark.asyncio
+async def test_trigger_flow_execution_retention_max_count_and_ttl():
+    flow = _build_flow("retention-max-count")
+    flow.set_settings("runtime.trigger_flow_execution_retention.max_count", 2)
+
+    executions = [await flow.async_start_execution(value, wait_for_result=True) for value in range(3)]
+    assert flow.get_execution(executions[0].id) is None
+    assert flow.get_execution(executions[1].id) is executions[1]
+
+    fourth = await flow.async_start_execution(3, wait_for_result=True)
+    assert flow.get_execution(executions[2].id) is None
+    assert flow.get_execution(executions[1].id) is executions[1]
+    assert flow.get_execution(fourth.id) is fourth
+    assert flow.get_execution_stats()["evicted_by"]["max_count"] == 2
+
+    waiting = flow.create_execution()
+    flow.set_settings("runtime.trigger_flow_execution_retention.ttl", 0)
+    stats = flow.get_execution_stats()
+    assert stats["finished"] == 0 and stats["live"] == 1
+    assert stats["evicted_by"]["ttl"] == 2
+    assert flow.get_execution(waiting.id) is waiting
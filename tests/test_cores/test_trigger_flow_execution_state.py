@@ -225,3 +225,43 @@ async def test_trigger_flow_runtime_stream_propagates_parent_run_context():
     assert event.run.agent_id == "agent-stream"
     assert event.run.agent_name == "stream-owner"
     assert event.run.session_id == "stream-session"
+
+
+@pytest.mark.asyncio
+async def test_trigger_flow_observation_levels_and_lazy_chunk_payloads():
+    from agently.types.data import LazyPayload
+
+    flow = TriggerFlow(name="observation-level-flow")
+    flow.to(lambda data: {"doubled": data.value * 2}).to(lambda data: data.value).end()
+    captured = []
+
+    async def capture(event):
+        captured.append(event)
+
+    Agently.event_center.register_hook(
+        capture,
+        hook_name="test_trigger_flow_execution_state.observation",
+        lazy_payload=True,
+    )
+    try:
+        assert await flow.async_start(21) == {"doubled": 42}
+        chunk_events = [event for event in captured if event.event_type.startswith("chunk.")]
+        completed_events = [event for event in chunk_events if event.event_type == "chunk.completed"]
+        assert len(completed_events) >= 2
+        assert len(completed_events) == len(chunk_events) - len(completed_events)
+        assert all(isinstance(event.payload, LazyPayload) for event in chunk_events)
+        assert not any(event.payload.is_resolved for event in chunk_events)
+        assert {"doubled": 42} in [event.get_payload()["output"] for event in completed_events]
+
+        captured.clear()
+        flow.settings.set("runtime.trigger_flow_observation_level", "lifecycle")
+        assert await flow.async_start(1) == {"doubled": 2}
+        assert captured
+        assert all(event.event_type.startswith("workflow.") for event in captured)
+
+        captured.clear()
+        flow.settings.set("runtime.trigger_flow_observation_level", "off")
+        assert await flow.async_start(2) == {"doubled": 4}
+        assert [event for event in captured if event.source == "TriggerFlowExecution"] == []
+    finally:
+        Agently.event_center.unregister_hook("test_trigger_flow_execution_state.observation")
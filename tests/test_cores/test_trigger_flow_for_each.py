@@ -0,0 +1,95 @@
+import asyncio
+import threading
+
+import pytest
+
+from agently import TriggerFlow, TriggerFlowRuntimeData
+
+
+@pytest.mark.asyncio
+async def test_trigger_flow_for_each_pulls_async_iterator_within_window():
+    flow = TriggerFlow()
+    stats = {"pulled": 0, "done": 0, "max_ahead": 0}
+
+    async def rows():
+        for index in range(10):
+            stats["pulled"] += 1
+            stats["max_ahead"] = max(stats["max_ahead"], stats["pulled"] - stats["done"])
+            yield index
+
+    async def square(data: TriggerFlowRuntimeData):
+        await asyncio.sleep(0.01 * (data.value % 3))
+        stats["done"] += 1
+        return data.value * data.value
+
+    flow.to(lambda _: rows()).for_each(concurrency=2).to(square).end_for_each().end()
+    execution = flow.create_execution()
+    result = await execution.async_start(None)
+
+    assert result == [index * index for index in range(10)]
+    assert stats["max_ahead"] <= 2
+    assert execution._system_runtime_data.get("for_each_states", {}, inherit=False) == {}
+
+
+@pytest.mark.asyncio
+async def test_trigger_flow_for_each_default_window_pulls_sync_iterator_off_loop(monkeypatch):
+    from agently.core.TriggerFlow.process import ForEachProcess
+
+    monkeypatch.setattr(ForEachProcess, "DEFAULT_FOR_EACH_WINDOW", 3)
+    flow = TriggerFlow()
+    loop_thread = threading.get_ident()
+    pull_threads: set[int] = set()
+    stats = {"running": 0, "max_running": 0}
+
+    def rows():
+        for index in range(20):
+            pull_threads.add(threading.get_ident())
+            yield index
+
+    async def track(data: TriggerFlowRuntimeData):
+        stats["running"] += 1
+        stats["max_running"] = max(stats["max_running"], stats["running"])
+        await asyncio.sleep(0.001)
+        stats["running"] -= 1
+        return data.value
+
+    flow.to(lambda _: rows()).for_each().to(track).end_for_each().end()
+
+    assert await flow.async_start(None) == list(range(20))
+    assert stats["max_running"] <= 3
+    assert pull_threads and loop_thread not in pull_threads
+
+
+@pytest.mark.asyncio
+async def test_trigger_flow_for_each_completion_order_over_sync_iterator():
+    flow = TriggerFlow()
+
+    async def delayed(data: TriggerFlowRuntimeData):
+        await asyncio.sleep(0.01 * (3 - data.value))
+        return data.value
+
+    flow.to(lambda _: iter(range(4))).for_each(order="completion").to(delayed).end_for_each().end()
+
+    assert await flow.async_start(None) == [3, 2, 1, 0]
+    with pytest.raises(ValueError):
+        flow.for_each(order="random")  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_trigger_flow_for_each_streams_results_in_input_order():
+    flow = TriggerFlow()
+
+    async def delayed(data: TriggerFlowRuntimeData):
+        await asyncio.sleep(0.01 * (4 - data.value))
+        return f"item-{ data.value }"
+
+    async def finish(data: TriggerFlowRuntimeData):
+        await data.async_stop_stream()
+        return data.value
+
+    flow.for_each(collect="stream").to(delayed).end_for_each().to(finish).end()
+    execution = flow.create_execution()
+    items = [item async for item in execution.get_async_runtime_stream([0, 1, 2, 3, 4], timeout=1)]
+
+    assert items == [f"item-{ index }" for index in range(5)]
+    assert await execution.async_get_result() == 5
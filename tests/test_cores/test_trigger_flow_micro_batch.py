@@ -0,0 +1,43 @@
+import pytest
+
+from agently import TriggerFlow, TriggerFlowRuntimeData
+
+
+@pytest.mark.asyncio
+async def test_trigger_flow_to_batch_groups_concurrent_branches():
+    flow = TriggerFlow()
+    batch_sizes = []
+
+    async def embed(items: list[TriggerFlowRuntimeData]):
+        batch_sizes.append(len(items))
+        return [item.value * 10 for item in items]
+
+    flow.for_each().to_batch(embed, max_size=4, max_wait_ms=20).to(lambda data: data.value + 1).end_for_each().end()
+
+    assert await flow.async_start(list(range(10))) == [index * 10 + 1 for index in range(10)]
+    assert batch_sizes == [4, 4, 2]
+
+
+@pytest.mark.asyncio
+async def test_trigger_flow_to_batch_round_trip_and_length_check():
+    flow = TriggerFlow(name="micro-batch-flow")
+
+    def classify(items: list[TriggerFlowRuntimeData]):
+        return ["even" if item.value % 2 == 0 else "odd" for item in items]
+
+    flow.for_each().to_batch(classify, max_size=8, max_wait_ms=5).end_for_each().end()
+    config = flow.get_flow_config()
+    assert "batch chunk" in flow.to_mermaid(mode="detailed")
+
+    restored = TriggerFlow()
+    restored.register_chunk_handler(classify)
+    restored.load_flow_config(config)
+    assert await restored.async_start([1, 2, 3]) == ["odd", "even", "odd"]
+
+    def broken(items: list[TriggerFlowRuntimeData]):
+        return []
+
+    broken_flow = TriggerFlow()
+    broken_flow.to_batch(broken).end()
+    with pytest.raises(ValueError):
+        await broken_flow.async_start(1)
@@ -110,6 +110,37 @@ async def test_trigger_flow_when_and_state_is_isolated_per_execution():
     }
 
 
+@pytest.mark.asyncio
+async def test_trigger_flow_when_and_wide_join_emits_once():
+    events = [f"Branch-{ index }" for index in range(60)]
+    joined: list[dict] = []
+
+    async def fan_out(data: TriggerFlowRuntimeData):
+        await data.async_emit(events[0], "first")
+        for event in events:
+            await data.async_emit(event, event.lower())
+
+    async def collect_join(data: TriggerFlowRuntimeData):
+        joined.append(data.value)
+        return data.value
+
+    flow = TriggerFlow()
+    flow.to(fan_out)
+    flow.when({"event": events}, mode="and").to(collect_join).end()
+
+    restored = TriggerFlow()
+    restored.register_chunk_handler(fan_out)
+    restored.register_chunk_handler(collect_join)
+    restored.load_flow_config(flow.get_flow_config())
+
+    expected = {"event": {event: event.lower() for event in events}}
+    for trigger_flow in (flow, restored):
+        joined.clear()
+        assert await trigger_flow.async_start(None) == expected
+        assert joined == [expected]
+        assert list(joined[0]["event"].keys()) == events
+
+
 @pytest.mark.asyncio
 async def test_trigger_flow_batch_state_is_isolated_per_execution():
     flow = TriggerFlow()
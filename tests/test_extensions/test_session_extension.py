@@ -57,6 +57,24 @@ def test_session_extension_activate_and_override_chat_history():
     assert len(prompt_chat_history) == 1
 
 
+def test_session_extension_follows_tokenizer_set_after_activation():
+    from agently.utils import TokenCounter
+
+    agent = Agently.create_agent()
+    agent.set_settings("session.max_length", 8)
+    agent.activate_session(session_id="session-extension-tokenizer-test")
+    assert agent.activated_session is not None
+    agent.set_settings("session.tokenizer", "bytes:1")
+
+    agent.add_chat_history({"role": "user", "content": "x" * 20})
+    assert agent.activated_session._length_handler is TokenCounter.from_name("bytes:1")
+    assert agent.activated_session.context_window[0].content == "x" * 4
+    assert agent.activated_session.get_context_window_length() == 8
+
+    agent.set_settings("session.tokenizer", None)
+    assert agent.activated_session.get_context_window_length() > 8
+
+
 def test_session_extension_clean_context_window():
     agent = Agently.create_agent()
     agent.activate_session(session_id="session-extension-test-clean")
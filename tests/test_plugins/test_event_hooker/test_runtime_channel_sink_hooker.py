@@ -0,0 +1,62 @@
+import pytest
+from pydantic import ValidationError
+
+from agently.core import EventCenter
+from agently.builtins.hookers.RuntimeChannelSinkHooker import RuntimeChannelSinkHooker
+
+
+@pytest.mark.asyncio
+async def test_channel_keeps_bounded_buffer_with_independent_readers():
+    ec = EventCenter()
+    ec.register_hooker_plugin(RuntimeChannelSinkHooker)
+    RuntimeChannelSinkHooker.configure(capacity=3)
+    try:
+        reader_a = RuntimeChannelSinkHooker.get_cursor()
+        for index in range(2):
+            await ec.async_emit({"event_type": "model.streaming", "level": "DEBUG", "message": str(index)})
+        events, reader_a = RuntimeChannelSinkHooker.read_since(reader_a)
+        assert [event.message for event in events] == ["0", "1"]
+
+        reader_b = RuntimeChannelSinkHooker.get_cursor()
+        for index in range(2, 5):
+            await ec.async_emit({"event_type": "runtime.info", "message": str(index)})
+
+        events_a, reader_a = RuntimeChannelSinkHooker.read_since(reader_a)
+        events_b, reader_b = RuntimeChannelSinkHooker.read_since(reader_b, limit=2)
+        assert [event.message for event in events_a] == ["2", "3", "4"]
+        assert [event.message for event in events_b] == ["2", "3"]
+        events_b, reader_b = RuntimeChannelSinkHooker.read_since(reader_b)
+        assert [event.message for event in events_b] == ["4"]
+        assert RuntimeChannelSinkHooker.read_since(reader_a) == ([], reader_a)
+
+        # Capacity is 3, so "0" and "1" have been overwritten.
+        events, _ = RuntimeChannelSinkHooker.read_since(0)
+        assert [event.message for event in events] == ["2", "3", "4"]
+        assert RuntimeChannelSinkHooker.get_stats()["dropped"] == 2
+
+        # Events are stored by reference and can not be changed by readers.
+        with pytest.raises(ValidationError):
+            events[0].message = "changed"
+    finally:
+        ec.unregister_hooker_plugin(RuntimeChannelSinkHooker)
+        RuntimeChannelSinkHooker.configure(capacity=1000)
+
+
+@pytest.mark.asyncio
+async def test_channel_event_type_filters():
+    ec = EventCenter()
+    ec.register_hooker_plugin(RuntimeChannelSinkHooker)
+    RuntimeChannelSinkHooker.configure(event_types=["model.*", "runtime.error"])
+    try:
+        assert not ec.is_observed("trigger_flow.signal", "DEBUG")
+        cursor = RuntimeChannelSinkHooker.get_cursor()
+        for event_type in ("model.requesting", "trigger_flow.signal", "runtime.error", "model.completed"):
+            await ec.async_emit({"event_type": event_type, "message": event_type})
+
+        events, _ = RuntimeChannelSinkHooker.read_since(cursor)
+        assert [event.event_type for event in events] == ["model.requesting", "runtime.error", "model.completed"]
+        events, _ = RuntimeChannelSinkHooker.read_since(cursor, event_types="model.completed")
+        assert [event.event_type for event in events] == ["model.completed"]
+    finally:
+        ec.unregister_hooker_plugin(RuntimeChannelSinkHooker)
+        RuntimeChannelSinkHooker.configure()
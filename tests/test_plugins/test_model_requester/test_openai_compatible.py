@@ -158,3 +158,201 @@ async def test_auth_headers_are_kept_when_api_key_sets_authorization(monkeypatch
 
     assert captured["headers"]["Authorization"] == "Bearer KEY2"
     assert captured["headers"]["X-Test"] == "1"
+
+
+@pytest.mark.asyncio
+async def test_requests_share_pooled_client(monkeypatch: pytest.MonkeyPatch):
+    created: list = []
+
+    class FakeResponse:
+        status_code = 200
+        content = b'{"ok": true}'
+        text = content.decode()
+        headers = {"Content-Type": "application/json"}
+
+    class FakeAsyncClient:
+        def __init__(self, **kwargs):
+            self.headers = {}
+            self.kwargs = kwargs
+            self.posted_headers: list[dict] = []
+            created.append(self)
+
+        async def post(self, url, json=None, headers=None):
+            self.posted_headers.append(dict(headers or {}))
+            return FakeResponse()
+
+        async def aclose(self):
+            return None
+
+    monkeypatch.setattr(openai_module, "AsyncClient", FakeAsyncClient)
+    for api_key in ("KEY1", "KEY2"):
+        plugin = build_plugin(
+            {"base_url": "https://api.example.com/v1", "model": "m1", "stream": False, "api_key": api_key},
+            {"input": "hello"},
+        )
+        async for _event, _payload in plugin.request_model(plugin.generate_request_data()):
+            pass
+
+    assert len(created) == 1
+    assert "limits" in created[0].kwargs
+    assert [headers["Authorization"] for headers in created[0].posted_headers] == ["Bearer KEY1", "Bearer KEY2"]
+    assert created[0].posted_headers[0]["Connection"] == "keep-alive"
+
+
+@pytest.mark.asyncio
+async def test_client_pool_can_be_disabled(monkeypatch: pytest.MonkeyPatch):
+    captured = await capture_request_headers(
+        monkeypatch,
+        {
+            "base_url": "https://api.example.com/v1",
+            "model": "m1",
+            "stream": False,
+            "client_pool": {"enabled": False},
+        },
+        {"input": "hello"},
+    )
+
+    assert "limits" not in captured["client_kwargs"]
+    assert captured["headers"]["Connection"] == "close"
+
+
+async def collect_broadcast(config: dict, messages: list[str]):
+    plugin = build_plugin(config)
+
+    async def response_generator():
+        for message in messages:
+            yield "message", message
+
+    return [item async for item in plugin.broadcast_response(response_generator())]
+
+
+@pytest.mark.asyncio
+async def test_broadcast_response_reads_standard_and_custom_mappings():
+    chunks = [
+        '{"id": "c1", "choices": [{"delta": {"role": "assistant", "reasoning_content": "think"}}]}',
+        '{"id": "c1", "choices": [{"delta": {"content": "Hel"}}]}',
+        '{"id": "c1", "choices": [{"delta": {"content": "lo"}, "finish_reason": "stop"}], "usage": {"total_tokens": 3}}',
+        "[DONE]",
+    ]
+    events = await collect_broadcast({"model": "m1"}, chunks)
+    assert [message for event, message in events if event == "delta"] == ["Hel", "lo"]
+    assert ("reasoning_delta", "think") in events
+    assert ("done", "Hello") in events
+    meta = dict(events)["meta"]
+    assert meta == {"id": "c1", "role": "assistant", "finish_reason": "stop", "usage": {"total_tokens": 3}}
+
+    custom_chunks = [
+        '{"output": {"text": "Hi", "extra": {"mood": "happy"}}}',
+        '{"output": {"text": "!"}, "stats": {"tokens": 2}}',
+        "[DONE]",
+    ]
+    events = await collect_broadcast(
+        {
+            "model": "m1",
+            "content_mapping_style": "slash",
+            "content_mapping": {
+                "role": None,
+                "reasoning": None,
+                "delta": "/output/text",
+                "tool_calls": None,
+                "usage": "/stats",
+                "finish_reason": None,
+                "extra_delta": {"mood": "/output/extra/mood"},
+            },
+        },
+        custom_chunks,
+    )
+    assert [message for event, message in events if event == "delta"] == ["Hi", "!"]
+    assert ("mood", "happy") in events
+    assert dict(events)["meta"]["usage"] == {"tokens": 2}
+
+
+def use_mock_transport(monkeypatch: pytest.MonkeyPatch, handler):
+    import httpx
+
+    def client_factory(**kwargs):
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler), **kwargs)
+
+    monkeypatch.setattr(openai_module, "AsyncClient", client_factory)
+
+
+def capture_retrying_events(monkeypatch: pytest.MonkeyPatch, plugin: OpenAICompatible):
+    retrying: list[dict] = []
+    original_warning = plugin._emitter.async_warning
+
+    async def async_warning(message, **kwargs):
+        if kwargs.get("event_type") == "model.retrying":
+            retrying.append(kwargs["payload"])
+        return await original_warning(message, **kwargs)
+
+    monkeypatch.setattr(plugin._emitter, "async_warning", async_warning)
+    return retrying
+
+
+RETRY_CONFIG = {
+    "base_url": "https://retry.example.com/v1",
+    "model": "m1",
+    "retry": {"initial_delay": 0.01, "jitter": 0.0, "budget": {"max_retries": None}},
+}
+
+
+@pytest.mark.asyncio
+async def test_stream_retries_rate_limit_and_resumes_from_last_event_id(monkeypatch: pytest.MonkeyPatch):
+    import httpx
+
+    seen_last_event_ids: list = []
+
+    async def broken_stream():
+        yield b'id: 1\ndata: {"choices": [{"delta": {"content": "Hel"}}]}\n\n'
+        raise httpx.ReadError("connection reset")
+
+    def handler(request: httpx.Request):
+        seen_last_event_ids.append(request.headers.get("Last-Event-ID"))
+        if len(seen_last_event_ids) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"}, json={"error": {"message": "slow down"}})
+        if len(seen_last_event_ids) == 2:
+            return httpx.Response(200, headers={"Content-Type": "text/event-stream"}, content=broken_stream())
+        return httpx.Response(
+            200,
+            headers={"Content-Type": "text/event-stream"},
+            content=b'id: 2\ndata: {"choices": [{"delta": {"content": "lo"}}]}\n\ndata: [DONE]\n\n',
+        )
+
+    use_mock_transport(monkeypatch, handler)
+    plugin = build_plugin(RETRY_CONFIG, {"input": "hello"})
+    retrying = capture_retrying_events(monkeypatch, plugin)
+
+    events = [item async for item in plugin.request_model(plugin.generate_request_data())]
+
+    assert seen_last_event_ids == [None, None, "1"]
+    assert [data for _event, data in events if data != "[DONE]"] == [
+        '{"choices": [{"delta": {"content": "Hel"}}]}',
+        '{"choices": [{"delta": {"content": "lo"}}]}',
+    ]
+    assert [(payload["reason"], payload["status_code"]) for payload in retrying] == [
+        ("rate_limited", 429),
+        ("connection", None),
+    ]
+    assert retrying[1]["last_event_id"] == "1"
+
+
+@pytest.mark.asyncio
+async def test_request_gives_up_after_max_attempts(monkeypatch: pytest.MonkeyPatch):
+    import httpx
+
+    attempts: list = []
+
+    def handler(request: httpx.Request):
+        attempts.append(request)
+        return httpx.Response(503, json={"error": {"message": "unavailable"}})
+
+    use_mock_transport(monkeypatch, handler)
+    plugin = build_plugin({**RETRY_CONFIG, "stream": False}, {"input": "hello"})
+    retrying = capture_retrying_events(monkeypatch, plugin)
+
+    with pytest.raises(Exception, match="503"):
+        async for _event, _data in plugin.request_model(plugin.generate_request_data()):
+            pass
+
+    assert len(attempts) == 3
+    assert [payload["retry_count"] for payload in retrying] == [1, 2]
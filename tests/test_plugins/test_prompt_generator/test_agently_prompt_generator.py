@@ -417,3 +417,38 @@ def test_strict_role_orders():
         {'role': 'assistant', 'content': '[User continue input]'},
         {'role': 'user', 'content': 'hi'},
     ]
+
+
+def test_rendering_is_memoized_per_prompt_version():
+    prompt = Prompt(Agently.plugin_manager, Agently.settings)
+    prompt.set("chat_history", [{"role": "user", "content": "hi"}, {"role": "assistant", "content": "hello"}])
+    prompt.set("input", "How are you?")
+    generator = prompt.prompt_generator
+    calls = {"text": 0, "messages": 0}
+    render_text, render_messages = generator._render_text, generator._render_messages
+
+    def counting_render_text(**kwargs):
+        calls["text"] += 1
+        return render_text(**kwargs)
+
+    def counting_render_messages(**kwargs):
+        calls["messages"] += 1
+        return render_messages(**kwargs)
+
+    generator._render_text = counting_render_text  # type: ignore
+    generator._render_messages = counting_render_messages  # type: ignore
+
+    text = prompt.to_text()
+    assert prompt.to_text() == text
+    messages = prompt.to_messages()
+    messages[0]["content"] = "edited by caller"
+    assert prompt.to_messages()[0]["content"] == "hi"
+    assert calls == {"text": 1, "messages": 1}
+
+    # Any change of the prompt or its settings renders again
+    prompt.set("input", "Still there?")
+    assert "Still there?" in prompt.to_text()
+    prompt.settings.set("prompt.prompt_title_mapping", {"input": "QUESTION"})
+    assert "QUESTION" in prompt.to_text()
+    prompt.to_messages()
+    assert calls == {"text": 3, "messages": 2}
@@ -0,0 +1,41 @@
+import pytest
+
+from agently import Agently
+from agently.builtins.plugins.ResponseParser.AgentlyResponseParser import AgentlyResponseParser
+from agently.core import Prompt
+from agently.utils import Settings
+
+
+def create_parser(replay_policy):
+    settings = Settings(name="ReplayPolicyTestSettings", parent=Agently.settings)
+    settings.set("response.replay_policy", replay_policy)
+    prompt = Prompt(Agently.plugin_manager, settings)
+    prompt.set("input", "hello")
+
+    async def response_generator():
+        for index in range(5):
+            yield "original_delta", {"choices": [{"delta": {"content": f"chunk-{ index } "}}]}
+            yield "delta", f"chunk-{ index } "
+        yield "done", "chunk-0 chunk-1 chunk-2 chunk-3 chunk-4 "
+
+    return AgentlyResponseParser("replay-agent", "replay-response", prompt, response_generator(), settings)
+
+
+@pytest.mark.asyncio
+async def test_lean_replay_policy_keeps_raw_chunks_only_in_result_data():
+    parser = create_parser("lean")
+    assert await parser.async_get_text() == "chunk-0 chunk-1 chunk-2 chunk-3 chunk-4 "
+
+    assert len(parser.full_result_data["original_delta"]) == 5
+    replayed = [event async for event, _ in parser.get_async_generator(type="all")]
+    assert "original_delta" not in replayed
+    assert replayed.count("delta") == 5
+    usage = parser._response_consumer.get_memory_usage()  # type: ignore
+    assert usage["history_messages"] == 6
+
+
+@pytest.mark.asyncio
+async def test_none_replay_policy_keeps_results():
+    parser = create_parser("none")
+    assert await parser.async_get_text() == "chunk-0 chunk-1 chunk-2 chunk-3 chunk-4 "
+    assert [item async for item in parser.get_async_generator(type="delta")] == []
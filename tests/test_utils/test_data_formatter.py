@@ -122,3 +122,11 @@ def test_from_schema_to_kwargs_format_additional_properties_schema():
         "additionalProperties": {"type": "number", "title": "X", "description": "x"},
     }
     assert DataFormatter.from_schema_to_kwargs_format(schema) == {"<*>": ("number", "description: x")}
+
+
+def test_to_hashable_is_stable_for_nested_options():
+    first = DataFormatter.to_hashable({"headers": {"b": "2", "a": "1"}, "args": ["x", {"y"}], "env": None})
+    second = DataFormatter.to_hashable({"env": None, "args": ["x", {"y"}], "headers": {"a": "1", "b": "2"}})
+    assert first == second
+    assert hash(first) == hash(second)
+    assert DataFormatter.to_hashable({"a": 1}) != DataFormatter.to_hashable({"a": 2})
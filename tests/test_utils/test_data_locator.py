@@ -57,3 +57,23 @@ def test_root_list_dot_path_locate():
 def test_root_list_slash_path_locate():
     assert DataLocator.locate_path_in_dict(sample_root_list, "/0/id", style="slash") == "news-1"
     assert DataLocator.locate_path_in_dict(sample_root_list, "/[*]/id", style="slash") == ["news-1", "news-2"]
+
+
+@pytest.mark.parametrize(
+    "path,style,default",
+    [
+        ("a.b.c[2].d", "dot", None),
+        ("a.b.list[-1]", "dot", None),
+        ("x[*].y", "dot", None),
+        ("x[0].missing", "dot", "fallback"),
+        ("a.b.c[9]", "dot", "fallback"),
+        ("a.b.c[x]", "dot", None),
+        ("/a/b/c/2/d", "slash", None),
+        ("/x/[*]/y", "slash", None),
+        ("/a/missing/c", "slash", "fallback"),
+    ],
+)
+def test_compiled_path_matches_locate(path, style, default):
+    locate = DataLocator.compile_path(path, style=style, default=default)
+    for data in (sample_data, sample_root_list, None, "text"):
+        assert locate(data) == DataLocator.locate_path_in_dict(data, path, style=style, default=default)
@@ -1,4 +1,5 @@
 import asyncio
+import sqlite3
 import threading
 
 import pytest
@@ -67,3 +68,90 @@ async def test_asyncify_sync_generator_closes_on_break():
         break
 
     assert await asyncio.to_thread(closed.wait, 1.0)
+
+
+@pytest.mark.asyncio
+async def test_asyncify_sync_generator_stays_on_one_thread():
+    def rows():
+        # sqlite3 objects can only be used in the thread that created them
+        connection = sqlite3.connect(":memory:")
+        try:
+            connection.execute("CREATE TABLE items (id INTEGER)")
+            connection.executemany("INSERT INTO items VALUES (?)", [(index,) for index in range(50)])
+            for (item_id,) in connection.execute("SELECT id FROM items ORDER BY id"):
+                yield item_id, threading.get_ident()
+        finally:
+            connection.close()
+
+    async def consume():
+        items = []
+        async for item in FunctionShifter.asyncify_sync_generator(rows()):
+            items.append(item)
+            await asyncio.sleep(0)
+        return items
+
+    # Concurrent generators and to_thread work compete for the default executor's threads
+    results = await asyncio.gather(consume(), consume(), asyncio.to_thread(lambda: None))
+    for items in results[:2]:
+        assert [item_id for item_id, _ in items] == list(range(50))
+        assert len({thread_id for _, thread_id in items}) == 1
+    assert results[0][0][1] != results[1][0][1]
+
+
+def test_syncify_reuses_background_loop():
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    sync_current_loop = FunctionShifter.syncify(current_loop)
+    first_loop = sync_current_loop()
+    assert sync_current_loop() is first_loop
+    assert first_loop.is_running()
+
+    async def inside_running_loop():
+        return sync_current_loop()
+
+    assert asyncio.run(inside_running_loop()) is first_loop
+
+
+def test_syncify_is_reentrant_on_runner_loop():
+    async def add(a: int, b: int):
+        await asyncio.sleep(0)
+        return a + b
+
+    sync_add = FunctionShifter.syncify(add)
+
+    async def nested():
+        assert FunctionShifter.loop_runner.is_runner_thread()
+        return sync_add(1, 2)
+
+    assert FunctionShifter.syncify(nested)() == 3
+
+    async def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        FunctionShifter.syncify(fail)()
+
+
+def test_event_loop_runner_shutdown_finishes_pending_tasks():
+    from agently.utils import EventLoopRunner
+
+    runner = EventLoopRunner(size=2, shutdown_timeout=1.0)
+    finished = threading.Event()
+
+    async def background():
+        await asyncio.sleep(0.05)
+        finished.set()
+
+    async def start_background():
+        asyncio.get_running_loop().create_task(background())
+        return asyncio.get_running_loop()
+
+    loop = runner.run(start_background())
+    runner.shutdown()
+
+    assert finished.is_set()
+    assert loop.is_closed()
+    assert runner.get_stats()["live"] == 0
+    assert runner.run(asyncio.sleep(0, result="restarted")) == "restarted"
+    runner.shutdown()
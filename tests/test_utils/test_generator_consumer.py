@@ -1,6 +1,8 @@
 import pytest
 
+import time
 import asyncio
+import threading
 from agently.utils import GeneratorConsumer
 
 
@@ -146,3 +148,99 @@ async def test_generator_consumer_reuse_after_done():
 
     assert collected == [("x", 1), ("x", 2)]
     assert replayed == collected
+
+
+def test_sync_subscribers_share_one_loop_without_threads():
+    async def original_gen():
+        for i in range(20):
+            await asyncio.sleep(0.001)
+            yield i
+
+    consumer = GeneratorConsumer(original_gen())
+    threads_before = threading.active_count()
+    generators = [consumer.get_generator() for _ in range(10)]
+    assert threading.active_count() <= threads_before + 1
+
+    for generator in generators:
+        assert list(generator) == list(range(20))
+
+
+@pytest.mark.asyncio
+async def test_bounded_buffer_waits_for_slow_subscriber_and_history_is_optional():
+    produced = []
+
+    async def original_gen():
+        for i in range(10):
+            produced.append(i)
+            yield i
+
+    consumer = GeneratorConsumer(original_gen(), history=False, buffer_size=2)
+    subscriber = consumer.get_async_generator()
+
+    assert await subscriber.__anext__() == 0
+    await asyncio.sleep(0.01)
+    assert len(produced) <= 4
+
+    assert [item async for item in subscriber] == list(range(1, 10))
+    assert await consumer.get_result() == []
+    assert [item async for item in consumer.get_async_generator()] == []
+
+
+def test_syncify_async_generator_stops_source_on_early_exit():
+    from agently.utils import FunctionShifter
+
+    closed = []
+
+    async def original_gen():
+        try:
+            for i in range(1000):
+                await asyncio.sleep(0.001)
+                yield i
+        finally:
+            closed.append(True)
+
+    for item in FunctionShifter.syncify_async_generator(original_gen()):
+        if item == 2:
+            break
+
+    for _ in range(100):
+        if closed:
+            break
+        time.sleep(0.01)
+    assert closed == [True]
+
+
+@pytest.mark.asyncio
+async def test_replay_policies_and_memory_usage():
+    async def original_gen():
+        for i in range(10):
+            yield ("raw" if i % 2 else "delta"), "x" * 100
+
+    last_n = GeneratorConsumer(original_gen(), history=3)
+    assert len(await last_n.get_result()) == 3
+    assert len([item async for item in last_n.get_async_generator()]) == 3
+    usage = last_n.get_memory_usage()
+    assert usage["history_limit"] == 3
+    assert usage["history_messages"] == 3
+    assert usage["history_bytes"] > 300
+
+    filtered = GeneratorConsumer(original_gen(), history_filter=lambda item: item[0] != "raw")
+    live = [item async for item in filtered.get_async_generator()]
+    assert len(live) == 10
+    assert [event for event, _ in await filtered.get_result()] == ["delta"] * 5
+
+
+@pytest.mark.asyncio
+async def test_drop_overflow_keeps_producer_running():
+    async def original_gen():
+        for i in range(10):
+            yield i
+
+    consumer = GeneratorConsumer(original_gen(), buffer_size=3, overflow="drop")
+    subscriber = consumer.get_generator()
+
+    await consumer.get_result()
+    usage = consumer.get_memory_usage()
+    assert usage["buffered_messages"] == 4
+    assert usage["dropped_messages"] == 7
+    assert list(subscriber) == [7, 8, 9]
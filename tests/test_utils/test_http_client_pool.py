@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+
+from agently.utils import HTTPClientPool
+
+
+class FakeClient:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.is_closed = False
+
+    async def aclose(self):
+        self.is_closed = True
+
+
+@pytest.mark.asyncio
+async def test_client_is_reused_by_options_and_origin():
+    pool = HTTPClientPool(max_connections=10)
+    client_1 = pool.get_client({"proxy": None}, url="https://a.example.com/v1/chat", client_factory=FakeClient)
+    client_2 = pool.get_client({"proxy": None}, url="https://a.example.com/v1/embeddings", client_factory=FakeClient)
+    client_3 = pool.get_client({"proxy": None}, url="https://b.example.com/v1/chat", client_factory=FakeClient)
+    client_4 = pool.get_client({"http2": True}, url="https://a.example.com/v1/chat", client_factory=FakeClient)
+
+    assert client_1 is client_2
+    assert client_1 is not client_3
+    assert client_1 is not client_4
+    assert client_1.kwargs["limits"].max_connections == 10
+
+    stats = pool.get_stats()
+    assert stats["live"] == 3
+    assert stats["created"] == 3
+    assert stats["reused"] == 1
+
+    await pool.async_close()
+    assert client_1.is_closed and client_3.is_closed and client_4.is_closed
+    assert pool.get_stats()["live"] == 0
+
+
+def test_clients_are_bound_to_event_loop():
+    pool = HTTPClientPool()
+
+    async def get_client():
+        return pool.get_client({}, url="https://a.example.com", client_factory=FakeClient)
+
+    client_1 = asyncio.run(get_client())
+    client_2 = asyncio.run(get_client())
+
+    assert client_1 is not client_2
+    stats = pool.get_stats()
+    assert stats["live"] == 0
+    assert stats["created"] == 2
+    assert stats["reused"] == 0
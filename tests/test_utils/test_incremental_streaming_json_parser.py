@@ -0,0 +1,140 @@
+import json5
+import pytest
+
+from agently.utils import IncrementalStreamingJSONParser, StreamingJSONParser
+
+
+async def collect_events(parser, chunks):
+    events = []
+    for chunk in chunks:
+        async for item in parser.parse_chunk(chunk):
+            events.append(item)
+    async for item in parser.finalize():
+        events.append(item)
+    return events
+
+
+def split_by(text: str, size: int):
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+@pytest.mark.asyncio
+async def test_incremental_parser_matches_legacy_final_values():
+    schema = {
+        "profile": {
+            "username": (str,),
+            "age": (int,),
+            "emails": [(str,)],
+            "preferences": {"notifications": (bool,), "languages": [(str,)]},
+        }
+    }
+    chunks = [
+        '{"profile": {"username": "A',
+        'l',
+        'ice", "age": 30, "emails": ["alice@example.com"',
+        ', "alice.work@example.com"], "preferences": {"notifications": true, "languages": ["English"',
+        ', "Spanish"]}}}',
+    ]
+
+    incremental_events = await collect_events(IncrementalStreamingJSONParser(schema), chunks)
+    legacy_events = await collect_events(StreamingJSONParser(schema), chunks)
+
+    def done_values(events):
+        return {e.path: e.value for e in events if e.event_type == "done"}
+
+    assert done_values(incremental_events) == done_values(legacy_events)
+    username_deltas = [e.delta for e in incremental_events if e.event_type == "delta" and e.path == "profile.username"]
+    assert username_deltas == ["A", "l", "ice"]
+    # fields complete as soon as their token closes, before later fields arrive
+    username_done_index = next(
+        i for i, e in enumerate(incremental_events) if e.event_type == "done" and e.path == "profile.username"
+    )
+    age_delta_index = next(i for i, e in enumerate(incremental_events) if e.path == "profile.age")
+    assert username_done_index < age_delta_index
+
+
+@pytest.mark.asyncio
+async def test_incremental_parser_matches_legacy_events_on_mixed_types():
+    schema = {
+        "n": (int,),
+        "s": (str,),
+        "b": (bool,),
+        "f": (float,),
+        "tags": [(str,)],
+        "items": [{"id": (int,), "ok": (bool,), "name": (str,)}],
+    }
+    chunks = [
+        '{"n": 42, ',
+        '"s": "hello", ',
+        '"b": true, "f": 1.5, ',
+        '"tags": ["x", ',
+        '"y"], ',
+        '"items": [{"id": 1, ',
+        '"ok": false, ',
+        '"name": "ab"}]}',
+    ]
+
+    def sequence(events):
+        return [(e.event_type, e.path, e.delta, e.value) for e in events]
+
+    incremental_events = await collect_events(IncrementalStreamingJSONParser(schema), chunks)
+    legacy_events = await collect_events(StreamingJSONParser(schema), chunks)
+    assert sequence(incremental_events) == sequence(legacy_events)
+
+    # numbers, booleans and null only emit "done", whatever the chunking
+    events = await collect_events(IncrementalStreamingJSONParser(schema), split_by("".join(chunks), 1))
+    scalar_paths = {"n", "b", "f", "items[0].id", "items[0].ok"}
+    assert [e.event_type for e in events if e.path in scalar_paths] == ["done"] * len(scalar_paths)
+
+
+@pytest.mark.asyncio
+async def test_incremental_parser_is_chunk_boundary_independent():
+    schema = {"a": (str,), "b": [(int,)], "c": (str,), "d": (str,), "e": {}, "f": []}
+    text = (
+        "Sure, here is the result:\n```json\n"
+        "{ // comment\n"
+        " a: 'x\\'y', \"b\": [1, 2.5e3, -3, null, ], \"c\": \"line\\nnext \\u4f60\\ud83d\\ude00\",\n"
+        " /* block */ \"d\": \"\"\"tri\"ple\"\"\", \"e\": {}, \"f\": [],\n"
+        "}\n```\nAnything after the JSON block is ignored {\"a\": 1}"
+    )
+    expected = {"a": "x'y", "b": [1, 2500.0, -3, None], "c": "line\nnext 你😀", "d": 'tri"ple', "e": {}, "f": []}
+
+    for size in (1, 2, 3, 5, 8, 13, len(text)):
+        parser = IncrementalStreamingJSONParser(schema)
+        events = await collect_events(parser, split_by(text, size))
+        assert parser.current_data == expected
+        for path in ("a", "c", "d"):
+            deltas = "".join(e.delta for e in events if e.event_type == "delta" and e.path == path)
+            assert deltas == expected[path]
+        assert [e.path for e in events if e.event_type == "done"][-1] == "f"
+
+
+@pytest.mark.asyncio
+async def test_incremental_parser_finalizes_unclosed_output():
+    schema = [{"title": (str,), "tags": [(str,)]}]
+    parser = IncrementalStreamingJSONParser(schema)
+    events = await collect_events(parser, ['[{"title": "Breaking', ' News", "tags": ["world", "to'])
+
+    done_events = {e.path: e.value for e in events if e.event_type == "done"}
+    assert done_events["[0].title"] == "Breaking News"
+    assert done_events["[0].tags[1]"] == "to"
+    assert done_events["[0].tags"] == ["world", "to"]
+    assert done_events["[0]"] == {"title": "Breaking News", "tags": ["world", "to"]}
+    assert parser.is_finished
+
+
+def test_incremental_parser_sync_feed():
+    parser = IncrementalStreamingJSONParser({"answer": (str,), "score": (float,)})
+    events = parser.feed('{"answer": "ye')
+    events += parser.feed('s", "score": 0.')
+    events += parser.feed('9}')
+    events += parser.end()
+
+    assert [(e.event_type, e.path, e.delta) for e in events] == [
+        ("delta", "answer", "ye"),
+        ("delta", "answer", "s"),
+        ("done", "answer", None),
+        ("done", "score", None),
+    ]
+    assert events[-1].value == 0.9
+    assert json5.loads('{"answer": "yes", "score": 0.9}') == parser.current_data
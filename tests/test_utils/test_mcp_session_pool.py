@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+
+from agently.utils import MCPSessionPool
+
+
+class FakeClient:
+    instances: list["FakeClient"] = []
+
+    def __init__(self, transport):
+        self.transport = transport
+        self.connected = False
+        self.ping_ok = True
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self.fail_next_call = False
+        FakeClient.instances.append(self)
+
+    async def __aenter__(self):
+        self.connected = True
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.connected = False
+
+    def is_connected(self):
+        return self.connected
+
+    async def ping(self):
+        if not self.ping_ok:
+            raise ConnectionError("ping failed")
+        return True
+
+    async def call_tool(self, *, name, arguments, **kwargs):
+        if self.fail_next_call:
+            self.fail_next_call = False
+            self.connected = False
+            raise ConnectionError("connection lost")
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return {"name": name, "arguments": arguments}
+
+
+@pytest.fixture(autouse=True)
+def reset_fake_clients():
+    FakeClient.instances.clear()
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_reused_per_transport_with_concurrency_limit():
+    pool = MCPSessionPool(max_concurrency=2, client_factory=FakeClient)
+    transport = {"mcpServers": {"calc": {"command": "python", "args": ["server.py"]}}}
+
+    results = await asyncio.gather(*[pool.call_tool(transport, "add", {"a": index}) for index in range(6)])
+    await pool.call_tool("http://other.example.com/mcp", "add", {})
+
+    assert [result["arguments"]["a"] for result in results] == list(range(6))
+    assert len(FakeClient.instances) == 2
+    assert FakeClient.instances[0].calls == 6
+    assert FakeClient.instances[0].max_active == 2
+    stats = pool.get_stats()
+    assert stats["live"] == 2
+    assert stats["connects"] == 2
+
+    await pool.async_close()
+    assert not any(client.connected for client in FakeClient.instances)
+    assert pool.get_stats()["live"] == 0
+
+
+@pytest.mark.asyncio
+async def test_broken_sessions_are_reconnected():
+    pool = MCPSessionPool(health_check_interval=0, client_factory=FakeClient)
+
+    await pool.call_tool("server.py", "add", {})
+    FakeClient.instances[0].fail_next_call = True
+    assert await pool.call_tool("server.py", "add", {"retry": True}) == {"name": "add", "arguments": {"retry": True}}
+    assert len(FakeClient.instances) == 2
+
+    FakeClient.instances[1].ping_ok = False
+    await pool.call_tool("server.py", "add", {})
+    assert len(FakeClient.instances) == 3
+    stats = pool.get_stats()
+    assert stats["reconnects"] == 2
+    assert stats["sessions"][0]["failed_health_checks"] == 1
+    await pool.async_close()
+
+
+@pytest.mark.asyncio
+async def test_idle_sessions_are_closed():
+    pool = MCPSessionPool(idle_timeout=0.02, client_factory=FakeClient)
+
+    await pool.call_tool("server.py", "add", {})
+    assert pool.get_stats()["live"] == 1
+    await asyncio.sleep(0.05)
+
+    assert pool.get_stats()["live"] == 0
+    assert not FakeClient.instances[0].connected
+    await pool.call_tool("server.py", "add", {})
+    assert len(FakeClient.instances) == 2
+    await pool.async_close()
+
+
+def test_sessions_are_bound_to_event_loop():
+    pool = MCPSessionPool(client_factory=FakeClient)
+
+    asyncio.run(pool.call_tool("server.py", "add", {}))
+    asyncio.run(pool.call_tool("server.py", "add", {}))
+
+    assert len(FakeClient.instances) == 2
+    assert pool.get_stats()["live"] == 0
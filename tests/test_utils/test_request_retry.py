@@ -0,0 +1,43 @@
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import httpx
+
+from agently.utils import RequestRetryPolicy, RetryBudget
+
+
+def test_retry_classification_and_retry_after():
+    policy = RequestRetryPolicy()
+    assert policy.classify_status(429) == "rate_limited"
+    assert policy.classify_status(503) == "server_error"
+    assert policy.classify_status(400) is None
+    assert policy.classify_error(httpx.ConnectError("refused")) == "connection"
+    assert policy.classify_error(ValueError("bad")) is None
+
+    assert policy.parse_retry_after("2") == 2.0
+    assert policy.parse_retry_after("soon") is None
+    retry_at = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 25 < policy.parse_retry_after(retry_at) <= 30  # type: ignore
+
+
+def test_retry_delays_and_budget():
+    budget = RetryBudget()
+    policy = RequestRetryPolicy(
+        max_attempts=5,
+        initial_delay=1.0,
+        max_delay=5.0,
+        jitter=0.0,
+        budget_max_retries=2,
+        budget_window=60.0,
+        budget=budget,
+    )
+    assert [policy.get_delay(retry_count) for retry_count in (1, 2, 3, 4)] == [1.0, 2.0, 4.0, 5.0]
+    assert policy.get_delay(1, retry_after=3.0) == 3.0
+    assert policy.get_delay(1, retry_after=60.0) is None
+
+    assert policy.allow_retry(1, "https://a.example.com/v1/chat/completions")
+    assert policy.allow_retry(2, "https://a.example.com/v1/chat/completions")
+    assert not policy.allow_retry(3, "https://a.example.com/v1/chat/completions")
+    assert policy.allow_retry(1, "https://b.example.com/v1/chat/completions")
+    assert not policy.allow_retry(5, "https://b.example.com/v1/chat/completions")
+    assert budget.get_stats()["https://a.example.com/v1/chat/completions"] == {"recent_retries": 2, "rejected": 1}
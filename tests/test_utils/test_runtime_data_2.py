@@ -302,6 +302,82 @@ class TestRuntimeDataInheritance:
         inherited = child.get()
         assert inherited == {'a': 1, 'b': 2, 'c': 3}
 
+    def test_inherited_view_cache_invalidation(self):
+        grandparent = StateData({'a': {'x': 1}, 'tags': ['gp']})
+        parent = StateData({'b': 2}, parent=grandparent)
+        child = StateData({'c': 3, 'tags': ['c']}, parent=parent)
+
+        assert child.get('a.x') == 1
+        view = child._get_resolved_view()
+        assert child._get_resolved_view() is view
+
+        # Any change on an ancestor invalidates the child view
+        grandparent.set('a.x', 10)
+        assert child.get('a.x') == 10
+        parent.delete('b')
+        assert 'b' not in child
+        grandparent.append('tags', 'gp2')
+        assert child.get('tags') == ['c', 'gp', 'gp2']
+        parent.namespace('ns').set('key', 'value')
+        assert child.get('ns.key') == 'value'
+
+        # Re-parenting is a change too
+        child.parent = StateData({'a': {'x': 100}})
+        assert child.get('a.x') == 100
+        assert child.get('b') is None
+
+        # Returned values are copies, mutating them never leaks into the cache
+        nested = child.get('a')
+        nested['x'] = -1
+        child.get('tags').append('leak')
+        assert child.get('a.x') == 100
+        assert child.get('tags') == ['c']
+
+    def test_local_references_invalidate_inherited_view(self):
+        parent = StateData({'cfg': {'x': 1}})
+        child = StateData(parent=parent)
+        assert child.get('cfg') == {'x': 1}
+        assert parent.get('cfg') == {'x': 1}
+
+        # Edits through a local reference are visible on the node and its children
+        parent.get('cfg', inherit=False)['x'] = 2
+        assert parent.get('cfg') == {'x': 2}
+        assert child.get('cfg') == {'x': 2}
+        parent[None]['z'] = 1
+        assert parent.get('z') == 1
+        assert child.get('z') == 1
+
+        # Scalars can not be edited in place and keep the cache
+        view = child._get_resolved_view()
+        parent.get('z', inherit=False)
+        assert child._get_resolved_view() is view
+
+    def test_fork_from_is_copy_on_write(self):
+        parent = StateData({'history': [1, 2], 'info': {'a': 1}, 'big': {'blob': 'x' * 100}})
+        source = StateData({'input': 'hi'}, parent=parent)
+        fork = StateData().fork_from(source)
+
+        # Untouched values are shared with the source view instead of copied
+        assert fork._get_resolved_view()['big'] is source._get_resolved_view()['big']
+        assert fork.get() == source.get()
+
+        fork.append('history', 3)
+        fork.set('info.b', 2)
+        fork.set('input', 'changed')
+        assert fork.get('history') == [1, 2, 3]
+        assert fork.get('info') == {'a': 1, 'b': 2}
+        assert source.get('history') == [1, 2]
+        assert source.get('info') == {'a': 1}
+        assert source.get('input') == 'hi'
+
+        # Local references are private copies, later source changes are not visible
+        fork.get('big', inherit=False)['blob'] = 'y'
+        assert source.get('big.blob') == 'x' * 100
+        parent.set('info.c', 3)
+        source.delete('input')
+        assert fork.get('info') == {'a': 1, 'b': 2}
+        assert fork.get('input') == 'changed'
+
 
 class TestRuntimeDataSerialization:
     """Test serialization methods"""
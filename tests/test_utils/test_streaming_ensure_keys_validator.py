@@ -0,0 +1,53 @@
+from agently.utils import StreamingEnsureKeysValidator
+
+
+def feed_all(validator: StreamingEnsureKeysValidator, text: str, size: int = 3):
+    for index in range(0, len(text), size):
+        violation = validator.feed(text[index : index + size])
+        if violation is not None:
+            return violation, index + size
+    return None, len(text)
+
+
+def test_reports_completed_field_missing_required_child():
+    schema = {"info": {"summary": (str,), "reply": (str,)}, "details": (str,)}
+    validator = StreamingEnsureKeysValidator(["info.reply"], output_schema=schema)
+    text = 'Sure:\n```json\n{"info": {"summary": "ok"}, "details": "' + "x" * 100 + '"}\n```'
+
+    violation, position = feed_all(validator, text)
+
+    assert violation is not None and "info.reply" in violation
+    assert position < text.index("xxx") + 3
+    assert validator.streamed_chars == position
+
+
+def test_valid_answers_and_list_items_pass():
+    schema = {"items": [{"name": (str,), "score": (int,)}]}
+    validator = StreamingEnsureKeysValidator(["items[*].score"], output_schema=schema)
+    assert feed_all(validator, '{"items": [{"name": "a", "score": 1}, {"name": "b", "score": 2}]}')[0] is None
+
+    validator = StreamingEnsureKeysValidator(["items[*].score"], output_schema=schema)
+    violation, _ = feed_all(validator, '{"items": [{"name": "a", "score": 1}, {"name": "b"}, {"name": "c", "score": 3}]}')
+    assert violation is not None and "items[*].score" in violation
+
+    slash_validator = StreamingEnsureKeysValidator(["/items/*/score"], key_style="slash", output_schema=schema)
+    assert feed_all(slash_validator, '{"items": [{"name": "a"}]}')[0] is not None
+
+
+def test_blocks_that_do_not_match_the_output_schema_are_ignored():
+    schema = {"info": {"reply": (str,)}}
+    validator = StreamingEnsureKeysValidator(["info.reply"], output_schema=schema)
+    assert feed_all(validator, 'Example: {"other": {"x": 1}} then {"info": {"reply": "ok"}}')[0] is None
+
+
+def test_strict_schema_checks_root_type_and_key_order():
+    schema = {"summary": (str,), "reply": (str,), "extra": (str,)}
+    assert StreamingEnsureKeysValidator(["reply"], output_schema=schema, strict_schema=True).feed("[1, 2]") is not None
+    assert StreamingEnsureKeysValidator(["reply"], output_schema=schema).feed("[1, 2]") is None
+
+    validator = StreamingEnsureKeysValidator(["reply"], output_schema=schema, strict_schema=True)
+    violation, _ = feed_all(validator, '{"summary": "a", "extra": "b", "reply": "c"}')
+    assert violation is not None and "'extra'" in violation
+
+    relaxed = StreamingEnsureKeysValidator(["reply"], output_schema=schema)
+    assert feed_all(relaxed, '{"summary": "a", "extra": "b", "reply": "c"}')[0] is None
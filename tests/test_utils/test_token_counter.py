@@ -0,0 +1,40 @@
+import pytest
+
+from agently.types.data import ChatMessage
+from agently.utils import ByteLengthTokenCounter, TokenCounter
+
+
+class WordTokenCounter(TokenCounter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.calls = 0
+
+    def _count(self, text: str) -> int:
+        self.calls += 1
+        return len(text.split())
+
+
+def test_token_counts_are_cached_by_content_with_lru_eviction():
+    counter = WordTokenCounter(cache_size=2, message_overhead=3)
+
+    assert counter.count("one two three") == 3
+    assert counter.count("one two three") == 3
+    assert counter.calls == 1
+    assert counter.count_message(ChatMessage(role="user", content="one two three")) == 6
+    assert counter.calls == 1
+
+    counter.count("a")
+    counter.count("b")
+    counter.count("one two three")
+    assert counter.calls == 4
+    assert counter.get_cache_stats() == {"size": 2, "max_size": 2, "hits": 2, "misses": 4}
+
+
+def test_keep_tail_fits_the_token_budget():
+    assert WordTokenCounter().keep_tail("one two three four", 2) == " three four"
+    assert ByteLengthTokenCounter(bytes_per_token=1).keep_tail("abcdef", 4) == "cdef"
+    assert ByteLengthTokenCounter(bytes_per_token=1).keep_tail("你好吗", 4) == "吗"
+    with pytest.raises(ValueError):
+        TokenCounter.from_name("unknown")
+    with pytest.raises(TypeError):
+        TokenCounter()  # type: ignore[abstract]